@@ -8,9 +8,11 @@ Low-level matplotlib-specific functionality for which no better home exists.
 '''
 
 # ....................{ IMPORTS                            }....................
+import numpy as np
 from betse.util.io.error.errwarning import ignoring_warnings
-from beartype.typing import ContextManager
+from beartype.typing import ContextManager, Iterable
 from matplotlib import MatplotlibDeprecationWarning
+from matplotlib.tri import Triangulation
 
 # ....................{ WARNINGS                           }....................
 def ignoring_deprecations_mpl() -> ContextManager:
@@ -26,3 +28,56 @@ def ignoring_deprecations_mpl() -> ContextManager:
     '''
 
     return ignoring_warnings(MatplotlibDeprecationWarning)
+
+# ....................{ TRIANGULATIONS                     }....................
+def triangulate_polygons(polygons: Iterable) -> Triangulation:
+    '''
+    Single triangulation of all passed polygons, each triangulated in isolation
+    as the Delaunay triangulation of the vertices of that polygon.
+
+    The vertices of this triangulation are the vertices of all these polygons
+    concatenated in order. Since vertices shared between adjacent polygons are
+    *not* merged, data Gouraud-shaded onto this triangulation (e.g., by
+    :func:`matplotlib.pyplot.tripcolor`) is *not* interpolated across polygon
+    boundaries. Shading this triangulation as a single
+    :class:`matplotlib.collections.TriMesh` is thus equivalent to (but
+    considerably faster than) shading each polygon as a distinct such mesh.
+
+    Parameters
+    -----------
+    polygons : Iterable
+        Iterable of two-dimensional arrays of the X and Y coordinates of the
+        vertices of each polygon, whose first dimension indexes these
+        vertices.
+
+    Returns
+    -----------
+    Triangulation
+        Triangulation of all these polygons.
+    '''
+
+    # Lists of the X and Y coordinates of the vertices of each polygon and of
+    # the triangles of each polygon.
+    polygons_x = []
+    polygons_y = []
+    triangles = []
+
+    # Number of vertices of all prior polygons, offsetting the vertex indices
+    # of the triangles of the current polygon.
+    verts_num = 0
+
+    for polygon in polygons:
+        polygon_x = polygon[:, 0]
+        polygon_y = polygon[:, 1]
+        polygons_x.append(polygon_x)
+        polygons_y.append(polygon_y)
+        triangles.append(
+            Triangulation(polygon_x, polygon_y).triangles + verts_num)
+        verts_num += len(polygon_x)
+
+    # Return a triangulation of all these triangles.
+    return Triangulation(
+        np.concatenate(polygons_x),
+        np.concatenate(polygons_y),
+        np.concatenate(triangles),
+    )
@@ -81,14 +81,11 @@ def get_subarray_indices(
         superarray_sorted_indices,
         superarray_sorted_subarray_indices,
         mode="clip")
-    superarray_subarray_mask = (
-        superarray[superarray_sorted_subarray_extant_indices] != subarray)
-    superarray_subarray_mask_indices = np.ma.array(
-        superarray_sorted_subarray_extant_indices,
-        mask=superarray_subarray_mask)
-
-    # Return a non-masked rather than masked array for generality.
-    return superarray_subarray_mask_indices.data
+
+    # Return a non-masked rather than masked array for generality. Since the
+    # data underlying a masked array is simply the array it wraps, avoid
+    # allocating both a mask and masked array only to discard them here.
+    return superarray_sorted_subarray_extant_indices
 
 # ....................{ CONVERTERS ~ iterable              }....................
 @type_check
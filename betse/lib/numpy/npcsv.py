@@ -21,6 +21,20 @@ from betse.util.io.log import logs
 from betse.util.path import dirs
 from betse.util.type import types
 
+# ....................{ CONSTANTS                         }....................
+_ROWS_PER_WRITE = 1024
+'''
+Maximum number of rows formatted and written at a time by the
+:func:`write_csv` function.
+'''
+
+
+_WRITE_BUFFER_SIZE = 1 << 20
+'''
+Size in bytes of the write buffer of each file written by the
+:func:`write_csv` function.
+'''
+
 # ....................{ WRITERS                           }....................
 #FIXME: Donate this function back to Numpy as a new np.savecsv() function
 #paralleling the existing np.savetxt() function.
@@ -73,8 +87,7 @@ def write_csv(
         * Each key of this dictionary is a **format string** (i.e.,
           ``%``-prefixed format string as fully documented by the "list of
           specifiers, one per column" subsection for the ``fmt`` parameter
-          accepted by the low-level :func:`numpy.savetxt` function wrapped by
-          this high-level writer function).
+          accepted by the low-level :func:`numpy.savetxt` function).
 
         This dictionary *must* have the exact same keys as the
         ``column_name_to_values`` dictionary.  Defaults to ``None``, in which
@@ -103,9 +116,9 @@ def write_csv(
     # Log this serialization.
     logs.log_debug('Writing CSV file: %s', filename)
 
-    # Tuple of all format strings to be passed to the numpy.savetxt() function
-    # below (in column order), defaulting to the same format string as accepted
-    # by that function for simplicity.
+    # Tuple of all format strings formatting each column below (in column
+    # order), defaulting to the same format string as accepted by the
+    # numpy.savetxt() function for simplicity.
     columns_format = '%.18e'
 
     # If passed a dictionary of format strings...
@@ -222,16 +235,30 @@ def write_csv(
     # NumPy developers yet again chose poorly. *STOP BREAKING EVERYTHING.*
     rows_values = np.column_stack(columns_values)
 
-    # Serialize these sequences to this file in CSV format.
-    np.savetxt(
-        fname=filename,
-        X=rows_values,
-        fmt=columns_format,
-        header=columns_name,
-        delimiter=',',
-
-        # Prevent Numpy from prefixing the above header by "# ". Most popular
-        # software importing CSV files implicitly supports a comma-delimited
-        # first line listing all column names.
-        comments='',
-    )
+    # Number of rows and columns of this data.
+    rows_len, columns_len = rows_values.shape
+
+    # Format string formatting one row of this data, terminated by a newline.
+    # If passed no format strings, format all columns with the default.
+    if isinstance(columns_format, str):
+        columns_format = (columns_format,) * columns_len
+    row_format = ','.join(columns_format) + '\n'
+
+    # Serialize these sequences to this file in CSV format. Since formatting
+    # and writing rows one at a time (as np.savetxt() does) is dominated by
+    # per-row Python overhead, format and write blocks of rows at a time
+    # instead through a large write buffer. Note that:
+    #
+    # * This header is *NOT* prefixed by "# ", as most popular software
+    #   importing CSV files implicitly supports a comma-delimited first line
+    #   listing column names.
+    # * This file is encoded with the platform-specific default encoding, as
+    #   np.savetxt() does when passed a filename. Explicitly encoding with
+    #   "latin1" would both mangle and fail to encode non-ASCII column names.
+    with open(filename, 'w', buffering=_WRITE_BUFFER_SIZE) as csv_file:
+        csv_file.write(columns_name + '\n')
+
+        for row_start in range(0, rows_len, _ROWS_PER_WRITE):
+            rows_chunk = rows_values[row_start:row_start + _ROWS_PER_WRITE]
+            csv_file.write(
+                (row_format * len(rows_chunk)) % tuple(rows_chunk.ravel()))
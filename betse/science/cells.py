@@ -27,6 +27,20 @@ from betse.lib.numpy import nparray
 from betse.util.type.text import regexes
 # from betse.science.tissue.picker.tispickimage import TissuePickerImage
 from betse.science.math.mesh import DECMesh
+from weakref import WeakKeyDictionary
+
+# ....................{ GLOBALS                           }....................
+_CELLS_TREES = WeakKeyDictionary()
+'''
+Dictionary weakly mapping from each cell cluster passed to the
+:meth:`Cells._get_points_tree` getter to a dictionary mapping from the name of
+each array attribute of that cluster (e.g., ``mem_mids_flat``) to a 2-tuple
+``(points, tree)`` of that array and the k-d tree previously built over it.
+
+Since multiple phases of world creation search the same points, building each
+such tree once avoids redundant construction. Since cell clusters are pickled,
+these trees are cached here rather than on the cluster itself.
+'''
 
 # ....................{ CLASSES                           }....................
 #FIXME: Create a new option for seed points: Fibonacci radial-spiral array.
@@ -69,10 +83,10 @@ class Cells(object):
 
            #. First item is the X coordinate of the current cell center.
            #. Second item is the Y coordinate of the current cell center.
-    cell_i : list
-        One-dimensional list indexing each cell such that each item is that
-        cell's index (i.e., ``[0, 1, ..., n-2, n-1]`` for the number of cells
-        ``n``), required for efficient Numpy slicing.
+    cell_i : ndarray
+        One-dimensional Numpy array indexing each cell such that each item is
+        that cell's index (i.e., ``[0, 1, ..., n-2, n-1]`` for the number of
+        cells ``n``), required for efficient Numpy slicing.
     cell_verts : ndarray
         Three-dimensional Numpy array of the coordinates of the vertices of all
         cells, whose:
@@ -119,9 +133,9 @@ class Cells(object):
           membrane.
         * ``mem_to_cells[-1]`` is the index of the cell containing the last
           membrane.
-    mem_i : list
-        One-dimensional list of length the number of cell membranes such that
-        each item is that cell membrane's index (i.e.,
+    mem_i : ndarray
+        One-dimensional Numpy array of length the number of cell membranes such
+        that each item is that cell membrane's index (i.e.,
         ``[0, 1, ..., m-2, m-1]`` for the number of cell membranes ``m``),
         required for efficient Numpy slicing.
     mem_mids_flat : ndarray
@@ -300,8 +314,9 @@ class Cells(object):
         X and Y dimensions.
     grid_obj : fd.FiniteDiffSolver
         Finite difference solver defining the extracellular grid.
-    index_k : list
-        List of the indices of all extracellular grid spaces, equivalent to
+    index_k : ndarray
+        One-dimensional Numpy array of the indices of all extracellular grid
+        spaces, equivalent to
         ``[0, 1, ..., len(self.xypts)-2, len(self.xypts)-1]``.
     map_ij2k : ndarray
         See the :attr:`fd.FiniteDiffSolver.map_ij2k_cents` array for further
@@ -521,8 +536,6 @@ class Cells(object):
         self.M_sum_mem_to_ecm = None   # used for deformation
         self.gradMem = None  # used for electroosmosis
 
-        # Coerce this to an array for advanced indexing and assignments.
-        self.cell_i = np.asarray(self.cell_i)
         self.gj_default_weights = np.ones(len(self.mem_i))
 
     # ..................{ DEFORMERS                         }..................
@@ -535,146 +548,24 @@ class Cells(object):
         deformation routine.
         '''
 
-        # begin by creating new cell centres from the passed Voronoi patch vertices:
-
-        self.cell_centres = np.array([0,0])
-
-        for poly in ecm_verts:
-            aa = np.asarray(poly)
-            aa = np.mean(aa,axis=0)
-            self.cell_centres = np.vstack((self.cell_centres,aa))
-
-        self.cell_centres = np.delete(self.cell_centres, 0, 0)
+        # begin by creating new cell centres from the passed Voronoi patch
+        # vertices, computing the centroids of all patches in one pass:
+        _, self.cell_centres = self.mesh.polys_area_centroid(ecm_verts)
 
         #---------------------------------------------------
 
-        #FIXME: Uh oh! We're in Don't Repeat Yourself (DRY) trouble here. All
-        #or most of the following code appears to be duplicated verbatim from
-        #the cellVerts() method. Since this code is non-trivial and hence
-        #fragile, this is bad... Would it be feasible to simply call
-        #cellVerts() here? If not, how can we unify this logic? Max axolotl!
-
         # calculate basic properties such as volume, surface area, normals, etc for the cell array
-        self.cell_verts = []
-
-        for centre, poly in zip(self.cell_centres, ecm_verts):
-            pt_scale = []
-            for vert in poly:
-                pt_zero = vert - centre
-                pt_scale.append(p.scale_cell * pt_zero + centre)
-            self.cell_verts.append(np.asarray(pt_scale))
-
-        self.cell_verts = np.asarray(self.cell_verts)
-
-        mem_edges = []  # storage for membrane edge points
-        mem_length = []  # storage for membrane surface area values
-        mem_mids = []  # storage for membrane midpoints
-
-        # storage for various vector properties of membrane
-        cv_x = []
-        cv_y = []
-        cv_nx = []
-        cv_ny = []
-        cv_tx = []
-        cv_ty = []
-
-        for polyc in self.cell_verts:
-
-            #FIXME: Wouldn't the "mps" list of membrane midpoints be more
-            #efficiently calculatable via a single
-            #"mps = np.mean(mps, axis=0)" assignment rather than iteratively
-            #constructed via looping?
-
-            # Calculate individual membrane domains, midpoints, and vectors:
-            edge = []
-            mps = []
-            surfa = []
-
-            for i in range(0, len(polyc)):
-                pt1 = polyc[i - 1]
-                pt2 = polyc[i]
-                pt1 = np.asarray(pt1)
-                pt2 = np.asarray(pt2)
-                edge.append([pt1, pt2])
-                mid = (pt1 + pt2) / 2  # midpoint calculation
-                mps.append(mid.tolist())
-
-                lgth = np.sqrt((pt2[0] - pt1[0]) ** 2 + (pt2[1] - pt1[1]) ** 2)  # length of membrane domain
-
-                # sa = lgth * p.cell_height  # surface area of membrane
-                surfa.append(lgth)
-
-                tang_a = pt2 - pt1  # tangent
-                tang = tang_a / np.linalg.norm(tang_a)
-                # normal = np.array([-tang[1],tang[0]])
-                normal = np.array([tang[1], -tang[0]])
-                cv_x.append(mid[0])
-                cv_y.append(mid[1])
-                cv_nx.append(normal[0])
-                cv_ny.append(normal[1])
-                cv_tx.append(tang[0])
-                cv_ty.append(tang[1])
-
-            mem_edges.append(edge)
-            mem_mids.append(mps)
-            mem_length.append(surfa)
-
-        self.mem_vects_flat = np.array([cv_x, cv_y, cv_nx, cv_ny, cv_tx, cv_ty]).T
-
-        # ---post processing and calculating peripheral structures-----------------------------------------------------
-
-        self.mem_mids_flat, indmap_mem, _ = tb.flatten(mem_mids)
-        self.mem_mids_flat = np.asarray(self.mem_mids_flat)  # convert the data structure to an array
-
-        # Finish up by creating indices vectors and converting to Numpy arrays
-        # where needed:
-        self.cell_i = [x for x in range(0, len(self.cell_centres))]
-        self.mem_i =  [x for x in range(0, len(self.mem_mids_flat))]
-
-        # convert mem_length into a flat vector
-        mem_length, _, _ = tb.flatten(mem_length)
-        mem_length = np.asarray(mem_length)
-
-        self.mem_sa = mem_length * p.cell_height
-
-        self.mem_edges_flat, _, _ = tb.flatten(mem_edges)
-        self.mem_edges_flat = np.asarray(self.mem_edges_flat)
-
-        # create a flattened version of cell_verts that will serve as membrane verts:
-        self.mem_verts, _, _ = tb.flatten(self.cell_verts)
-        self.mem_verts = np.asarray(self.mem_verts)
-
-        # structures for plotting interpolated data and streamlines:
-        self.plot_xy = np.vstack((self.mem_mids_flat, self.mem_verts))
-
-        # cell surface area:
-        self.cell_sa = []
-        for grp in self.cell_to_mems:
-            cell_sa = sum(self.mem_sa[grp])
-            self.cell_sa.append(cell_sa)
-
-        self.cell_sa = np.asarray(self.cell_sa)
+        self._calc_mem_geometry(p, ecm_verts)
 
         #------------------------------------------------------
-        # next obtain the set of *unique* vertex points from the total ecm_verts arrangement:
-        ecm_verts_flat,_,_ = tb.flatten(ecm_verts)
-
-        ecm_verts_set = set()
-
-        for vert in ecm_verts_flat:
-            ptx = vert[0]
-            pty = vert[1]
-            ecm_verts_set.add((ptx,pty))
-
-        ecm_verts_unique = [list(verts) for verts in list(ecm_verts_set)]
-
-        ecm_verts_unique = np.asarray(ecm_verts_unique)  # convert to numpy array
+        # next obtain the extent of the total ecm_verts arrangement. Since
+        # duplicate vertices cannot change this extent, the flattened vertices
+        # are used as is rather than first being reduced to a unique set:
+        ecm_verts_flat,_,_ = tb.flatten_nd(ecm_verts)
 
         # redo world boundaries used in plotting, if necessary:
-        xmin = np.min(ecm_verts_unique[:,0])
-        xmax = np.max(ecm_verts_unique[:,0])
-        ymin = np.min(ecm_verts_unique[:,1])
-        ymax = np.max(ecm_verts_unique[:,1])
+        xmin, ymin = ecm_verts_flat.min(axis=0)
+        xmax, ymax = ecm_verts_flat.max(axis=0)
 
         if xmin < self.xmin:
             self.xmin = xmin
@@ -727,9 +618,10 @@ class Cells(object):
             # next define a 2d array of lattice points using the x- and y- vectors
             x_2d, y_2d = np.meshgrid(x_v, y_v)  # create 2D array of lattice points
 
-            # now create a matrix of points that will add a +/- deviation to each point centre
-            x_rnd = p.cell_lattice_disorder * p.d_cell * (np.random.rand(p.ny, p.nx) - 0.5)  # create a mix of random deltas x dir
-            y_rnd = p.cell_lattice_disorder * p.d_cell * (np.random.rand(p.ny, p.nx) - 0.5)  # create a mix of random deltas x dir
+            # now create a matrix of points that will add a +/- deviation to each point centre,
+            # drawing the random deltas in both the x and y directions at once
+            x_rnd, y_rnd = p.cell_lattice_disorder * p.d_cell * (
+                np.random.random((2, p.ny, p.nx)) - 0.5)
 
             # Add the noise effect to the world point matrices.
             x_2d = x_2d + x_rnd
@@ -791,8 +683,8 @@ class Cells(object):
             y_2d = np.hstack((y_2d_blue.ravel(), y_2d_red.ravel()))
 
             # now create a matrix of points that will add a +/- deviation to each point centre
-            x_rnd = p.cell_lattice_disorder * p.d_cell * (np.random.rand(len(x_2d)) - 0.5)  # create a mix of random deltas x dir
-            y_rnd = p.cell_lattice_disorder * p.d_cell * (np.random.rand(len(y_2d)) - 0.5)  # create a mix of random deltas x dir
+            x_rnd, y_rnd = p.cell_lattice_disorder * p.d_cell * (
+                np.random.random((2, len(x_2d))) - 0.5)  # create a mix of random deltas x and y dirs
 
             # # add the noise effect to the world point matrices and redefine the results
             x_2d = x_2d + x_rnd
@@ -809,11 +701,10 @@ class Cells(object):
         # Define a data structure that holds [x,y] coordinate points of each 2d
         # grid-matrix entry.
 
-        # define geometric limits and centre for the cluster of points
-        self.xmin = np.min(xypts[:,0])
-        self.xmax = np.max(xypts[:,0])
-        self.ymin = np.min(xypts[:,1])
-        self.ymax = np.max(xypts[:,1])
+        # define geometric limits and centre for the cluster of points, reducing
+        # both columns of these points at once rather than each separately
+        self.xmin, self.ymin = xypts.min(axis=0)
+        self.xmax, self.ymax = xypts.max(axis=0)
 
         bbox = np.asarray(
             [[self.xmin, self.ymin],
@@ -1004,274 +895,167 @@ class Cells(object):
         self.gj_len = p.cell_space      # distance between gap junction (as "pipe length")
 
         # calculate basic properties such as volume, surface area, normals, etc for the cell array
-        self.cell_verts = []
-
-        for centre,poly in zip(self.cell_centres,self.ecm_verts):
-            pt_scale = []
-            for vert in poly:
-                pt_zero = vert - centre
-                pt_scale.append(p.scale_cell*pt_zero + centre)
-            self.cell_verts.append(np.asarray(pt_scale))
-
-        self.cell_verts = np.asarray(self.cell_verts, dtype=object)
+        verts_offset, vert_to_cell = self._calc_mem_geometry(p, self.ecm_verts)
 
-        # self.cell_vol = []   # storage for cell volumes
-        self.cell_sa = []    # whole cell surface areas
-        self.cell_area = []
+        self.mem_mids = np.asarray(
+            [cell_mids.tolist()
+             for cell_mids in np.split(self.mem_mids_flat, verts_offset[1:-1])],
+            dtype=object)
 
-        mem_edges = []  # storage for membrane edge points
-        mem_length = []   # storage for membrane surface area values
-        mem_mids = []   # storage for membrane midpoints
-
-        # storage for various vector properties of membrane
-        cv_x=[]
-        cv_y=[]
-        cv_nx=[]
-        cv_ny=[]
-        cv_tx=[]
-        cv_ty=[]
-
-        for polyc in self.cell_verts:
-            # # First calculate individual cell volumes from cell vertices:
-            # poly = [x for x in reversed(polyc)]
-            # self.cell_vol.append(p.cell_height*tb.area(poly))
-
-            # Next calculate individual membrane domains, midpoints, and vectors:
-            edge = []
-            mps = []
-            surfa = []
-
-            for i in range(0,len(polyc)):
-                pt1 = polyc[i-1]
-                pt2 = polyc[i]
-                pt1 = np.asarray(pt1)
-                pt2 = np.asarray(pt2)
-                edge.append([pt1,pt2])
-                mid = (pt1 + pt2)/2       # midpoint calculation
-                mps.append(mid.tolist())
-
-                lgth = np.sqrt((pt2[0] - pt1[0])**2 + (pt2[1]-pt1[1])**2)  # length of membrane domain
-                # sa = lgth*p.cell_height    # surface area of membrane
-                surfa.append(lgth)
-
-                tang_a = pt2 - pt1       # tangent
-                tang = tang_a/np.linalg.norm(tang_a)
-                # normal = np.array([-tang[1],tang[0]])
-                normal = np.array([tang[1],-tang[0]])
-                cv_x.append(mid[0])
-                cv_y.append(mid[1])
-                cv_nx.append(normal[0])
-                cv_ny.append(normal[1])
-                cv_tx.append(tang[0])
-                cv_ty.append(tang[1])
-
-            mem_edges.append(edge)
-            mem_mids.append(mps)
-            mem_length.append(surfa)
+        # define map allowing a dispatch from cell index to each respective membrane -------------------------------
+        #Indexing by "[self.mem_i]" is superfluous here. Lively jumping snakes!
+        self.mem_to_cells = vert_to_cell   # gives cell index for each mem_i index placeholder
 
-        #FIXME: For readability, it would be great if we could extract the
-        #last four columns of this array into two new arrays with
-        #human-readable names resembling the "mem_mids_flat" array: e.g.,
-        #
-        #* "self.mem_norms_flat", providing the normal membrane unit vectors.
-        #* "self.mem_tangs_flat", providing the tangent membrane unit vectors.
+        # construct a mapping giving membrane index for each cell_i------------------------------------------------
         #
-        #Currently, we reference these columns with non-human-readable magic
-        #numbers like "self.mem_vects_flat[:,3]", which is fairly hard to
-        #mentally parse when perusing the code. Calm qualms in an oceanic quay!
-        #FIXME: The first two columns of this array are exact duplicates of the
-        #first (and only) two columns of the "mem_mids_flat" array, defined
-        #below. Since the "mem_mids_flat" array is more human-readable than
-        #this array, that array should probably be preferred everywhere for
-        #obtaining the coordinates of membrane midpoints, in which case the
-        #first two columns of this array (i.e., "cv_x" and "cv_y") should
-        #probably be removed entirely from this array. Idle Ides of March!
-        self.mem_vects_flat = np.array([cv_x,cv_y,cv_nx,cv_ny,cv_tx,cv_ty]).T
+        # Rather than scanning all membranes once per cell, stably sort all
+        # membrane indices by cell index once and slice this sorted array at
+        # the offsets of each cell. Since this sort is stable, the indices of
+        # the membranes of each cell remain in ascending order.
+        mems_order = np.argsort(self.mem_to_cells, kind='stable')
+        mems_offset = np.searchsorted(
+            self.mem_to_cells[mems_order], np.arange(len(self.cell_i) + 1))
+        self.cell_to_mems = [
+            mems_order[mems_offset[cell_index]:mems_offset[cell_index + 1]]
+            for cell_index in self.cell_i
+        ]
 
-        #---post processing and calculating peripheral structures-----------------------------------------------------
+        self.cell_to_mems = np.asarray(self.cell_to_mems, dtype=object)
 
-        self.mem_mids = np.asarray(mem_mids, dtype=object)
+        #----------------------------------------------------------------------
+        # Construct an array indexing vertices of the membrane vertices array.
+        cellVertTree = cKDTree(self.mem_verts)
 
-        self.mem_mids_flat, indmap_mem, _ = tb.flatten(mem_mids)
-        self.mem_mids_flat = np.asarray(self.mem_mids_flat)  # convert the data structure to an array
+        _, pt_ind1 = cellVertTree.query(self.mem_edges_flat[:,0], workers=-1)
+        _, pt_ind2 = cellVertTree.query(self.mem_edges_flat[:,1], workers=-1)
+        self.index_to_mem_verts = np.column_stack((pt_ind1, pt_ind2))
 
-        #FIXME: This logic has been duplicated in both deformWorld() and
-        #quickVerts() methods, which... isn't the best. Consider centralizing
-        #these duplicated variable assignments into a common private method.
+        # create radial vectors for each cell, defined from their centre to each membrane midpoint
+        self.rads = self.mem_mids_flat - self.cell_centres[self.mem_to_cells]
 
-        # Finish up by creating indices vectors and converting to Numpy arrays where needed:
-        self.cell_i = [x for x in range(0,len(self.cell_centres))]
-        self.mem_i  = [x for x in range(0,len(self.mem_mids_flat))]
+        # magnitude (R) and unit vectors (n) of rads:
+        self.R_rads = np.hypot(self.rads[:,0], self.rads[:,1])
+        self.nx_rads = self.rads[:,0]/self.R_rads
+        self.ny_rads = self.rads[:,1]/self.R_rads
 
-        # convert mem_length into a flat vector
-        mem_length,_,_ = tb.flatten(mem_length)
-        mem_length = np.asarray(mem_length)
+    def quickVerts(self, p):
 
-        self.mem_sa = mem_length*p.cell_height
+        self._calc_mem_geometry(p, self.ecm_verts)
 
-        self.mem_edges_flat, _, _ = tb.flatten(mem_edges)
-        self.mem_edges_flat = np.asarray(self.mem_edges_flat)
+    def _calc_mem_geometry(self, p, ecm_verts) -> tuple:
+        '''
+        Calculate the vertices of each cell by scaling in the passed Voronoi
+        patch vertices about the current cell centres and all membrane
+        properties derived from these vertices (e.g., midpoints, edges,
+        normal and tangent unit vectors, surface areas).
 
-        # create a flattened version of cell_verts that will serve as membrane verts:
-        self.mem_verts,_,_ = tb.flatten(self.cell_verts)
-        self.mem_verts = np.asarray(self.mem_verts)
+        Parameters
+        ----------
+        p : betse.science.parameters.Parameters
+            Current simulation configuration.
+        ecm_verts : SequenceTypes
+            Ragged sequence of the counterclockwise vertices of each Voronoi
+            patch, such that ``ecm_verts[i]`` are those of the ``i``-th cell.
 
-        # structures for plotting interpolated data and streamlines:
-        self.plot_xy = np.vstack((self.mem_mids_flat,self.mem_verts))
+        Returns
+        -------
+        (ndarray, ndarray)
+            2-tuple ``(verts_offset, vert_to_cell)``, where ``verts_offset``
+            is the CSR-style offsets of the first membrane of each cell
+            suffixed by the total number of membranes and ``vert_to_cell`` is
+            the cell index of each membrane.
+        '''
 
-        # define map allowing a dispatch from cell index to each respective membrane -------------------------------
-        indmap_mem = np.asarray(indmap_mem)
+        # Rather than iterating over the ragged list of the vertices of each
+        # cell, concatenate these vertices into a single flat array indexed by
+        # CSR-style offsets and compute all membrane properties in one pass.
+        # Since membranes are ordered by cell and then by vertex, each membrane
+        # index is the index of its second vertex in this flat array.
+        verts_count = np.array([len(poly) for poly in ecm_verts])
+        verts_offset = np.zeros(len(verts_count) + 1, dtype=int)
+        np.cumsum(verts_count, out=verts_offset[1:])
 
-        #Indexing by "[self.mem_i]" is superfluous here. Lively jumping snakes!
-        self.mem_to_cells = indmap_mem[:,0]   # gives cell index for each mem_i index placeholder
+        # Cell index and vertex index local to that cell of each vertex.
+        vert_to_cell = np.repeat(np.arange(len(verts_count)), verts_count)
+        vert_local_i = np.arange(verts_offset[-1]) - verts_offset[vert_to_cell]
 
-        # construct a mapping giving membrane index for each cell_i------------------------------------------------
-        self.cell_to_mems = []
+        verts_centre = self.cell_centres[vert_to_cell]
+        verts_flat = np.concatenate(
+            [np.asarray(poly, dtype=float) for poly in ecm_verts])
+        verts_flat = p.scale_cell*(verts_flat - verts_centre) + verts_centre
 
-        for cell_index in self.cell_i:
-            # One-dimensional Numpy array of the indices of all membranes of
-            # the current cell. Note that:
-            #
-            # * "self.mem_to_cells == cell_index" is a Numpy boolean array.
-            # * ndarray.nonzero() returns an n-tuple of the indices of all items
-            #   of this boolean array evaluating to True, where "n" is the
-            #   number of dimensions of the "mem_to_cells" array. Since this
-            #   array is one-dimensional, this is guaranteed to be a 1-tuple
-            #   whose first item providing this array is indexed at "[0]".
-            #
-            # It is confusing. It is Numpy.
-            mems_index = (self.mem_to_cells == cell_index).nonzero()[0]
-            self.cell_to_mems.append(mems_index)
+        self.cell_verts = np.asarray(
+            np.split(verts_flat, verts_offset[1:-1]), dtype=object)
 
-        self.cell_to_mems = np.asarray(self.cell_to_mems, dtype=object)
+        # self.cell_vol = []   # storage for cell volumes
+        self.cell_area = []
 
-        #----------------------------------------------------------
-        # cell surface area:
-        self.cell_sa = []
-        for grp in self.cell_to_mems:
-            cell_sa = sum(self.mem_sa[grp])
-            self.cell_sa.append(cell_sa)
+        # Index of the preceding vertex of the same cell for each vertex,
+        # wrapping around to the last vertex of that cell.
+        verts_prev = verts_offset[vert_to_cell] + (
+            (vert_local_i - 1) % verts_count[vert_to_cell])
 
-        self.cell_sa = np.asarray(self.cell_sa)
+        pt1 = verts_flat[verts_prev]
+        pt2 = verts_flat
 
-        #----------------------------------------------------------------------
-        # Construct an array indexing vertices of the membrane vertices array.
-        cellVertTree = cKDTree(self.mem_verts)
+        mids = (pt1 + pt2)/2       # midpoint calculation
 
-        self.index_to_mem_verts = []
-        for cell_nest in mem_edges:
-            for mem_points in cell_nest:
-                _, pt_ind1 = cellVertTree.query(mem_points[0])
-                _, pt_ind2 = cellVertTree.query(mem_points[1])
-                self.index_to_mem_verts.append([pt_ind1, pt_ind2])
-        self.index_to_mem_verts = np.asarray(self.index_to_mem_verts)
+        tang_a = pt2 - pt1       # tangent
 
-        # create radial vectors for each cell, defined from their centre to each membrane midpoint
-        self.rads = self.mem_mids_flat - self.cell_centres[self.mem_to_cells]
+        # length of membrane domain
+        mem_length = np.hypot(tang_a[:,0], tang_a[:,1])
 
-        # magnitude (R) and unit vectors (n) of rads:
-        self.R_rads = np.sqrt(self.rads[:,0]**2 + self.rads[:,1]**2)
-        self.nx_rads = self.rads[:,0]/self.R_rads
-        self.ny_rads = self.rads[:,1]/self.R_rads
+        # unit tangent, scaling by the reciprocal of each length computed once:
+        tang = tang_a*(1.0/mem_length)[:,None]
 
-    def quickVerts(self, p):
+        #FIXME: For readability, it would be great if we could extract the
+        #last four columns of this array into two new arrays with
+        #human-readable names resembling the "mem_mids_flat" array: e.g.,
+        #
+        #* "self.mem_norms_flat", providing the normal membrane unit vectors.
+        #* "self.mem_tangs_flat", providing the tangent membrane unit vectors.
+        #
+        #Currently, we reference these columns with non-human-readable magic
+        #numbers like "self.mem_vects_flat[:,3]", which is fairly hard to
+        #mentally parse when perusing the code. Calm qualms in an oceanic quay!
+        #FIXME: The first two columns of this array are exact duplicates of the
+        #first (and only) two columns of the "mem_mids_flat" array, defined
+        #below. Since the "mem_mids_flat" array is more human-readable than
+        #this array, that array should probably be preferred everywhere for
+        #obtaining the coordinates of membrane midpoints, in which case the
+        #first two columns of this array (i.e., "cv_x" and "cv_y") should
+        #probably be removed entirely from this array. Idle Ides of March!
 
-        # calculate basic properties such as volume, surface area, normals, etc for the cell array
-        self.cell_verts = []
-
-        for centre,poly in zip(self.cell_centres,self.ecm_verts):
-            pt_scale = []
-            for vert in poly:
-                pt_zero = vert - centre
-                pt_scale.append(p.scale_cell*pt_zero + centre)
-            self.cell_verts.append(np.asarray(pt_scale))
-
-        self.cell_verts = np.asarray(self.cell_verts)
-
-        mem_edges = []  # storage for membrane edge points
-        mem_length = []   # storage for membrane surface area values
-        mem_mids = []   # storage for membrane midpoints
-
-        # storage for various vector properties of membrane
-        cv_x=[]
-        cv_y=[]
-        cv_nx=[]
-        cv_ny=[]
-        cv_tx=[]
-        cv_ty=[]
-
-        for polyc in self.cell_verts:
-            # # First calculate individual cell volumes from cell vertices:
-            # poly = [x for x in reversed(polyc)]
-            # self.cell_vol.append(p.cell_height*tb.area(poly))
-
-            # Next calculate individual membrane domains, midpoints, and vectors:
-            edge = []
-            mps = []
-            surfa = []
-
-            for i in range(0,len(polyc)):
-                pt1 = polyc[i-1]
-                pt2 = polyc[i]
-                pt1 = np.asarray(pt1)
-                pt2 = np.asarray(pt2)
-                edge.append([pt1,pt2])
-                mid = (pt1 + pt2)/2       # midpoint calculation
-                mps.append(mid.tolist())
-
-                lgth = np.sqrt((pt2[0] - pt1[0])**2 + (pt2[1]-pt1[1])**2)  # length of membrane domain
-                # sa = lgth*p.cell_height    # surface area of membrane
-                surfa.append(lgth)
-
-                tang_a = pt2 - pt1       # tangent
-                tang = tang_a/np.linalg.norm(tang_a)
-                # normal = np.array([-tang[1],tang[0]])
-                normal = np.array([tang[1],-tang[0]])
-                cv_x.append(mid[0])
-                cv_y.append(mid[1])
-                cv_nx.append(normal[0])
-                cv_ny.append(normal[1])
-                cv_tx.append(tang[0])
-                cv_ty.append(tang[1])
-
-            mem_edges.append(edge)
-            mem_mids.append(mps)
-            mem_length.append(surfa)
-
-        self.mem_vects_flat = np.array([cv_x,cv_y,cv_nx,cv_ny,cv_tx,cv_ty]).T
+        # Write each column into a preallocated row-major array rather than
+        # transposing a stacked (6, M) array into a column-major view.
+        self.mem_vects_flat = np.empty((len(mids), 6))
+        self.mem_vects_flat[:,0:2] = mids
+        self.mem_vects_flat[:,2] = tang[:,1]
+        self.mem_vects_flat[:,3] = -tang[:,0]
+        self.mem_vects_flat[:,4:6] = tang
 
         #---post processing and calculating peripheral structures-----------------------------------------------------
 
-        self.mem_mids_flat, indmap_mem, _ = tb.flatten(mem_mids)
-        self.mem_mids_flat = np.asarray(self.mem_mids_flat)  # convert the data structure to an array
+        self.mem_mids_flat = mids
 
         # Finish up by creating indices vectors and converting to Numpy arrays where needed:
-        self.cell_i = [x for x in range(0,len(self.cell_centres))]
-        self.mem_i =  [x for x in range(0,len(self.mem_mids_flat))]
-
-        # convert mem_length into a flat vector
-        mem_length,_,_ = tb.flatten(mem_length)
-        mem_length = np.asarray(mem_length)
+        self.cell_i = np.arange(len(self.cell_centres))
+        self.mem_i  = np.arange(len(self.mem_mids_flat))
 
         self.mem_sa = mem_length*p.cell_height
 
-        self.mem_edges_flat, _, _ = tb.flatten(mem_edges)
-        self.mem_edges_flat = np.asarray(self.mem_edges_flat)
+        self.mem_edges_flat = np.stack((pt1, pt2), axis=1)
 
         # create a flattened version of cell_verts that will serve as membrane verts:
-        self.mem_verts,_,_ = tb.flatten(self.cell_verts)
-        self.mem_verts = np.asarray(self.mem_verts)
+        self.mem_verts = verts_flat
 
         # structures for plotting interpolated data and streamlines:
         self.plot_xy = np.vstack((self.mem_mids_flat,self.mem_verts))
 
         # cell surface area:
-        self.cell_sa = []
-        for grp in self.cell_to_mems:
-            cell_sa = sum(self.mem_sa[grp])
-            self.cell_sa.append(cell_sa)
+        self.cell_sa = np.add.reduceat(self.mem_sa, verts_offset[:-1])
 
-        self.cell_sa = np.asarray(self.cell_sa)
+        return verts_offset, vert_to_cell
 
     def cellMatrices(self, p) -> None:
         '''
@@ -1401,27 +1185,38 @@ class Cells(object):
 
         #-- find nearest neighbour cell-cell junctions via adjacent membranes-------------------------------------------
         sc = 3.0*(1-p.scale_cell)*p.cell_radius
-        memTree = cKDTree(self.mem_mids_flat)
-
-        mem_nn_o = memTree.query_ball_point(self.mem_mids_flat, sc)
-        mem_nn = [[] for x in self.mem_i]
-        mem_bound = []
-
-        for i, ind_pair in enumerate(mem_nn_o):
-            if len(ind_pair) == 1:
-                mem_bound.append(i)
-                mem_nn[i].append(i)
-                mem_nn[i].append(i)
-
-            elif len(ind_pair) == 2:
-                mem_nn[i].append(ind_pair[0])
-                mem_nn[i].append(ind_pair[1])
-
+        memTree = self._get_points_tree('mem_mids_flat')
+
+        # Unique pairs of membranes whose midpoints lie within this distance of
+        # one another, as an array of index pairs "[i, j]" such that "i < j",
+        # and the number of such neighbouring membranes of each membrane.
+        mem_pairs = memTree.query_pairs(sc, output_type='ndarray')
+        mem_nn_num = np.bincount(mem_pairs.ravel(), minlength=len(self.mem_i))
+
+        # Membranes with no neighbouring membrane are on the outer boundary and
+        # thus paired with themselves.
+        mem_bound = np.flatnonzero(mem_nn_num == 0)
+        mem_nn = np.column_stack((self.mem_i, self.mem_i))
+
+        # Membranes with exactly one neighbouring membrane are paired with that
+        # membrane, ordered by ascending index.
+        for mem_pair_end in mem_pairs.T:
+            mem_pairs_single = mem_nn_num[mem_pair_end] == 1
+            mem_nn[mem_pair_end[mem_pairs_single]] = mem_pairs[mem_pairs_single]
+
+        # Membranes with multiple neighbouring membranes are disambiguated
+        # below against the full (sorted) set of membranes near each.
+        mems_multi = np.flatnonzero(mem_nn_num > 1)
+        mem_nn_multi = memTree.query_ball_point(
+            self.mem_mids_flat[mems_multi], sc,
+            return_sorted=True, workers=-1)
+
+        for i, ind_pair in zip(mems_multi, mem_nn_multi):
             #FIXME: It'd be great if we could document exactly what and how
             #this algorithm is doing. Are we searching multiple possible
             #neighboring membranes for the nearest neighboring of the current
             #membrane to find the membranes participating in this gap junction?
-            elif len(ind_pair) > 2:
+            if len(ind_pair) > 2:
                 i_n = [self.mem_vects_flat[i,2],self.mem_vects_flat[i,3]]
 
                 for j in ind_pair:
@@ -1429,50 +1224,38 @@ class Cells(object):
                     ia = round(np.dot(i_n,a),1)
 
                     if ia == -1.0:
-                        mem_nn[i] = []
-                        mem_nn[i].append(i)
-                        mem_nn[i].append(j)
+                        mem_nn[i] = [i, j]
 
                     else:  # in rare cases, tag as self instead of leaving a blank spot:
-                        mem_nn[i] =[]
-                        mem_nn[i].append(i)
-                        mem_nn[i].append(i)
+                        mem_nn[i] = [i, i]
 
         #---------------------------------------------------------------------------------------------------------------
 
-        self.mem_nn = np.asarray(mem_nn)
+        self.mem_nn = mem_nn
 
         # Tag membranes and cells on the outer boundary of the cell cluster---------------------------------------------
-        self.bflags_mems = np.asarray(mem_bound)
+        self.bflags_mems = mem_bound
 
          # get the boundary cells associated with these membranes:
-        self.bflags_cells = []
+        self.bflags_cells = self.mem_to_cells[self.bflags_mems]
 
-        for mem_i in self.bflags_mems:
-
-            cell_i = self.mem_to_cells[mem_i]
+        # midpoints of extracellular matrix lattice:
+        # calculate midpoints of each ecm (voronoi cell) segment in one pass
+        # over the concatenated vertices of all cells, pairing each vertex
+        # with the preceding vertex of the same cell:
+        verts_count = np.array([len(verts) for verts in self.ecm_verts])
+        verts_start = np.cumsum(verts_count) - verts_count
+        verts_flat = np.concatenate(
+            [np.asarray(verts, dtype=float) for verts in self.ecm_verts])
 
-            self.bflags_cells.append(cell_i)
+        verts_prev = np.arange(len(verts_flat)) - 1
+        verts_prev[verts_start] += verts_count
 
-        self.bflags_cells = np.asarray(self.bflags_cells)
+        ecm_mids = (verts_flat[verts_prev] + verts_flat)/2  # midpoint calculation
 
-        # midpoints of extracellular matrix lattice:
-        # calculate midpoints of each ecm (voronoi cell) segment:
-        ecm_mids = set()
-
-        for verts in self.ecm_verts:
-            for i in range(0,len(verts)):
-                pt1 = verts[i-1]
-                pt2 = verts[i]
-                pt1 = np.asarray(pt1)
-                pt2 = np.asarray(pt2)
-                mid = (pt1 + pt2)/2       # midpoint calculation
-                mx = mid[0]
-                my = mid[1]
-                ecm_mids.add((mx,my))
-
-        ecm_mids = list(ecm_mids)
-        self.ecm_mids = np.asarray(ecm_mids)
+        # segments shared by adjacent cells share identical midpoints, so only
+        # retain unique midpoints:
+        self.ecm_mids = np.unique(ecm_mids, axis=0)
 
     def near_neigh(self,p):
 
@@ -1532,45 +1315,41 @@ class Cells(object):
         self.nn_i = np.asarray(self.nn_i)
         self.cell_nn_i = np.asarray(self.cell_nn_i)
 
-        # Next find the nearest neighbour set for each cell:
-        self.cell_nn = []
-        for cell_i, mem_i_set in enumerate(self.cell_to_mems):
+        # Next find the nearest neighbour set for each cell. To do so
+        # efficiently, build this set as a compressed sparse row (CSR) layout:
+        # a flat array of the neighbouring cell indices of all cells (ordered
+        # by cell and then by membrane) and the offset of each cell into it.
+        mems_by_cell = np.argsort(self.mem_to_cells, kind='stable')
+        mems_cell = self.mem_to_cells[mems_by_cell]
 
-            cell_neigh_set = []
+        # find the partner to each membrane and that partner's cell...
+        mems_partner = self.nn_i[mems_by_cell]
+        mems_partner_cell = self.mem_to_cells[mems_partner]
 
-            for mem_i in mem_i_set:
-
-                mem_j = self.nn_i[mem_i]  # find the partner to this membrane...
-
-                if mem_j == mem_i:  # if the indices are equal, we're on a neighborless boundary cell
-                    pass
-
-                else:
-
-                    cell_j = self.mem_to_cells[mem_j]
+        # ...ignoring neighborless boundary membranes partnered with
+        # themselves and cross-checking that cells are not the same:
+        mems_neigh = (
+            (mems_partner != mems_by_cell) & (mems_partner_cell != mems_cell))
+        cell_nn_indices = mems_partner_cell[mems_neigh]
 
-                    if cell_i != cell_j:  # cross-check that values are not the same
-                        cell_neigh_set.append(cell_j)
+        # number of nns to each cell and offsets of each cell into this layout:
+        self.num_nn = np.bincount(
+            mems_cell[mems_neigh], minlength=len(self.cell_i))
+        cell_nn_indptr = np.concatenate(([0], np.cumsum(self.num_nn)))
 
-            self.cell_nn.append(cell_neigh_set)
-
-        self.num_nn = []  # initialize a list that will hold number of nns to a cell
-
-        for indices in self.cell_nn:
-            self.num_nn.append(len(indices))
-
-        self.average_nn = (sum(self.num_nn)/len(self.num_nn))
-        self.num_nn = np.asarray(self.num_nn)
-        self.cell_nn = np.asarray(self.cell_nn, dtype=object)
+        self.average_nn = float(cell_nn_indptr[-1]/len(self.num_nn))
+        self.cell_nn = np.asarray(
+            np.split(cell_nn_indices, cell_nn_indptr[1:-1]), dtype=object)
 
         # Nearest neighbours to the boundary cells.
         nn_bound = self.cell_nn[self.bflags_cells]
         nn_bound, _,_ = tb.flatten(nn_bound)
 
-        self.nn_bound = []
-        for ind in nn_bound:  # take out the shared values:
-            if ind not in self.bflags_cells:
-                self.nn_bound.append(ind)
+        # take out the shared values:
+        nn_bound_shared = np.isin(nn_bound, self.bflags_cells)
+        self.nn_bound = [
+            ind for ind, is_shared in zip(nn_bound, nn_bound_shared)
+            if not is_shared]
 
 
     def makeECM(self,p):
@@ -1617,7 +1396,7 @@ class Cells(object):
         self.map_ij2k = self.grid_obj.map_ij2k_cents
 
         # linear k index:
-        self.index_k = [x for x in range(0,len(self.xypts))]
+        self.index_k = np.arange(len(self.xypts))
 
         # FIXME temporary addition of block of sphaghetti code for later use/improvement:
         #--------------------------------------------------------------
@@ -1625,52 +1404,30 @@ class Cells(object):
         # where 'ecm' is different than the environmental grid points defined in self.xypts and corresponds
         # to the shared membrane midpoint between two cells (e.g. a true 'extracellular' matrix point).
 
-        bflags_ecm_o = [] # flags for ecm points at boundaries
-        ecm_points_o = [] # the points, prior to processing
-
-        for i, (mem_i, mem_j) in enumerate(self.mem_nn): # for each membrane mid pair in mem near neighbours...
-
-            xmem = self.mem_mids_flat[:, 0]
-            ymem = self.mem_mids_flat[:, 1]
-
-            xi = (xmem[mem_i] + xmem[mem_j])/2 # average the x and y points
-            yi = (ymem[mem_i] + ymem[mem_j])/2
-
-            ecm_points_o.append([xi, yi]) # append the pair to the points list
-
-            if mem_i == mem_j:         # if membrane indices are equal, they must be a boundary:
-                bflags_ecm_o.append([xi, yi])
-
-        ecm_points_unique = np.unique(ecm_points_o, axis = 0)   # get only the unique points from the above
-        bflags_ecm_unique = np.unique(bflags_ecm_o, axis = 0)
-
-        ecm_list = ecm_points_unique.tolist()     # convert them back to a list
-        bflags_list = bflags_ecm_unique.tolist()
-
-        bflags_ecm = []
+        # for each membrane mid pair in mem near neighbours, average the x and
+        # y points:
+        xmem_mids = (self.mem_mids_flat[self.mem_nn[:,0]]
+                     + self.mem_mids_flat[self.mem_nn[:,1]])/2
 
-        for bf in bflags_list:
+        # get only the unique points from the above, and the index of each
+        # averaged point into these unique points:
+        ecm_points_unique, ecm_points_unique_i = np.unique(
+            xmem_mids, axis=0, return_inverse=True)
 
-            bflags_ecm.append(ecm_list.index(bf))   # get the proper index for the boundary flag from points list
+        # if membrane indices are equal, they must be a boundary. Flag the
+        # proper index for each such unique point from the points list:
+        mems_bound = self.mem_nn[:,0] == self.mem_nn[:,1]
+        bflags_ecm = np.unique(ecm_points_unique_i.ravel()[mems_bound])
 
-        self.ecm_points = np.asarray(ecm_points_unique)  # assign final data structures
-        self.bflags_ecm = np.asarray(bflags_ecm)
+        self.ecm_points = ecm_points_unique  # assign final data structures
+        self.bflags_ecm = bflags_ecm
 
         self.ecm_i = np.asarray([ii for ii in range(len(self.ecm_points))])
 
-        xmem_mids = (self.mem_mids_flat[self.mem_nn[:,0]]
-                     + self.mem_mids_flat[self.mem_nn[:,1]])/2
-
         points_tree_ecm = cKDTree(self.ecm_points)
 
-
-        mem_to_ecm = []
-        for xm in xmem_mids:
-
-            _,ei = points_tree_ecm.query(xm)
-            mem_to_ecm.append(ei)
-
-        self.mem_to_ecm = np.asarray(mem_to_ecm)
+        # Query the nearest ecm point to all membrane mid pairs at once.
+        _, self.mem_to_ecm = points_tree_ecm.query(xmem_mids, workers=-1)
 
 
         cell_to_ecm = []
@@ -1689,9 +1446,9 @@ class Cells(object):
         self.all_points_cell_i = self.cell_i
         self.adl = len(self.all_points)
 
-        points_tree_mems = cKDTree(self.mem_mids_flat)
+        points_tree_mems = self._get_points_tree('mem_mids_flat')
         ecm_to_mems_o = points_tree_mems.query_ball_point(
-            self.ecm_points, r=10*p.cell_space)
+            self.ecm_points, r=10*p.cell_space, workers=-1)
 
         ecm_to_mems = []
         ecm_to_cells = []
@@ -1751,7 +1508,7 @@ class Cells(object):
         #-------------------------
 
         # first obtain a structure to map to total xypts vector index:
-        self.points_tree = cKDTree(self.xypts)
+        self.points_tree = self._get_points_tree('xypts')
 
         # define a mapping between a cell and its ecm space in the full list of xy points for the world:
         _, self.map_cell2ecm = self.points_tree.query(self.cell_centres)
@@ -2022,89 +1779,35 @@ class Cells(object):
         Used in deformation sequence.
         '''
 
-        self.nn_mids = []
-        self.nn_tx = []  # tangent vector to gap junction (through neighboring cell centres)
-        self.nn_ty = []
-        self.nn_len = []  # distance between neighbouring cell centres
-
-        self.nn_edges = [[] for x in self.mem_i]  # line segment between neighbouring cell centres
-
-        for mem_i, mem_j in enumerate(self.nn_i):
-            cell_i, cell_j = self.cell_nn_i[mem_i]
+        # Indices of the partnering membranes and cells of each membrane,
+        # vectorized as one array per coordinate (rather than as one list of
+        # points per membrane) to compute all pairings at once.
+        mem_j = np.asarray(self.nn_i)
+        cell_nn_i = np.asarray(self.cell_nn_i)
 
-            # calculate vectors for the pairing:
-            pt1_mem = self.mem_mids_flat[mem_i]
-            pt2_mem = self.mem_mids_flat[mem_j]
+        # calculate vectors for all pairings:
+        pt1_mem = self.mem_mids_flat
+        pt2_mem = self.mem_mids_flat[mem_j]
 
-            pt1_cell = self.cell_centres[cell_i]
-            pt2_cell = self.cell_centres[cell_j]
+        pt1_cell = self.cell_centres[cell_nn_i[:, 0]]
+        pt2_cell = self.cell_centres[cell_nn_i[:, 1]]
 
-            tang_o = pt2_mem - pt1_mem
+        # tangent vector to gap junction (through neighboring membrane mids),
+        # zeroed for self-paired boundary membranes:
+        self.nn_tx, self.nn_ty = self._get_unit_tangents(pt1_mem, pt2_mem)
 
-            tang_x_o = tang_o[0]
-            tang_y_o = tang_o[1]
-
-            tang_mag = np.sqrt(tang_x_o**2 + tang_y_o**2)
-
-            if tang_mag == 0.0:
-                tang_x = 0
-                tang_y = 0
-            else:
-                tang_x = tang_x_o/tang_mag
-                tang_y = tang_y_o/tang_mag
+        self.nn_mids = (pt1_mem + pt2_mem)/2
 
-            mid = (pt1_mem + pt2_mem)/2
-            self.nn_mids.append(mid)
+        # distance between neighbouring cell centres:
+        len_o = pt2_cell - pt1_cell
+        self.nn_len = np.sqrt(len_o[:, 0]**2 + len_o[:, 1]**2)
+        self.nn_len[self.nn_len == 0.0] = -1 # FIXME -- this seems like a horrific idea...
 
-            # calculate length
-            len_o = pt2_cell - pt1_cell
+        # line segment between neighbouring cell centres:
+        self.nn_edges = np.stack((pt1_cell, pt2_cell), axis=1)
 
-            len_xo  = len_o[0]
-            len_yo = len_o[1]
-
-            len_mag = np.sqrt(len_xo**2 + len_yo**2)
-
-            if len_mag == 0.0:
-                self.nn_len.append(-1) # FIXME -- this seems like a horrific idea...
-            else:
-                self.nn_len.append(len_mag)
-
-            self.nn_tx.append(tang_x)
-            self.nn_ty.append(tang_y)
-
-            self.nn_edges[mem_i].append(pt1_cell)
-            self.nn_edges[mem_i].append(pt2_cell)
-
-        self.nn_mids = np.asarray(self.nn_mids)
-
-        self.nn_tx = np.asarray(self.nn_tx)
-        self.nn_ty = np.asarray(self.nn_ty)
-        self.nn_len = np.asarray(self.nn_len)
-        self.nn_edges = np.asarray(self.nn_edges)
-
-        self.cell_nn_tx = []
-        self.cell_nn_ty = []
-
-        for cell_i, cell_j in self.cell_nn_i:
-            pt1 = self.cell_centres[cell_i]
-            pt2 = self.cell_centres[cell_j]
-
-            tang_o = pt2 - pt1
-            norm_tang = np.sqrt(tang_o[0]**2 + tang_o[1]**2)
-
-            if norm_tang != 0:
-                tang = tang_o/norm_tang
-            else:
-                norm_tang = 1
-                tang = tang_o/norm_tang
-                tang[0] = 0
-                tang[1] = 0
-
-            self.cell_nn_tx.append(tang[0])
-            self.cell_nn_ty.append(tang[1])
-
-        self.cell_nn_tx = np.asarray(self.cell_nn_tx)
-        self.cell_nn_ty = np.asarray(self.cell_nn_ty)
+        self.cell_nn_tx, self.cell_nn_ty = self._get_unit_tangents(
+            pt1_cell, pt2_cell)
 
         # Mapping between gap junction index and cell:
         self.cell_to_nn_full = [[] for x in range(len(self.cell_i))]
@@ -2118,6 +1821,30 @@ class Cells(object):
         self.cell_to_nn_full = np.asarray(self.cell_to_nn_full, dtype=object)
 
 
+    def _get_unit_tangents(self, pts1: ndarray, pts2: ndarray) -> tuple:
+        '''
+        2-tuple ``(tang_x, tang_y)`` of the X and Y components of the unit
+        vectors pointing from each passed start point to the corresponding
+        passed end point, zeroed for coincident point pairs.
+
+        Parameters
+        ----------
+        pts1 : ndarray
+            Two-dimensional array of the ``[x, y]`` start points.
+        pts2 : ndarray
+            Two-dimensional array of the ``[x, y]`` end points.
+        '''
+
+        tang_o = pts2 - pts1
+        tang_mag = np.sqrt(tang_o[:, 0]**2 + tang_o[:, 1]**2)
+
+        tang = np.zeros_like(tang_o)
+        np.divide(
+            tang_o, tang_mag[:, None], out=tang, where=tang_mag[:, None] != 0)
+
+        return tang[:, 0], tang[:, 1]
+
+
     @type_check
     def save_cluster(self, phase: SimPhase) -> None:
         '''
@@ -2145,7 +1872,7 @@ class Cells(object):
         differentiating between the cell cluster and environment.
         '''
 
-        voronoiTree = cKDTree(self.xypts)
+        voronoiTree = self._get_points_tree('xypts')
         _, self.map_voronoi2ecm = voronoiTree.query(self.ecm_verts_unique)
 
         self.voronoi_mask = np.zeros(len(self.xypts))
@@ -2622,6 +2349,35 @@ class Cells(object):
 
         return ux, uy
 
+    # ..........{ PRIVATE ~ getters                      }.....................
+    def _get_points_tree(self, attr_name: str) -> cKDTree:
+        '''
+        k-d tree over the two-dimensional array of ``[x, y]`` points bound to
+        the attribute of this cell cluster with the passed name, built on the
+        first call passed that name and reused by subsequent calls until that
+        attribute is rebound to a different array (e.g., on deformation).
+
+        Parameters
+        ----------
+        attr_name : str
+            Name of the array attribute of this cell cluster to search (e.g.,
+            ``mem_mids_flat``).
+        '''
+
+        # Original points and dictionary of previously built trees.
+        points = getattr(self, attr_name)
+        cells_trees = _CELLS_TREES.setdefault(self, {})
+
+        # If a tree was previously built over these same points, reuse it.
+        tree_cached = cells_trees.get(attr_name)
+        if tree_cached is not None and tree_cached[0] is points:
+            return tree_cached[1]
+
+        # Else, build and cache a new tree over these points.
+        tree = cKDTree(points)
+        cells_trees[attr_name] = (points, tree)
+        return tree
+
     # ..........{ PROPERTIES ~ membrane                  }.....................
     @property_cached
     def membranes_normal_unit_x(self) -> ndarray:
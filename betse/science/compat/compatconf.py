@@ -64,6 +64,7 @@ def upgrade_sim_conf(p: Parameters) -> None:
     _upgrade_sim_conf_to_0_6_0(p)
     _upgrade_sim_conf_to_0_7_1(p)
     _upgrade_sim_conf_to_1_0_0(p)
+    _upgrade_sim_conf_to_1_5_0(p)
 
 # ....................{ UPGRADERS ~ 0.5.x                 }....................
 @type_check
@@ -534,3 +535,22 @@ def _upgrade_sim_conf_to_1_0_0_exports_name(p: Parameters) -> None:
                     # exceptions on unnamed exports in this pipeline.
                     is_defaultable=True,
                 )
+
+# ....................{ UPGRADERS ~ 1.4.x                 }....................
+@type_check
+def _upgrade_sim_conf_to_1_5_0(p: Parameters) -> None:
+    '''
+    Upgrade the in-memory contents of the passed simulation configuration to
+    reflect the newest structure of these contents expected by version 1.5.0
+    of this application.
+    '''
+
+    # Log this upgrade attempt.
+    logs.log_debug('Upgrading simulation configuration to 1.5.0 format...')
+
+    # Localize configuration subdictionaries for convenience.
+    results_dict = p._conf['results options']
+
+    # Define the multipage plot setting if needed, preserving the prior
+    # behaviour of saving each plot to a distinct image file.
+    results_dict['save']['plots'].setdefault('multipage', False)
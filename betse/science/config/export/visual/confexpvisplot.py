@@ -52,6 +52,11 @@ class SimConfExportPlots(YamlABC):
     image_dpi : int
         Dots per inch (DPI) of all image files saved by this configuration.
         Ignored if :attr:`is_after_sim_save` is ``False``.
+    is_image_multipage : bool
+        ``True`` only if all plots exported by each plot pipeline are to be
+        saved as the pages of a single PDF file rather than as one image file
+        per plot, in which case :attr:`image_filetype` is ignored. Ignored if
+        :attr:`is_after_sim_save` is ``False``.
     '''
 
     # ..................{ ALIASES ~ after                   }..................
@@ -65,6 +70,8 @@ class SimConfExportPlots(YamlABC):
         "['results options']['save']['plots']['filetype']", str)
     image_dpi = yaml_alias_int_positive(
         "['results options']['save']['plots']['dpi']")
+    is_image_multipage = yaml_alias(
+        "['results options']['save']['plots']['multipage']", bool)
 
     # ..................{ INITIALIZERS                      }..................
     def __init__(self, *args, **kwargs) -> None:
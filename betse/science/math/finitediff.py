@@ -3,10 +3,10 @@
 # See "LICENSE" for further details.
 
 # ....................{ IMPORTS                            }....................
-import math
 import numpy as np
 # import scipy.ndimage
-from scipy.spatial import Delaunay, cKDTree
+from betse.science.math import toolbox as tb
+from scipy.spatial import cKDTree
 
 # ....................{ CLASSES                            }....................
 class FiniteDiffSolver(object):
@@ -264,15 +264,19 @@ class FiniteDiffSolver(object):
 
         A = np.zeros((sze,sze))
 
+        # Map each (i,j) index pair to its linear k index once up front rather
+        # than linearly searching a new list of all these pairs per lookup.
+        ij2k = _get_ij2k(self.map_ij2k_cents)
+
         for k, (i,j) in enumerate(self.map_ij2k_cents):
 
             # if we're not on a main boundary:
             if i != 0 and j != 0 and i != size_rows-1 and j != size_cols-1:
 
-                k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
-                k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                k_ip1_j = ij2k[i + 1,j]
+                k_in1_j = ij2k[i-1,j]
+                k_i_jp1 = ij2k[i,j+1]
+                k_i_jn1 = ij2k[i,j-1]
 
                 A[k, k_ip1_j] = 1
                 A[k, k_in1_j] = 1
@@ -285,9 +289,9 @@ class FiniteDiffSolver(object):
 
                 if bound['S'] == 'flux':
 
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                    k_ip1_j = ij2k[i + 1,j]
+                    k_i_jp1 = ij2k[i,j+1]
+                    k_i_jn1 = ij2k[i,j-1]
 
                     A[k, k_ip1_j] = 1
                     A[k, k_i_jp1] = 1
@@ -297,7 +301,7 @@ class FiniteDiffSolver(object):
 
                 elif bound['S'] == 'value':
 
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
+                    k_ip1_j = ij2k[i + 1,j]
 
                     A[k,k] = 1
                     # A[k,k_ip1_j] = 1
@@ -306,9 +310,9 @@ class FiniteDiffSolver(object):
 
                 if bound['N'] == 'flux':
 
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                    k_in1_j = ij2k[i-1,j]
+                    k_i_jp1 = ij2k[i,j+1]
+                    k_i_jn1 = ij2k[i,j-1]
 
                     A[k, k_in1_j] = 1
                     A[k, k_i_jp1] = 1
@@ -318,7 +322,7 @@ class FiniteDiffSolver(object):
 
                 elif bound['N'] == 'value':
 
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
+                    k_in1_j = ij2k[i-1,j]
 
                     A[k,k] = 1
                     # A[k,k_in1_j] = 1
@@ -327,9 +331,9 @@ class FiniteDiffSolver(object):
 
                 if bound['W'] == 'flux':
 
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
+                    k_i_jp1 = ij2k[i,j+1]
+                    k_ip1_j = ij2k[i + 1,j]
+                    k_in1_j = ij2k[i-1,j]
 
                     A[k, k_i_jp1] = 1
                     A[k, k_ip1_j] = 1
@@ -339,7 +343,7 @@ class FiniteDiffSolver(object):
 
                 elif bound['W'] == 'value':
 
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
+                    k_i_jp1 = ij2k[i,j+1]
 
                     A[k,k] = 1
                     # A[k,k_i_jp1] = 1
@@ -348,9 +352,9 @@ class FiniteDiffSolver(object):
 
                 if bound['E'] == 'flux':
 
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
+                    k_i_jn1 = ij2k[i,j-1]
+                    k_ip1_j = ij2k[i + 1,j]
+                    k_in1_j = ij2k[i-1,j]
 
                     A[k, k_i_jn1] = 1
                     A[k, k_ip1_j] = 1
@@ -360,7 +364,7 @@ class FiniteDiffSolver(object):
 
                 elif bound['E'] == 'value':
 
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                    k_i_jn1 = ij2k[i,j-1]
 
                     A[k,k] = 1
                     # A[k,k_i_jn1] = 1
@@ -370,8 +374,8 @@ class FiniteDiffSolver(object):
 
                 if bound['S'] == 'flux':
 
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
+                    k_ip1_j = ij2k[i + 1,j]
+                    k_i_jp1 = ij2k[i,j+1]
 
                     A[k, k_i_jp1] = 1
                     A[k, k_ip1_j] = 1
@@ -384,8 +388,8 @@ class FiniteDiffSolver(object):
 
                 if bound['N'] == 'flux':
 
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i - 1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
+                    k_in1_j = ij2k[i - 1,j]
+                    k_i_jp1 = ij2k[i,j+1]
 
                     A[k, k_i_jp1] = 1
                     A[k, k_in1_j] = 1
@@ -398,8 +402,8 @@ class FiniteDiffSolver(object):
 
                 if bound['E'] == 'flux':
 
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                    k_ip1_j = ij2k[i + 1,j]
+                    k_i_jn1 = ij2k[i,j-1]
 
                     A[k, k_i_jn1] = 1
                     A[k, k_ip1_j] = 1
@@ -412,8 +416,8 @@ class FiniteDiffSolver(object):
 
                 if bound['E'] == 'flux':
 
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i - 1,j])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                    k_in1_j = ij2k[i - 1,j]
+                    k_i_jn1 = ij2k[i,j-1]
 
                     A[k, k_i_jn1] = 1
                     A[k, k_in1_j] = 1
@@ -445,15 +449,19 @@ class FiniteDiffSolver(object):
 
         A = np.zeros((sze,sze))
 
+        # Map each (i,j) index pair to its linear k index once up front rather
+        # than linearly searching a new list of all these pairs per lookup.
+        ij2k = _get_ij2k(self.map_ij2k_cents)
+
         for k, (i,j) in enumerate(self.map_ij2k_cents):
 
             # if we're not on a main boundary:
             if i != 0 and j != 0 and i != size_rows-1 and j != size_cols-1:
 
-                k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
-                k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                k_ip1_j = ij2k[i + 1,j]
+                k_in1_j = ij2k[i-1,j]
+                k_i_jp1 = ij2k[i,j+1]
+                k_i_jn1 = ij2k[i,j-1]
 
                 A[k, k_ip1_j] = 1
                 A[k, k_in1_j] = 1
@@ -466,9 +474,9 @@ class FiniteDiffSolver(object):
 
                 if bound['S'] == 'flux':
 
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                    k_ip1_j = ij2k[i + 1,j]
+                    k_i_jp1 = ij2k[i,j+1]
+                    k_i_jn1 = ij2k[i,j-1]
 
                     A[k, k_ip1_j] = 1
                     A[k, k_i_jp1] = 1
@@ -478,7 +486,7 @@ class FiniteDiffSolver(object):
 
                 elif bound['S'] == 'value':
 
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
+                    k_ip1_j = ij2k[i + 1,j]
 
                     A[k,k] = 1
                     # A[k,k_ip1_j] = 1
@@ -487,9 +495,9 @@ class FiniteDiffSolver(object):
 
                 if bound['N'] == 'flux':
 
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                    k_in1_j = ij2k[i-1,j]
+                    k_i_jp1 = ij2k[i,j+1]
+                    k_i_jn1 = ij2k[i,j-1]
 
                     A[k, k_in1_j] = 1
                     A[k, k_i_jp1] = 1
@@ -499,7 +507,7 @@ class FiniteDiffSolver(object):
 
                 elif bound['N'] == 'value':
 
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
+                    k_in1_j = ij2k[i-1,j]
 
                     A[k,k] = 1
                     # A[k,k_in1_j] = 1
@@ -508,9 +516,9 @@ class FiniteDiffSolver(object):
 
                 if bound['W'] == 'flux':
 
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
+                    k_i_jp1 = ij2k[i,j+1]
+                    k_ip1_j = ij2k[i + 1,j]
+                    k_in1_j = ij2k[i-1,j]
 
 
                     A[k, k_i_jp1] = 1
@@ -521,7 +529,7 @@ class FiniteDiffSolver(object):
 
                 elif bound['W'] == 'value':
 
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
+                    k_i_jp1 = ij2k[i,j+1]
 
                     A[k,k] = 1
                     # A[k,k_i_jp1] = 1
@@ -530,9 +538,9 @@ class FiniteDiffSolver(object):
 
                 if bound['E'] == 'flux':
 
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
+                    k_i_jn1 = ij2k[i,j-1]
+                    k_ip1_j = ij2k[i + 1,j]
+                    k_in1_j = ij2k[i-1,j]
 
                     A[k, k_i_jn1] = 1
                     A[k, k_ip1_j] = 1
@@ -542,7 +550,7 @@ class FiniteDiffSolver(object):
 
                 elif bound['E'] == 'value':
 
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                    k_i_jn1 = ij2k[i,j-1]
 
                     A[k,k] = 1
                     # A[k,k_i_jn1] = 1
@@ -552,8 +560,8 @@ class FiniteDiffSolver(object):
 
                 if bound['S'] == 'flux':
 
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
+                    k_ip1_j = ij2k[i + 1,j]
+                    k_i_jp1 = ij2k[i,j+1]
 
                     A[k, k_i_jp1] = 1
                     A[k, k_ip1_j] = 1
@@ -566,8 +574,8 @@ class FiniteDiffSolver(object):
 
                 if bound['N'] == 'flux':
 
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i - 1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
+                    k_in1_j = ij2k[i - 1,j]
+                    k_i_jp1 = ij2k[i,j+1]
 
                     A[k, k_i_jp1] = 1
                     A[k, k_in1_j] = 1
@@ -580,8 +588,8 @@ class FiniteDiffSolver(object):
 
                 if bound['E'] == 'flux':
 
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                    k_ip1_j = ij2k[i + 1,j]
+                    k_i_jn1 = ij2k[i,j-1]
 
                     A[k, k_i_jn1] = 1
                     A[k, k_ip1_j] = 1
@@ -594,8 +602,8 @@ class FiniteDiffSolver(object):
 
                 if bound['E'] == 'flux':
 
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i - 1,j])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                    k_in1_j = ij2k[i - 1,j]
+                    k_i_jn1 = ij2k[i,j-1]
 
                     A[k, k_i_jn1] = 1
                     A[k, k_in1_j] = 1
@@ -627,15 +635,19 @@ class FiniteDiffSolver(object):
 
         A = np.zeros((sze,sze))
 
+        # Map each (i,j) index pair to its linear k index once up front rather
+        # than linearly searching a new list of all these pairs per lookup.
+        ij2k = _get_ij2k(self.map_ij2k_u)
+
         for k, (i,j) in enumerate(self.map_ij2k_u):
 
             # if we're not on a main boundary:
             if i != 0 and j != 0 and i != size_rows-1 and j != size_cols-1:
 
-                k_ip1_j = self.map_ij2k_u.tolist().index([i + 1,j])
-                k_in1_j = self.map_ij2k_u.tolist().index([i-1,j])
-                k_i_jp1 = self.map_ij2k_u.tolist().index([i,j+1])
-                k_i_jn1 = self.map_ij2k_u.tolist().index([i,j-1])
+                k_ip1_j = ij2k[i + 1,j]
+                k_in1_j = ij2k[i-1,j]
+                k_i_jp1 = ij2k[i,j+1]
+                k_i_jn1 = ij2k[i,j-1]
 
                 A[k, k_ip1_j] = 1
                 A[k, k_in1_j] = 1
@@ -648,14 +660,14 @@ class FiniteDiffSolver(object):
 
                 if bound['S'] == 'flux':
 
-                    k_ip1_j = self.map_ij2k_u.tolist().index([i + 1,j])
+                    k_ip1_j = ij2k[i + 1,j]
                     A[k, k_ip1_j] = 1
 
                     A[k,k] = -1
 
                 elif bound['S'] == 'value':
 
-                    k_ip1_j = self.map_ij2k_u.tolist().index([i + 1,j])
+                    k_ip1_j = ij2k[i + 1,j]
 
                     A[k,k] = 1
                     A[k,k_ip1_j] = 1
@@ -664,14 +676,14 @@ class FiniteDiffSolver(object):
 
                 if bound['N'] == 'flux':
 
-                    k_in1_j = self.map_ij2k_u.tolist().index([i-1,j])
+                    k_in1_j = ij2k[i-1,j]
                     A[k, k_in1_j] = 1
 
                     A[k,k] = -1
 
                 elif bound['N'] == 'value':
 
-                    k_in1_j = self.map_ij2k_u.tolist().index([i-1,j])
+                    k_in1_j = ij2k[i-1,j]
 
                     A[k,k] = 1
                     A[k,k_in1_j] = 1
@@ -680,14 +692,14 @@ class FiniteDiffSolver(object):
 
                 if bound['W'] == 'flux':
 
-                    k_i_jp1 = self.map_ij2k_u.tolist().index([i,j+1])
+                    k_i_jp1 = ij2k[i,j+1]
                     A[k, k_i_jp1] = 1
 
                     A[k,k] = -1
 
                 elif bound['W'] == 'value':
 
-                    k_i_jp1 = self.map_ij2k_u.tolist().index([i,j+1])
+                    k_i_jp1 = ij2k[i,j+1]
 
                     A[k,k] = 1
                     A[k,k_i_jp1] = 1
@@ -696,14 +708,14 @@ class FiniteDiffSolver(object):
 
                 if bound['E'] == 'flux':
 
-                    k_i_jn1 = self.map_ij2k_u.tolist().index([i,j-1])
+                    k_i_jn1 = ij2k[i,j-1]
                     A[k, k_i_jn1] = 1
 
                     A[k,k] = -1
 
                 elif bound['E'] == 'value':
 
-                    k_i_jn1 = self.map_ij2k_u.tolist().index([i,j-1])
+                    k_i_jn1 = ij2k[i,j-1]
 
                     A[k,k] = 1
                     A[k,k_i_jn1] = 1
@@ -730,15 +742,19 @@ class FiniteDiffSolver(object):
 
         A = np.zeros((sze,sze))
 
+        # Map each (i,j) index pair to its linear k index once up front rather
+        # than linearly searching a new list of all these pairs per lookup.
+        ij2k = _get_ij2k(self.map_ij2k_v)
+
         for k, (i,j) in enumerate(self.map_ij2k_v):
 
             # if we're not on a main boundary:
             if i != 0 and j != 0 and i != size_rows-1 and j != size_cols-1:
 
-                k_ip1_j = self.map_ij2k_v.tolist().index([i + 1,j])
-                k_in1_j = self.map_ij2k_v.tolist().index([i-1,j])
-                k_i_jp1 = self.map_ij2k_v.tolist().index([i,j+1])
-                k_i_jn1 = self.map_ij2k_v.tolist().index([i,j-1])
+                k_ip1_j = ij2k[i + 1,j]
+                k_in1_j = ij2k[i-1,j]
+                k_i_jp1 = ij2k[i,j+1]
+                k_i_jn1 = ij2k[i,j-1]
 
                 A[k, k_ip1_j] = 1
                 A[k, k_in1_j] = 1
@@ -751,14 +767,14 @@ class FiniteDiffSolver(object):
 
                 if bound['S'] == 'flux':
 
-                    k_ip1_j = self.map_ij2k_v.tolist().index([i + 1,j])
+                    k_ip1_j = ij2k[i + 1,j]
                     A[k, k_ip1_j] = 1
 
                     A[k,k] = -1
 
                 elif bound['S'] == 'value':
 
-                    k_ip1_j = self.map_ij2k_v.tolist().index([i + 1,j])
+                    k_ip1_j = ij2k[i + 1,j]
 
                     A[k,k] = 1
                     A[k,k_ip1_j] = 1
@@ -767,14 +783,14 @@ class FiniteDiffSolver(object):
 
                 if bound['N'] == 'flux':
 
-                    k_in1_j = self.map_ij2k_v.tolist().index([i-1,j])
+                    k_in1_j = ij2k[i-1,j]
                     A[k, k_in1_j] = 1
 
                     A[k,k] = -1
 
                 elif bound['N'] == 'value':
 
-                    k_in1_j = self.map_ij2k_v.tolist().index([i-1,j])
+                    k_in1_j = ij2k[i-1,j]
 
                     A[k,k] = 1
                     A[k,k_in1_j] = 1
@@ -783,14 +799,14 @@ class FiniteDiffSolver(object):
 
                 if bound['W'] == 'flux':
 
-                    k_i_jp1 = self.map_ij2k_v.tolist().index([i,j+1])
+                    k_i_jp1 = ij2k[i,j+1]
                     A[k, k_i_jp1] = 1
 
                     A[k,k] = -1
 
                 elif bound['W'] == 'value':
 
-                    k_i_jp1 = self.map_ij2k_v.tolist().index([i,j+1])
+                    k_i_jp1 = ij2k[i,j+1]
 
                     A[k,k] = 1
                     A[k,k_i_jp1] = 1
@@ -799,14 +815,14 @@ class FiniteDiffSolver(object):
 
                 if bound['E'] == 'flux':
 
-                    k_i_jn1 = self.map_ij2k_v.tolist().index([i,j-1])
+                    k_i_jn1 = ij2k[i,j-1]
                     A[k, k_i_jn1] = 1
 
                     A[k,k] = -1
 
                 elif bound['E'] == 'value':
 
-                    k_i_jn1 = self.map_ij2k_v.tolist().index([i,j-1])
+                    k_i_jn1 = ij2k[i,j-1]
 
                     A[k,k] = 1
                     A[k,k_i_jn1] = 1
@@ -833,15 +849,19 @@ class FiniteDiffSolver(object):
 
         A = np.zeros((sze,sze))
 
+        # Map each (i,j) index pair to its linear k index once up front rather
+        # than linearly searching a new list of all these pairs per lookup.
+        ij2k = _get_ij2k(self.map_ij2k_cents)
+
         for k, (i, j) in enumerate(self.map_ij2k_cents):
 
             # if we're not on a main boundary:
             if i != 0 and j != 0 and i != size_rows - 1 and j != size_cols - 1:
 
-                k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1, j])
-                k_in1_j = self.map_ij2k_cents.tolist().index([i - 1, j])
-                k_i_jp1 = self.map_ij2k_cents.tolist().index([i, j + 1])
-                k_i_jn1 = self.map_ij2k_cents.tolist().index([i, j - 1])
+                k_ip1_j = ij2k[i + 1, j]
+                k_in1_j = ij2k[i - 1, j]
+                k_i_jp1 = ij2k[i, j + 1]
+                k_i_jn1 = ij2k[i, j - 1]
 
                 A[k, k_ip1_j] = 1 / 16
                 A[k, k_in1_j] = 1 / 16
@@ -852,9 +872,9 @@ class FiniteDiffSolver(object):
 
             elif i == 0 and j != 0 and j != size_cols - 1:  # if on the bottom (South) boundary:
 
-                k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1, j])
-                k_i_jp1 = self.map_ij2k_cents.tolist().index([i, j + 1])
-                k_i_jn1 = self.map_ij2k_cents.tolist().index([i, j - 1])
+                k_ip1_j = ij2k[i + 1, j]
+                k_i_jp1 = ij2k[i, j + 1]
+                k_i_jn1 = ij2k[i, j - 1]
 
                 A[k, k_ip1_j] = 1 / 16
                 A[k, k_i_jp1] = 1 / 16
@@ -865,9 +885,9 @@ class FiniteDiffSolver(object):
 
             elif i == size_rows - 1 and j != 0 and j != size_cols - 1:  # if on the top (North) boundary:
 
-                k_in1_j = self.map_ij2k_cents.tolist().index([i - 1, j])
-                k_i_jp1 = self.map_ij2k_cents.tolist().index([i, j + 1])
-                k_i_jn1 = self.map_ij2k_cents.tolist().index([i, j - 1])
+                k_in1_j = ij2k[i - 1, j]
+                k_i_jp1 = ij2k[i, j + 1]
+                k_i_jn1 = ij2k[i, j - 1]
 
                 A[k, k_in1_j] = 1 / 16
                 A[k, k_i_jp1] = 1 / 16
@@ -877,9 +897,9 @@ class FiniteDiffSolver(object):
 
             elif j == 0 and i != 0 and i != size_rows - 1:  # if on the left (West) boundary:
 
-                k_i_jp1 = self.map_ij2k_cents.tolist().index([i, j + 1])
-                k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1, j])
-                k_in1_j = self.map_ij2k_cents.tolist().index([i - 1, j])
+                k_i_jp1 = ij2k[i, j + 1]
+                k_ip1_j = ij2k[i + 1, j]
+                k_in1_j = ij2k[i - 1, j]
 
                 A[k, k_i_jp1] = 1 / 16
                 A[k, k_ip1_j] = 1 / 16
@@ -889,9 +909,9 @@ class FiniteDiffSolver(object):
 
             elif j == size_cols - 1 and i != 0 and i != size_rows - 1:  # if on the right (East) boundary:
 
-                k_i_jn1 = self.map_ij2k_cents.tolist().index([i, j - 1])
-                k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1, j])
-                k_in1_j = self.map_ij2k_cents.tolist().index([i - 1, j])
+                k_i_jn1 = ij2k[i, j - 1]
+                k_ip1_j = ij2k[i + 1, j]
+                k_in1_j = ij2k[i - 1, j]
 
                 A[k, k_i_jn1] = 1 / 16
                 A[k, k_ip1_j] = 1 / 16
@@ -902,8 +922,8 @@ class FiniteDiffSolver(object):
             # corners:
             elif i == 0 and j == 0:  # SW corner
 
-                k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1, j])
-                k_i_jp1 = self.map_ij2k_cents.tolist().index([i, j + 1])
+                k_ip1_j = ij2k[i + 1, j]
+                k_i_jp1 = ij2k[i, j + 1]
 
                 A[k, k_i_jp1] = 1 / 16
                 A[k, k_ip1_j] = 1 / 16
@@ -911,8 +931,8 @@ class FiniteDiffSolver(object):
 
             elif i == size_rows - 1 and j == 0:  # NW corner
 
-                k_in1_j = self.map_ij2k_cents.tolist().index([i - 1, j])
-                k_i_jp1 = self.map_ij2k_cents.tolist().index([i, j + 1])
+                k_in1_j = ij2k[i - 1, j]
+                k_i_jp1 = ij2k[i, j + 1]
 
                 A[k, k_i_jp1] = 1 / 16
                 A[k, k_in1_j] = 1 / 16
@@ -920,8 +940,8 @@ class FiniteDiffSolver(object):
 
             elif i == 0 and j == size_cols - 1:  # SE corner
 
-                k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1, j])
-                k_i_jn1 = self.map_ij2k_cents.tolist().index([i, j - 1])
+                k_ip1_j = ij2k[i + 1, j]
+                k_i_jn1 = ij2k[i, j - 1]
 
                 A[k, k_i_jn1] = 1 / 16
                 A[k, k_ip1_j] = 1 / 16
@@ -929,8 +949,8 @@ class FiniteDiffSolver(object):
 
             elif i == size_rows - 1 and j == size_cols - 1:  # NE corner
 
-                k_in1_j = self.map_ij2k_cents.tolist().index([i - 1, j])
-                k_i_jn1 = self.map_ij2k_cents.tolist().index([i, j - 1])
+                k_in1_j = ij2k[i - 1, j]
+                k_i_jn1 = ij2k[i, j - 1]
 
                 A[k, k_i_jn1] = 1 / 16
                 A[k, k_in1_j] = 1 / 16
@@ -1167,6 +1187,14 @@ class FiniteDiffSolver(object):
 
         return F_int
 
+def _get_ij2k(map_ij2k: np.ndarray) -> dict:
+    '''
+    Dictionary mapping from each ``(i, j)`` index pair of the passed array
+    mapping linear ``k`` indices to these pairs to the corresponding ``k``.
+    '''
+
+    return {(i, j): k for k, (i, j) in enumerate(map_ij2k.tolist())}
+
 def jacobi(A,b,N=50,x=None):
     """
     Solves the equation Ax=b via the Jacobi iterative method.
@@ -1375,8 +1403,7 @@ def boundTag(points,delta,alpha=1.0):
 
     Returns
     -------
-    bflags       A python list of indices of points that are on the boundary
-    bmask        A numpy array of boolean flags of points that are on the boundary (order indexed to points_Flat)
+    bflags       A numpy array of the unique indices of points that are on the boundary
 
     Notes
     -------
@@ -1385,69 +1412,8 @@ def boundTag(points,delta,alpha=1.0):
     Requires a nested input such as self.mem_mids or self.ecm_verts
 
     """
-    alpha = alpha/delta
-
-    tri = Delaunay(points)
-    tri_edges = []
-    # circum_r_list = []
-
-    for ia, ib, ic in tri.vertices:
-        pa = points[ia]
-        pb = points[ib]
-        pc = points[ic]
-
-        # Lengths of sides of triangle
-        a = math.sqrt((pa[0]-pb[0])**2 + (pa[1]-pb[1])**2)
-        b = math.sqrt((pb[0]-pc[0])**2 + (pb[1]-pc[1])**2)
-        c = math.sqrt((pc[0]-pa[0])**2 + (pc[1]-pa[1])**2)
-
-        # Semiperimeter of triangle
-        s = (a + b + c)/2.0
-
-        # Area of triangle by Heron's formula
-        area = math.sqrt(abs(s*(s-a)*(s-b)*(s-c)))
-
-        if area > 0:
-            circum_r = a*b*c/(4.0*area)
-
-        if area == 0:
-            circum_r = a*b*c/(4.0*1e-25)
-
-        # Here's the radius filter:
-        if circum_r < 1.0/alpha:
-            #self.tri_edges_append([ia, ib])
-            tri_edges.append([ia, ib])
-            tri_edges.append([ib, ic])
-            tri_edges.append([ia, ic])
-
-    for i, edge in enumerate(tri_edges):  # First organize the list so that all [i,j] and [j,i] are equalized
-        pt1 = edge[0]
-        pt2 = edge[1]
-        if pt1 > pt2:
-            tri_edges[i]=[pt2,pt1]
-
-    tri_edges.sort()
-
-    tri_edges_len = len(tri_edges)
-    concave_hull = []
-
-    i = 0
-    # Now step through to find and remove all duplicating entities and add them to a new list
-    while i < tri_edges_len:
-        j = i + 1
-        tri_edge_i = tri_edges[i]
-
-        while j < tri_edges_len and tri_edge_i == tri_edges[j]:
-            j += 1
-
-        if i == j - 1:
-            concave_hull.append(tri_edge_i)
-            i += 1
-        else:
-            i = j
-
-#     con_hull = tb.alpha_shape(points, alpha/delta)  # get the concave hull for the membrane midpoints
-    concave_hull = np.asarray(concave_hull)
+    con_hull = tb.alpha_shape(points, alpha/delta)  # get the concave hull for the membrane midpoints
+    concave_hull = np.asarray(con_hull)
 
     bflags = np.unique(concave_hull)    # get the value of unique indices from segments
 
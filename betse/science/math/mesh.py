@@ -15,6 +15,7 @@
 #    https://stackoverflow.com/a/30960883/2809027
 
 # ....................{ IMPORTS                            }....................
+import math
 import numpy as np
 from beartype.typing import Tuple
 from betse.exceptions import BetseMathMeshException
@@ -23,7 +24,7 @@ from betse.util.math.geometry.polygon.geopoly import (
     is_convex, is_cyclic_quad, orient_counterclockwise,)
 from betse.util.math.geometry.polygon.geopolyconvex import (
     clip_counterclockwise)
-from betse.util.math.mathoper import det1d
+from betse.util.math.mathoper import cross2d
 from numpy import array, ndarray
 from scipy.spatial import cKDTree, Delaunay
 
@@ -322,52 +323,30 @@ class DECMesh(object):
         self.tri_vert_i = np.linspace(
             0, self.n_tverts - 1, self.n_tverts, dtype=int)
 
-        tri_ccents = []  # circumcentres of the triangles
-        tri_cents = []  # centroids of the triangles
-        tri_rcircs = []  # circumradius of triangle
-        tri_sa = []  # surface area of triangle faces
-        tcell_verts = []  # x,y components of tri_mesh cells
-        tri_cells = []  # indices to tri_verts defining each triangle (simplex)
+        # Calculate the circumcentres, circumradii, centroids and surface areas
+        # of all simplices at once.
+        tcell_verts = trimesh.points[trimesh.simplices]  # x,y components of tri_mesh cells
+        tri_ccents, tri_rcircs, _ = self.tris_circumc(tcell_verts)
+        tri_sa, tri_cents = self.polys_area_centroid(tcell_verts)
 
-        for si, vert_inds in enumerate(trimesh.simplices):
-            abc = trimesh.points[vert_inds]
-            vx, vy, r_circ, r_in = self.circumc(abc[0], abc[1], abc[2])
-            cx, cy = self.poly_centroid(abc)
+        if self.use_alpha_shape:
 
-            sa = self.area(abc)  # surface area of triangle
+            # exclude large circumcircles from the triangulation according to "alpha-shape"
+            # methodology:
+            is_tri_kept = tri_rcircs < (self.cell_radius) / self.alpha_shape
 
-            if self.use_alpha_shape:
+            # but also check that circumcentre is in the cluster mask...
+            if self.image_mask is not None:
+                is_tri_kept &= self.image_mask.clipping_spline(
+                    tri_ccents[:, 0], tri_ccents[:, 1], grid=False) != 0.0
 
-                # exclude large circumcircles from the triangulation according to "alpha-shape"
-                # methodology:
-                if r_circ < (self.cell_radius) / self.alpha_shape:
-
-                    # but also check that circumcentre is in the cluster mask...
-                    if self.image_mask is not None:
-                        flagc = self.image_mask.clipping_function(vx, vy)
+        # Else, retain all simplices without screening for triangle
+        # suitability.
+        else:
+            is_tri_kept = np.ones(len(trimesh.simplices), dtype=bool)
 
-                    else:
-                        flagc = 1.0
-
-                    # If it's not outside the cluster region, include the
-                    # simplex.
-                    if flagc != 0.0:
-                        tri_ccents.append([vx, vy])
-                        tri_cents.append([cx, cy])
-                        tri_rcircs.append(r_circ)
-                        tri_cells.append(vert_inds)
-                        tri_sa.append(sa)
-                        tcell_verts.append(abc)
-
-            # Append all information without screening for triangle
-            # suitability.
-            else:
-                tri_ccents.append([vx, vy])
-                tri_cents.append([cx, cy])
-                tri_rcircs.append(r_circ)
-                tri_sa.append(sa)
-                tri_cells.append(vert_inds)
-                tcell_verts.append(abc)
+        # indices to tri_verts defining each triangle (simplex)
+        tri_cells = trimesh.simplices[is_tri_kept]
 
         # Reassign point inds to retained simplices.
         self.tri_cells = np.asarray(tri_cells)
@@ -375,11 +354,11 @@ class DECMesh(object):
         self.n_tcell = len(tri_cells)  # number of simplexes in trimesh
         self.tri_cell_i = np.asarray([i for i in range(self.n_tcell)])  # indices vector of trimesh
 
-        self.tri_ccents = np.asarray(tri_ccents)
-        self.tri_cents = np.asarray(tri_cents)
-        self.tri_rcircs = np.asarray(tri_rcircs)
-        self.tri_sa = np.asarray(tri_sa)
-        self.tcell_verts = np.asarray(tcell_verts)
+        self.tri_ccents = tri_ccents[is_tri_kept]
+        self.tri_cents = tri_cents[is_tri_kept]
+        self.tri_rcircs = tri_rcircs[is_tri_kept]
+        self.tri_sa = tri_sa[is_tri_kept]
+        self.tcell_verts = tcell_verts[is_tri_kept]
 
         # Create an updated mapping of which triangle each vertex belongs to:
         self.create_tri_map()
@@ -462,19 +441,13 @@ class DECMesh(object):
                         # If the resulting merger leads to 4 unique vertices
                         # and one edge...
                         if len(quad_i) == 4 and len(shared_ij) == 2:
-                            # Orient verts counterclockwise.
+                            # Orient verts counterclockwise, sorting the
+                            # indices and points by the same single argsort.
                             quad_pts = self.tri_verts[quad_i]
+                            inds_sort = self.cc_sort_inds(quad_pts)
 
-                            # Calculate the centre point.
-                            cent = quad_pts.mean(axis=0)
-
-                            # Calculate point angles.
-                            angles = np.arctan2(quad_pts[:, 1] - cent[1],
-                                                quad_pts[:, 0] - cent[0])
-
-                            # Sort indices counter-clockwise.
-                            sorted_region = quad_i[np.argsort(angles)]
-                            sorted_pts = quad_pts[np.argsort(angles)]
+                            sorted_region = quad_i[inds_sort]
+                            sorted_pts = quad_pts[inds_sort]
 
                             # Test to see if the merged poly is convex:
                             conv_quad = is_convex(sorted_pts)
@@ -585,87 +558,41 @@ class DECMesh(object):
 
         logs.log_info("Defining edges of tri mesh...")
 
-        # Calculate edges for cells trimesh, and the hull:
-        all_edges = set()  # set of all vertex pairs
-        unique_edges = set()  # set of unique vertex pairs
-        hull_points = []
-        hull_edges = []
-        tri_mids = [] # midpoint of tri edges
-        tri_edge_len = [] # length of tri edge
-        tri_tang = [] # tri edge tangent
-
-        # Begin by creating a master set of all edges, including duplicate
-        # (vi, vj) and (vj, vi) combos.
-        for verti_o in self.tri_cells:
-            verti_i = np.roll(verti_o, -1)
-
-            for vi, vj in zip(verti_o, verti_i):
-                all_edges.add((vi, vj))
-
-        for va, vb in all_edges:
-            if (va, vb) in all_edges and (vb, va) not in all_edges:
-                # If there isn't a double-pair, then add these edges to the
-                # hull. This is based on the logic that when traversing the
-                # points of the triangular simplices, only the boundary edges
-                # are traversed once, since they don't have a neighbouring
-                # simplex at the bounds.
-                hull_points.append(va)
-                hull_points.append(vb)
-                hull_edges.append([va, vb])
-
-            # Otherwise add the edge to the set.
-            if (vb, va) not in unique_edges:
-                unique_edges.add((va, vb))
-
-        self.bflags_tverts = np.unique(hull_points)
-        self.tri_edges = np.asarray(list(unique_edges))
+        # Calculate edges for cells trimesh, and the hull. Begin by creating
+        # a master array of all edges, including duplicate (vi, vj) and
+        # (vj, vi) combos, pairing each vertex of each cell with the next
+        # vertex of the same cell:
+        tcell_verts_count = np.asarray([len(verti) for verti in self.tri_cells])
+        tcell_verts_start = np.cumsum(tcell_verts_count) - tcell_verts_count
+        tcell_verts_flat = np.concatenate(
+            [np.asarray(verti, dtype=np.int64) for verti in self.tri_cells])
+
+        tcell_verts_next = np.arange(1, len(tcell_verts_flat) + 1)
+        tcell_verts_next[tcell_verts_start + tcell_verts_count - 1] = (
+            tcell_verts_start)
+
+        self.tri_edges, self.bflags_tedges, self.bflags_tverts = (
+            self.edges_and_hull(np.column_stack((
+                tcell_verts_flat, tcell_verts_flat[tcell_verts_next]))))
         self.n_tedges = len(self.tri_edges)  # number of edges in trimesh
 
-        # Process edges to create flags of edge indices:
-        tri_edges = self.tri_edges.tolist()
-
-        bflags_tedges = []
-
-        for vi, vj in hull_edges:
-
-            if [vi, vj] in tri_edges:
-                kk = tri_edges.index([vi, vj])
-            elif [vj, vi] in tri_edges:
-                kk = tri_edges.index([vj, vi])
-            bflags_tedges.append(kk)
-
-        # Indices of edges on the boundary.
-        self.bflags_tedges = np.asarray(bflags_tedges)
-
         self.tri_edge_i = np.linspace(
             0, self.n_tedges - 1, self.n_tedges, dtype=int)
         self.inner_tedge_i = np.delete(self.tri_edge_i, self.bflags_tedges)
 
-        # Finally, go through and calculate mids, len, and tangents of
-        # tri_edges, and prepare a mapping between each vertices and edges.
-        for ei, (vi, vj) in enumerate(self.tri_edges):
-
-            # get coordinates associated with each edge
-            tpi = self.tri_verts[vi]
-            tpj = self.tri_verts[vj]
+        # Finally, calculate mids, len, and tangents of all tri_edges at once
+        # as contiguous arrays rather than appending to parallel lists.
+        tpi = self.tri_verts[self.tri_edges[:, 0]]
+        tpj = self.tri_verts[self.tri_edges[:, 1]]
 
-            tan_t = tpj - tpi
+        tan_t = tpj - tpi
 
-            tri_len = np.linalg.norm(tan_t)
+        self.tri_edge_len = np.hypot(tan_t[:, 0], tan_t[:, 1])
 
-            tan_ti = tan_t/tri_len
+        assert np.all(np.round(self.tri_edge_len, 15) != 0.0), "Tri-edge length equal to zero! Duplicate seed points exist!"
 
-            assert (np.round(tri_len, 15) != 0.0), "Tri-edge length equal to zero! Duplicate seed points exist!"
-
-            pptm = (tpi + tpj) / 2  # calculate midpoint of tri-edge:
-
-            tri_mids.append(pptm)
-            tri_edge_len.append(tri_len)
-            tri_tang.append(tan_ti)
-
-        self.tri_mids = np.asarray(tri_mids)
-        self.tri_edge_len = np.asarray(tri_edge_len)
-        self.tri_tang = np.asarray(tri_tang)
+        self.tri_tang = tan_t/self.tri_edge_len[:, None]
+        self.tri_mids = (tpi + tpj) / 2  # calculate midpoints of tri-edges
 
         # Inds to inner triverts.
         self.inner_tvert_i = np.delete(self.tri_vert_i, self.bflags_tverts)
@@ -757,54 +684,56 @@ class DECMesh(object):
 
         vcell_verts = []
         vor_verts = []
-        vor_sa = []
-        vor_cents = []
 
         vor_edge_verts = []
 
         tri_sa_o = [] # extended tri_sa (with elements for voronoi verts on boundary)
 
+        if self.use_centroids:
+            tri_pts = self.tri_cents
+        else:
+            tri_pts = self.tri_ccents
+
+        # Compute the new vor verts outside the hull for all boundary tri-edges
+        # at once, reflecting the centre of the single simplex sharing each
+        # boundary edge across the midpoint of that edge.
+        bflags_tedges = np.asarray(self.bflags_tedges, dtype=int)
+        bedge_verts = self.tri_verts[self.tri_edges[bflags_tedges]]
+        bedge_mids = np.mean(bedge_verts, axis=1)
+        bedge_simps = np.asarray(
+            [self.tedges_to_tcell[tei][0] for tei in bflags_tedges],
+            dtype=int)
+        bedge_intpts = bedge_mids + (bedge_mids - tri_pts[bedge_simps])
+
+        # Surface areas of the boundary triangle faucets.
+        bedge_sa = self.tri_sa[bedge_simps]
+
+        # Map each boundary tri-edge and -vert index to constant-time lookups.
+        bedge_to_i = {tei: i for i, tei in enumerate(bflags_tedges)}
+        bflags_tverts = set(self.bflags_tverts)
+
         for ti, tc_indso in enumerate(self._tverts_to_tcell):
             tc_inds = np.unique(tc_indso)
 
             assert len(tc_indso) != 0, "Tri-vert belongs to no simplices!"
 
-            if self.use_centroids:
-                vvertso = self.tri_cents[tc_inds]
-            else:
-                vvertso = self.tri_ccents[tc_inds]
+            vvertso = tri_pts[tc_inds]
 
             # Collect tri surface areas for these faucets.
             trisai = self.tri_sa[tc_inds]
 
             # If the trivert is on the hull...
-            if ti in self.bflags_tverts:
+            if ti in bflags_tverts:
                 # Get verts for trimesh edges of this neighbourhood and sort
                 # them counterclockwise: edge vertices.
                 tedge_inds = np.unique(self.tverts_to_tedges[ti])
 
-                for tei in tedge_inds:
-                    if tei in self.bflags_tedges:
-                        # Get the vertices of the boundary edge of the trimesh.
-                        bedge_verts = self.tri_verts[self.tri_edges[tei]]
-
-                        # Midpoint of the boundary tri-edge.
-                        bedge_mid = np.mean(bedge_verts, axis =0)
-                        simp_i = self.tedges_to_tcell[tei]
-
-                        if self.use_centroids:
-                            pt_o = self.tri_cents[simp_i[0]]
-                        else:
-                            pt_o = self.tri_ccents[simp_i[0]]
-
-                        dist_diff = bedge_mid - pt_o
-                        intpt = bedge_mid + dist_diff
-
-                        # Surface area of the boundary triangle faucet.
-                        bsa = self.tri_sa[simp_i[0]]
-
-                        vvertso = np.vstack((vvertso, intpt))
-                        trisai = np.hstack((trisai, bsa))
+                # Append the new vor verts of all boundary tri-edges of this
+                # neighbourhood in a single stacking.
+                binds = [
+                    bedge_to_i[tei] for tei in tedge_inds if tei in bedge_to_i]
+                vvertso = np.vstack((vvertso, bedge_intpts[binds]))
+                trisai = np.hstack((trisai, bedge_sa[binds]))
 
             # Sort the voronoi verts counter-clockwise.
             inds_vsort = self.cc_sort_inds(vvertso)
@@ -814,8 +743,6 @@ class DECMesh(object):
             vor_verts.extend(vverts)
             tri_sa_o.extend(trisaj)
             vcell_verts.append(vverts)
-            vor_sa.append(self.area(vverts))
-            vor_cents.append(self.poly_centroid(vverts))
 
             # Calculate vor edge verts.
             vedge_verts = np.asarray([
@@ -828,8 +755,7 @@ class DECMesh(object):
         self.vcell_verts = np.asarray(vcell_verts, dtype=object)
         self.vor_verts_duplicates = vor_verts*1
         self.vor_verts = np.unique(np.asarray(vor_verts), axis=0)
-        self.vor_sa = np.asarray(vor_sa)
-        self.vor_cents = np.asarray(vor_cents)
+        self.vor_sa, self.vor_cents = self.polys_area_centroid(vcell_verts)
 
         self.vor_edge_verts = np.unique(np.asarray(vor_edge_verts), axis=0)
 
@@ -852,15 +778,6 @@ class DECMesh(object):
         # Find edges of Voronoi dual mesh. We want vor edges to have the same
         # index as tri_edges and to be perpendicular bisectors; therefore we're
         # going to have one vor_edge vert pair for each tri-edge.
-        all_edges = set()
-        vedge_set = set()
-        hull_points = []
-        hull_edges = []
-        vor_mids = []
-        vor_tang = []
-        vor_edge_len = []
-        vor_cells = []
-
         # vor_norm = [] # normals to vor cell surfaces (outwards pointing)
         # tri_norm = [] # normals to tri cell surfaces (outwards pointing)
         # sflux_n = [] # dot product between voronoi cell surface normal (outwards) and tri-tangent
@@ -874,80 +791,30 @@ class DECMesh(object):
         else:
             _, self.inner_vvert_i = vor_tree.query(self.tri_ccents)
 
-        for vpts in self.vcell_verts:
-            # Get inds of the cell verts from the tree.
-            di, vi = vor_tree.query(vpts)
-
-            # Append vor inds to vor verts making up the vor cell
-            vor_cells.append(vi)
-
-        for vedge in self.vor_edge_verts:
-            di, vi = vor_tree.query(vedge)
-            all_edges.add((vi[0], vi[1]))
+        # Get inds of the verts of all vor cells from the tree in one query,
+        # then split these inds back into the vor verts making up each cell.
+        vcell_verts_count = [len(vpts) for vpts in self.vcell_verts]
+        _, vor_cells_flat = vor_tree.query(np.concatenate(self.vcell_verts))
+        vor_cells = np.split(vor_cells_flat, np.cumsum(vcell_verts_count)[:-1])
 
-        for va, vb in all_edges:
-            if (va, vb) in all_edges and (vb, va) not in all_edges:
-                # if there isn't a double-pair, then add these edges to the hull:
-                # (this is based on the logic that when traversing the points of the
-                # triangular simplices, only the boundary edges are traversed once,
-                # since they don't have a neighbouring simplex at the bounds.)
-                hull_points.append(va)
-                hull_points.append(vb)
+        # Likewise get inds of the verts of all vor edges in one query, then
+        # reduce these to unique edges and flag edges on the boundary.
+        _, vor_edge_inds = vor_tree.query(self.vor_edge_verts.reshape(-1, 2))
+        vor_edges, self.bflags_vedges, self.bflags_vverts = self.edges_and_hull(
+            vor_edge_inds.reshape(-1, 2))
 
-                hull_edges.append([va, vb])
+        # Finally, calculate mids, len, and tangents of all vor_edges at once:
+        vpi = self.vor_verts[vor_edges[:, 0]]
+        vpj = self.vor_verts[vor_edges[:, 1]]
 
-            if (vb, va) not in vedge_set:  # otherwise add the edge to the set
-                vedge_set.add((va, vb))
+        tan_v = vpj - vpi
 
-        self.bflags_vverts = np.unique(hull_points)
-        vor_edges = np.asarray(list(vedge_set))
+        vor_edge_len = np.hypot(tan_v[:, 0], tan_v[:, 1])
 
-        # Process edges to create flags of edge indices:
-        # vor_edges_i = vor_edges.tolist() # FIXME do this as a cKDTree search
-        vedge_tree = cKDTree(vor_edges)
+        assert np.all(np.round(vor_edge_len, 15) != 0.0), "Tri-edge length equal to zero! Duplicate seed points exist!"
 
-        bflags_vedges = []
-
-        for vi, vj in hull_edges:
-
-            dedgea, ea = vedge_tree.query([vi, vj])
-            dedgeb, eb = vedge_tree.query([vj, vi])
-
-            if dedgea == 0.0:
-                kk = ea
-            elif dedgeb == 0.0:
-                kk = eb
-            bflags_vedges.append(kk)
-
-        self.bflags_vedges = np.asarray(bflags_vedges)  # indices of edges on the boundary
-
-        # Finally, go through and calculate mids, len, and tangents of tri_edges, and prepare a mapping between
-        # each vertices and edges:
-        for ei, (vi, vj) in enumerate(vor_edges):
-            # Coordinates associated with each edge, each defined as a
-            # 1-dimensional array of only 2 numbers.
-            vpi = self.vor_verts[vi]
-            vpj = self.vor_verts[vj]
-            # print(f'vpi: {repr(vpi)}')
-            # print(f'vpj: {repr(vpj)}')
-
-            tan_v = vpj - vpi
-
-            vor_len = np.linalg.norm(tan_v)
-
-            tan_vi = tan_v / vor_len
-
-            assert (np.round(vor_len, 15) != 0.0), "Tri-edge length equal to zero! Duplicate seed points exist!"
-
-            ppvm = (vpi + vpj) / 2  # calculate midpoint of tri-edge:
-
-            vor_mids.append(ppvm)
-            vor_edge_len.append(vor_len)
-            vor_tang.append(tan_vi)
-
-        vor_mids = np.asarray(vor_mids)
-        vor_edge_len = np.asarray(vor_edge_len)
-        vor_tang = np.asarray(vor_tang)
+        vor_tang = tan_v / vor_edge_len[:, None]
+        vor_mids = (vpi + vpj) / 2  # calculate midpoints of vor-edges
 
         self.vor_cells = np.asarray(vor_cells, dtype=object)
 
@@ -967,19 +834,9 @@ class DECMesh(object):
 
         # Finally, need to correct the orientation of the voronoi edges to make
         # them all 90 degree rotations of the tri mesh:
-        for ei, (vti, tti) in enumerate(zip(self.vor_tang, self.tri_tang)):
-            # print(f'ei: {repr(ei)}')
-            # print(f'tti: {repr(tti)}')
-            # print(f'vti: {repr(vti)}')
-            # print(f'vor_tang: {repr(vor_tang)}')
-            # print(f'vor_tang (mapped): {repr(self.vor_tang)}')
-            # print(f'tri_tang (mapped): {repr(self.tri_tang)}')
-            sign = np.sign(det1d(tti, vti))
-
-            if sign == 1.0:
-                self.vor_tang[ei] = -vti
-                va, vb = self.vor_edges[ei]
-                self.vor_edges[ei] = [vb, va]
+        is_vedge_flipped = np.sign(cross2d(self.tri_tang, self.vor_tang)) == 1.0
+        self.vor_tang[is_vedge_flipped] = -self.vor_tang[is_vedge_flipped]
+        self.vor_edges[is_vedge_flipped] = self.vor_edges[is_vedge_flipped, ::-1]
 
         self.n_vedges = len(self.vor_edges)
         self.vor_edge_i = np.linspace(
@@ -999,10 +856,8 @@ class DECMesh(object):
             0, self.n_vcells - 1, self.n_vcells, dtype=int)
 
         # get final bounds for the cluster:
-        xmin = self.vor_verts[:, 0].min()
-        xmax = self.vor_verts[:, 0].max()
-        ymin = self.vor_verts[:, 1].min()
-        ymax = self.vor_verts[:, 1].max()
+        xmin, ymin = self.vor_verts.min(axis=0)
+        xmax, ymax = self.vor_verts.max(axis=0)
 
         self.xyaxis = [xmin * 1.1, xmax * 1.1, ymin * 1.1, ymax * 1.1]
 
@@ -1050,89 +905,43 @@ class DECMesh(object):
 
         logs.log_info("Updating metric quantities...")
         # Update tri_ccents, tri_cents as well!
-        vor_cents = []  # centroid of voronoi polygons
-        vor_sa = []  # surface area of voronoi polygons
-        vor_edge_mids = []  # mids of tri cell edges
-        vor_edge_len = []  # length of vor_edge
-        vor_tang = []  # tangent vectors to vor_edges
-        # vor_norm = [] # normal vectors to vor_edges
-
-
-        tri_cents = [] # center of triangular cells #FIXME implement this!
         tri_ccents = [] # circumcenter of triangles
         tri_rcircs = [] # circumradius of triangles
-        tri_sa = [] # surface area of triangles
-        tri_edge_mids = []  # mids of tri cell edges
-        tri_edge_len = []  # length of tri_edge
-        tri_tang = []  # tangent vectors to tri_edges
-        # tri_norm = []  # tangent vectors to vor_edges
 
         # sflux_n = [] # dot product between vor cell normal and tricell tangents
 
-        for pts in self.vcell_verts: # FIXME calculate tri cell properties here too (each vcell index maps to tri vert index)
-            # Calculate centroid and area of the voronoi polygon:
-            cx, cy = self.poly_centroid(pts)
-            vor_cents.append([cx, cy])
-
-            sa = self.area(pts)
-            vor_sa.append(sa)
-
-        self.vor_cents = np.asarray(vor_cents)
-        self.vor_sa = np.asarray(vor_sa)
+        # Calculate centroid and area of all voronoi polygons.
+        # FIXME calculate tri cell properties here too (each vcell index maps to tri vert index)
+        self.vor_sa, self.vor_cents = self.polys_area_centroid(self.vcell_verts)
 
-        for tei, (ti, tj) in enumerate(self.tri_edges):
-            # find points representing vor and tri edges:
+        # Calculate mids, lengths and tangents of all tri and vor edges at once
+        # as contiguous arrays rather than appending to parallel lists.
+        tpi = self.tri_verts[self.tri_edges[:, 0]]
+        tpj = self.tri_verts[self.tri_edges[:, 1]]
 
-            tpi = self.tri_verts[ti]
-            tpj = self.tri_verts[tj]
+        tan_to = tpj - tpi
 
-            tan_to = tpj - tpi
+        tri_edge_len = np.hypot(tan_to[:, 0], tan_to[:, 1])
 
-            tri_len = np.linalg.norm(tan_to)
-            tan_t = tan_to/tri_len
+        assert np.all(tri_edge_len != 0.0), "Tri-edge length equal to zero!"
 
-            pptm = (tpi + tpj) / 2  # calculate midpoint of tri-edge:
+        vpi = self.vor_verts[self.vor_edges[:, 0]]
+        vpj = self.vor_verts[self.vor_edges[:, 1]]
 
-            tri_edge_mids.append(pptm)
+        tan_vo = vpj - vpi
 
-            assert (tri_len != 0.0), "Tri-edge length equal to zero!"
+        vor_edge_len = np.hypot(tan_vo[:, 0], tan_vo[:, 1])
 
-            tri_edge_len.append(tri_len * 1)
-            tri_tang.append(1 * tan_t)
-            # tri_norm.append([tan_t[1], -tan_t[0]])
+        assert np.all(vor_edge_len != 0.0), "Vor-edge length equal to zero!"
 
-            vi, vj = self.vor_edges[tei]
+        # norm_v = [tan_v[1], -tan_v[0]]
+        # sflux_n.append(-(norm_v[0] * tan_t[0] + norm_v[1] * tan_t[1]))
 
-            # get x-y points:
-            vpi = self.vor_verts[vi]
-            vpj = self.vor_verts[vj]
+        # Calculate centroid and surface area of all tri cells at once.
+        tcell_verts = [self.tri_verts[verti] for verti in self.tri_cells]
+        tri_sa, tri_cents = self.polys_area_centroid(tcell_verts)
 
-            tan_vo = vpj - vpi
-
-            vor_len = np.linalg.norm(tan_vo)
-
-            tan_v = tan_vo/vor_len
-
-            ppvm = (vpi + vpj)/2 # midpoint of voronoi edge
-            vor_edge_mids.append(ppvm)
-
-            assert (vor_len != 0.0), "Vor-edge length equal to zero!"
-
-            vor_edge_len.append(vor_len * 1)
-            vor_tang.append(tan_v)
-            # norm_v = [tan_v[1], -tan_v[0]]
-            # vor_norm.append(norm_v)
-
-            # sflux_n.append(-(norm_v[0] * tan_t[0] + norm_v[1] * tan_t[1]))
-
-        for si, verti in enumerate(self.tri_cells):
-            tripts = self.tri_verts[verti]
-
-            cx, cy = self.poly_centroid(tripts)
-            tri_cents.append([cx, cy])
-
-            sa = self.area(tripts)  # surface area of triangle
-            tri_sa.append(sa)
+        for verti, tripts in zip(self.tri_cells, tcell_verts):
 
             if len(verti) == 3:
                 vx, vy, r_circ, r_in = self.circumc(tripts[0], tripts[1], tripts[2])
@@ -1144,17 +953,17 @@ class DECMesh(object):
                 tri_ccents.append([cx, cy])
                 tri_rcircs.append(R)
 
-        self.tri_tang = np.asarray(tri_tang)
-        self.vor_tang = np.asarray(vor_tang)
-        self.tri_cents = np.asarray(tri_cents)
+        self.tri_tang = tan_to/tri_edge_len[:, None]  # tangent vectors to tri_edges
+        self.vor_tang = tan_vo/vor_edge_len[:, None]  # tangent vectors to vor_edges
+        self.tri_cents = tri_cents
         self.tri_ccents = np.asarray(tri_ccents)
-        self.tri_sa = np.asarray(tri_sa)
+        self.tri_sa = tri_sa
 
-        self.vor_edge_len = np.asarray(vor_edge_len)  # length of vor_edge
-        self.tri_edge_len = np.asarray(tri_edge_len)  # length of tri_edge
+        self.vor_edge_len = vor_edge_len  # length of vor_edge
+        self.tri_edge_len = tri_edge_len  # length of tri_edge
 
-        self.tri_mids = np.asarray(tri_edge_mids)  # edge midpoints
-        self.vor_mids = np.asarray(vor_edge_mids) # edge midpoints
+        self.tri_mids = (tpi + tpj)/2  # edge midpoints
+        self.vor_mids = (vpi + vpj)/2  # edge midpoints
 
         # self.vor_norm = np.asarray(vor_norm) # normals to vor cell surfaces (outwards pointing)
         # self.tri_norm = np.asarray(tri_norm) # normals to tri cell surfaces (outwards pointing)
@@ -2216,7 +2025,7 @@ class DECMesh(object):
 
                 for j, ptc in enumerate(pt_cloud):
 
-                    dist = np.sqrt((pt[0] - ptc[0]) ** 2 + (pt[1] - ptc[1]) ** 2)
+                    dist = math.hypot(pt[0] - ptc[0], pt[1] - ptc[1])
 
                     if dist < 1.0e-15:
 
@@ -2302,35 +2111,39 @@ class DECMesh(object):
 
         self.removed_bad_verts = False # reset flag for empty tri_vert removal
 
-        for ii, (poly_ind, cell_poly, vor_cent) in enumerate(zip(self.vor_cells,
-                                                                 self.vcell_verts,
-                                                                 self.vor_cents)):
-
-            # see if voronoi cell center is within the clip curve boundary:
-            cent_val = imagemask.clipping_function(vor_cent[0], vor_cent[1])
-            if cent_val != 0.0:
-                cent_val = 1.0
+        # see if each voronoi cell center is within the clip curve boundary,
+        # evaluating the clipping function at all centers at once:
+        cents_check = imagemask.clipping_spline(
+            self.vor_cents[:, 0], self.vor_cents[:, 1], grid=False) != 0.0
+
+        # likewise for all vertices of all voronoi cells, split back into one
+        # array of flags per cell:
+        vcell_verts_len = [len(cell_poly) for cell_poly in self.vcell_verts]
+        vcell_verts_flat = np.concatenate(list(self.vcell_verts))
+        points_check = np.split(
+            imagemask.clipping_spline(
+                vcell_verts_flat[:, 0], vcell_verts_flat[:, 1], grid=False
+            ) != 0.0,
+            np.cumsum(vcell_verts_len)[:-1],
+        )
+
+        for ii, (poly_ind, cell_poly, cent_val, point_check) in enumerate(zip(
+            self.vor_cells, self.vcell_verts, cents_check, points_check)):
 
             if len(poly_ind) >= 3:
-                cell_polya = cell_poly.tolist()
-                point_check = np.zeros(len(cell_poly))
-
-                for i, pnt in enumerate(cell_poly):
-
-                    point_val = imagemask.clipping_function(pnt[0], pnt[1])
 
-                    if point_val != 0.0:
-                        point_check[i] = 1.0
+                # If all points are all inside the clipping zone, keep this
+                # cell as is. Since most cells of a large cluster lie wholly
+                # inside, this fast path avoids both the clipper and any
+                # conversion of this cell's vertices.
+                if point_check.all():
 
-                if point_check.sum() == len(cell_poly):  # if all points are all inside the clipping zone
-
-                    clip_vor_verts.append(np.array(cell_polya))
-                    cx, cy = self.poly_centroid(cell_polya)
+                    clip_vor_verts.append(cell_poly)
+                    cx, cy = self.poly_centroid(cell_poly)
                     clip_vor_cents.append([cx, cy])
 
                 # the region's points are in the clipping func range, and the voronoi cent lays in the bound:
-                elif point_check.sum() > 0.0 and point_check.sum() < len(
-                        cell_poly) and cent_val == 1.0:
+                elif point_check.any() and cent_val:
 
                     clip_poly = clip_counterclockwise(
                         cell_poly, imagemask.clipcurve)
@@ -2468,17 +2281,117 @@ class DECMesh(object):
 
         if aa != 0.0:
 
-            cx = (1 / (6 * aa)) * np.sum((foo[:, 0] + foo_p[:, 0]) * (foo[:, 0] * foo_p[:, 1] - foo_p[:, 0] * foo[:, 1]))
-            cy = (1 / (6 * aa)) * np.sum((foo[:, 1] + foo_p[:, 1]) * (foo[:, 0] * foo_p[:, 1] - foo_p[:, 0] * foo[:, 1]))
+            # Reuse the per-edge cross products computed above and apply the
+            # common 1/(6A) scaling once outside each sum.
+            cx, cy = (1 / (6 * aa)) * np.dot(ai, foo + foo_p)
 
         else:
 
-            mid = np.mean(p, axis=1)
+            mid = np.mean(foo, axis=0)
             cx = mid[0]
             cy = mid[1]
 
         return cx, cy
 
+    def polys_area_centroid(self, polys):
+        """
+        Calculates the signed areas and centroids of many polygons at once.
+
+        This is the vectorized equivalent of calling :meth:`area` and
+        :meth:`poly_centroid` on each polygon. Polygons are padded to a common
+        number of vertices by repeating their last vertex; the resulting
+        zero-length edges contribute nothing to either shoelace sum.
+
+        Parameters
+        ----------
+        polys   sequence of arrays of [x,y] points defining polygon vertices
+
+        Returns
+        --------
+        areas       array of signed polygon areas
+        centroids   array of [x,y] polygon centroid coordinates
+        """
+
+        # Number of vertices in each polygon and offset of its first vertex
+        # into the flattened array of all vertices.
+        num_verts = np.asarray([len(poly) for poly in polys])
+        vert_offsets = np.cumsum(num_verts) - num_verts
+        verts = np.concatenate([np.asarray(poly) for poly in polys])
+
+        # Index of each padded vertex, repeating the last vertex of each
+        # polygon to fill out the common vertex count.
+        pad_i = np.minimum(
+            np.arange(num_verts.max()), num_verts[:, None] - 1)
+        foo = verts[vert_offsets[:, None] + pad_i]
+
+        # move points along by one:
+        foo_p = np.roll(foo, -1, axis=1)
+
+        ai = foo[:, :, 0] * foo_p[:, :, 1] - foo_p[:, :, 0] * foo[:, :, 1]
+
+        aa = (1 / 2) * np.sum(ai, axis=1)  # signed area
+
+        # Sum each polygon's centroid moments, falling back to the vertex mean
+        # for degenerate polygons of zero area.
+        moments = np.einsum('ij,ijk->ik', ai, foo + foo_p)
+        degenerate = aa == 0.0
+
+        cents = np.empty_like(moments)
+        np.divide(
+            moments, 6 * aa[:, None], out=cents, where=~degenerate[:, None])
+
+        for i in np.flatnonzero(degenerate):
+            cents[i] = np.mean(np.asarray(polys[i]), axis=0)
+
+        return aa, cents
+
+    def edges_and_hull(self, edges):
+        """
+        Calculates the unique edges of a mesh and the edges and vertices on
+        its boundary from the directed edges traversed by all cells of that
+        mesh.
+
+        Each directed edge is packed into a single integer key rather than a
+        tuple, so that duplicate edges are removed and reversed edges found
+        by sorting and searching arrays of keys.
+
+        Parameters
+        ----------
+        edges   array of [vi, vj] vertex indices of all directed edges
+
+        Returns
+        --------
+        unique_edges    array of [vi, vj] vertex indices of each unique edge
+        bflags_edges    indices of the unique edges on the boundary
+        bflags_verts    indices of the vertices on the boundary
+
+        Notes
+        -------
+        Boundary edges are those traversed in only one direction, as these
+        edges have no neighbouring cell at the bounds. Boundary edges retain
+        that direction; all other edges are directed from the lower to the
+        higher vertex index.
+        """
+
+        edges = np.asarray(edges, dtype=np.int64)
+
+        keys = np.unique((edges[:, 0] << 32) | edges[:, 1])
+        vi = keys >> 32
+        vj = keys & 0xffffffff
+
+        # if there isn't a double-pair, the edge is on the boundary:
+        is_hull = ~np.isin((vj << 32) | vi, keys)
+
+        # keep both the sole direction of each boundary edge and one direction
+        # of each double-pair:
+        is_kept = is_hull | (vi < vj)
+        unique_edges = np.column_stack((vi[is_kept], vj[is_kept]))
+
+        bflags_edges = np.flatnonzero(is_hull[is_kept])
+        bflags_verts = np.unique(unique_edges[bflags_edges])
+
+        return unique_edges, bflags_edges, bflags_verts
+
     def circumc(self, A, B, C):
         """
         Calculates the circumcenter and circumradius of a triangle with
@@ -2512,9 +2425,9 @@ class DECMesh(object):
         # Calculate circumradius:
         # (from https://www.mathalino.com/reviewer/
         # derivation-of-formulas/derivation-of-formula-for-radius-of-circumcircle)
-        a = np.sqrt((Ax - Bx) ** 2 + (Ay - By) ** 2)
-        b = np.sqrt((Bx - Cx) ** 2 + (By - Cy) ** 2)
-        c = np.sqrt((Cx - Ax) ** 2 + (Cy - Ay) ** 2)
+        a = math.hypot(Ax - Bx, Ay - By)
+        b = math.hypot(Bx - Cx, By - Cy)
+        c = math.hypot(Cx - Ax, Cy - Ay)
 
         s = (a + b + c) / 2.0
         area = np.sqrt(s * (s - a) * (s - b) * (s - c))
@@ -2531,13 +2444,67 @@ class DECMesh(object):
 
         return ox, oy, rc, ri
 
+    def tris_circumc(self, tris):
+        """
+        Calculates the circumcentres, circumradii and inradii of many
+        triangles at once.
+
+        This is the vectorized equivalent of calling :meth:`circumc` on each
+        triangle.
+
+        Parameters
+        ----------
+        tris    array of shape (n, 3, 2) of the [x,y] vertices of each triangle
+
+        Returns
+        --------
+        ccents  array of [x,y] circumcentre coordinates
+        rcs     array of circumradii (zero for degenerate triangles)
+        ris     array of inradii
+        """
+
+        # Point coords:
+        Ax = tris[:, 0, 0]
+        Ay = tris[:, 0, 1]
+        Bx = tris[:, 1, 0]
+        By = tris[:, 1, 1]
+        Cx = tris[:, 2, 0]
+        Cy = tris[:, 2, 1]
+
+        # Calculate circumcentres:
+        A2 = Ax ** 2 + Ay ** 2
+        B2 = Bx ** 2 + By ** 2
+        C2 = Cx ** 2 + Cy ** 2
+
+        denom = 2 * (Ax * (By - Cy) + Bx * (Cy - Ay) + Cx * (Ay - By))
+
+        ox = (A2 * (By - Cy) + B2 * (Cy - Ay) + C2 * (Ay - By)) / denom
+        oy = (A2 * (Cx - Bx) + B2 * (Ax - Cx) + C2 * (Bx - Ax)) / denom
+
+        # Calculate circumradii:
+        a = np.hypot(Ax - Bx, Ay - By)
+        b = np.hypot(Bx - Cx, By - Cy)
+        c = np.hypot(Cx - Ax, Cy - Ay)
+
+        s = (a + b + c) / 2.0
+        area = np.sqrt(s * (s - a) * (s - b) * (s - c))
+
+        # circumcircles, defaulting to zero for degenerate triangles:
+        rc = np.zeros_like(area)
+        np.divide(a * b * c, 4.0 * area, out=rc, where=area > 0.0)
+
+        # inradii:
+        ri = (2*area)/ (a + b + c)
+
+        return np.column_stack((ox, oy)), rc, ri
+
     def quad_circumc(self, A, B, C, D):
 
         # calculate lengths of all sides
-        a = np.linalg.norm(B - A)
-        b = np.linalg.norm(C - B)
-        c = np.linalg.norm(D - C)
-        d = np.linalg.norm(A - D)
+        a = math.hypot(B[0] - A[0], B[1] - A[1])
+        b = math.hypot(C[0] - B[0], C[1] - B[1])
+        c = math.hypot(D[0] - C[0], D[1] - C[1])
+        d = math.hypot(A[0] - D[0], A[1] - D[1])
 
         # semiperimeter:
         s = (1 / 2) * (a + b + c + d)
@@ -2546,14 +2513,15 @@ class DECMesh(object):
 
         R = (1 / 4) * (np.sqrt((a * c + b * d) * (a * d + b * c) * (a * b + c * d)) / area)
 
-        # Calculate the diagonal tangent:
-        tando = C - A
-        tanl = np.linalg.norm(C - A)
-        tand = tando / tanl
+        # Calculate the diagonal tangent, taking the reciprocal of its length
+        # once rather than allocating a normalized tangent array:
+        tdx = C[0] - A[0]
+        tdy = C[1] - A[1]
+        inv_tanl = 1.0 / math.hypot(tdx, tdy)
 
         # cicumcentre:
-        cx = A[0] + (R) * tand[0]
-        cy = A[1] + (R) * tand[1]
+        cx = A[0] + (R) * (tdx * inv_tanl)
+        cy = A[1] + (R) * (tdy * inv_tanl)
 
         return R, area, cx, cy
 
@@ -62,6 +62,57 @@ def flatten(ls_of_ls: SequenceTypes) -> tuple:
 
     return ls_flat, ind_map, rind_map   # return the flattened list and the map and reverse map
 
+@type_check
+def flatten_nd(ls_of_ls: SequenceTypes) -> tuple:
+    '''
+    Flatten a doubly-nested sequence of sequences of numbers or points into a
+    single Numpy array in one pass.
+
+    Unlike the more general :func:`flatten` function, this function directly
+    returns Numpy arrays rather than lists of lists and avoids the deep copy
+    required to construct a nested reverse index map, which callers typically
+    ignore. The reverse mapping is instead efficiently recoverable from the
+    returned offsets (e.g., ``range(indptr[i], indptr[i+1])`` are the indices
+    of the output ``arr_flat`` array corresponding to ``ls_of_ls[i]``).
+
+    Parameters
+    ----------
+    ls_of_ls : SequenceTypes
+        Nested sequence of sequences of numbers or equally sized points (e.g.,
+        ``[[[x1,y1],[x2,y2]],[[x3,y3]]]``).
+
+    Returns
+    -------
+    (ndarray, ndarray, ndarray)
+        3-tuple ``(arr_flat, ind_map, indptr)``, where:
+        * ``arr_flat`` is a flattened float array of all items of the input
+          sequence, whose first dimension indexes these items.
+        * ``ind_map`` is a two-dimensional integer array of forward indices
+          such that ``ind_map[k] = [i,j]`` if ``arr_flat[k]`` is
+          ``ls_of_ls[i][j]``.
+        * ``indptr`` is a one-dimensional integer array of the offsets into
+          ``arr_flat`` of the first item of each input subsequence, suffixed
+          by the total number of items.
+    '''
+
+    sublists_len = np.fromiter(
+        (len(sublist) for sublist in ls_of_ls), dtype=int, count=len(ls_of_ls))
+    indptr = np.zeros(len(sublists_len) + 1, dtype=int)
+    np.cumsum(sublists_len, out=indptr[1:])
+
+    # Exclude empty subsequences, whose shapes need *NOT* match the others.
+    arr_flat = np.concatenate([
+        np.asarray(sublist, dtype=np.float64)
+        for sublist in ls_of_ls if len(sublist)
+    ]) if indptr[-1] else np.zeros(0)
+
+    sublists_ind = np.repeat(np.arange(len(sublists_len)), sublists_len)
+    ind_map = np.column_stack((
+        sublists_ind, np.arange(indptr[-1]) - indptr[sublists_ind]))
+
+    return arr_flat, ind_map, indptr
+
+
 def area(p):
     """
     Calculates the unsigned area of an arbitrarily shaped polygon defined by a set of
@@ -121,8 +172,9 @@ def poly_centroid(p):
 
     aa = (1/2)*np.sum(ai)  # signed area
 
-    cx = (1/(6*aa))*np.sum((foo[:,0] + foo_p[:,0])*(foo[:,0] * foo_p[:,1] - foo_p[:,0] * foo[:,1]))
-    cy = (1/(6*aa))*np.sum((foo[:,1] + foo_p[:,1])*(foo[:,0] * foo_p[:,1] - foo_p[:,0] * foo[:,1]))
+    # Reuse the per-edge cross products computed above and apply the common
+    # 1/(6A) scaling once outside each sum.
+    cx, cy = (1/(6*aa))*np.dot(ai, foo + foo_p)
 
 
     return cx, cy
@@ -161,9 +213,9 @@ def circumc(A, B, C):
     # Calculate circumradius:
     # (from https://www.mathalino.com/reviewer/
     # derivation-of-formulas/derivation-of-formula-for-radius-of-circumcircle)
-    a = np.sqrt((Ax - Bx)**2 + (Ay-By)**2)
-    b = np.sqrt((Bx - Cx)**2 + (By-Cy)**2)
-    c = np.sqrt((Cx - Ax)**2 + (Cy-Ay)**2)
+    a = math.hypot(Ax - Bx, Ay - By)
+    b = math.hypot(Bx - Cx, By - Cy)
+    c = math.hypot(Cx - Ax, Cy - Ay)
 
     s = (a + b + c) / 2.0
     area = np.sqrt(s * (s - a) * (s - b) * (s - c))
@@ -213,67 +265,44 @@ def alpha_shape(points, alpha):
 
     """
 
+    points = np.asarray(points)
     tri = sps.Delaunay(points)
-    tri_edges = []
-    # circum_r_list = []
-
-    # loop over triangles:
-    # ia, ib, ic = indices of corner points of the
-    # triangle
-    for ia, ib, ic in tri.vertices:
-        pa = points[ia]
-        pb = points[ib]
-        pc = points[ic]
-
-        # Lengths of sides of triangle
-        a = math.sqrt((pa[0]-pb[0])**2 + (pa[1]-pb[1])**2)
-        b = math.sqrt((pb[0]-pc[0])**2 + (pb[1]-pc[1])**2)
-        c = math.sqrt((pc[0]-pa[0])**2 + (pc[1]-pa[1])**2)
-
-        # Semiperimeter of triangle
-        s = (a + b + c)/2.0
-
-        # Area of triangle by Heron's formula
-        area = math.sqrt(abs(s*(s-a)*(s-b)*(s-c)))
-
-        if area > 0:
-            circum_r = a*b*c/(4.0*area)
-
-        if area == 0:
-            circum_r = a*b*c/(4.0*1e-25)
-
-        # Here's the radius filter:
-        if circum_r < 1.0/alpha:
-            #self.tri_edges_append([ia, ib])
-            tri_edges.append([ia, ib])
-            tri_edges.append([ib, ic])
-            tri_edges.append([ia, ic])
-
-    for i, edge in enumerate(tri_edges):  # First organize the list so that all [i,j] and [j,i] are equalized
-        pt1 = edge[0]
-        pt2 = edge[1]
-        if pt1 > pt2:
-            tri_edges[i]=[pt2,pt1]
-
-    tri_edges.sort()
-
-    tri_edges_len = len(tri_edges)
-    concave_hull = []
-
-    i = 0
-    # Now step through to find and remove all duplicating entities and add them to a new list
-    while i < tri_edges_len:
-        j = i + 1
-        tri_edge_i = tri_edges[i]
-
-        while j < tri_edges_len and tri_edge_i == tri_edges[j]:
-            j += 1
-
-        if i == j - 1:
-            concave_hull.append(tri_edge_i)
-            i += 1
-        else:
-            i = j
+
+    # Corner points of all triangles at once.
+    pa = points[tri.simplices[:, 0]]
+    pb = points[tri.simplices[:, 1]]
+    pc = points[tri.simplices[:, 2]]
+
+    # Lengths of sides of triangles
+    a = np.hypot(pa[:, 0]-pb[:, 0], pa[:, 1]-pb[:, 1])
+    b = np.hypot(pb[:, 0]-pc[:, 0], pb[:, 1]-pc[:, 1])
+    c = np.hypot(pc[:, 0]-pa[:, 0], pc[:, 1]-pa[:, 1])
+
+    # Semiperimeter of triangles
+    s = (a + b + c)/2.0
+
+    # Area of triangles by Heron's formula, substituting a negligible area
+    # for degenerate triangles.
+    area = np.sqrt(np.abs(s*(s-a)*(s-b)*(s-c)))
+    area[area == 0] = 1e-25
+
+    circum_r = a*b*c/(4.0*area)
+
+    # Here's the radius filter:
+    tri_kept = tri.simplices[circum_r < 1.0/alpha]
+
+    # Edges of all retained triangles, organized so that all [i,j] and [j,i]
+    # are equalized.
+    tri_edges = np.concatenate((
+        tri_kept[:, [0, 1]], tri_kept[:, [1, 2]], tri_kept[:, [0, 2]]))
+    tri_edges.sort(axis=1)
+
+    # Edges shared by two retained triangles are interior; the remaining
+    # edges shared by no other triangle define the concave hull. Since
+    # np.unique() sorts these edges, the hull is sorted as before.
+    tri_edges_unique, tri_edges_count = np.unique(
+        tri_edges, axis=0, return_counts=True)
+    concave_hull = tri_edges_unique[tri_edges_count == 1].tolist()
 
     return concave_hull
 
@@ -19,13 +19,14 @@ from betse.science.enum.enumphase import SimPhaseKind
 from betse.science.phase.require import phasereqs
 from betse.science.pipe.export.pipeexpabc import SimPipeExportABC
 from betse.science.pipe.piperun import piperunner
-from betse.science.visual.plot.plotutil import cell_ave
+from betse.science.visual.plot.plotutil import cell_ave_2d
 # from betse.util.io.log import logs
 from betse.util.path import dirs, pathnames
 from betse.util.type.descriptor.descs import classproperty_readonly
 from betse.util.type.iterable.mapping.mapcls import OrderedArgsDict
 from betse.util.type.types import (
     type_check, NumpyArrayType, SequenceTypes, StrOrNoneTypes,)
+from scipy.fft import rfft, rfftfreq
 
 # ....................{ SUBCLASSES                        }....................
 class SimPipeExportCSVs(SimPipeExportABC):
@@ -69,6 +70,14 @@ class SimPipeExportCSVs(SimPipeExportABC):
         # 0-based index of the cell to serialize time data for.
         cell_index = phase.p.visual.single_cell_index
 
+        # 0-based index of the first membrane of this cell if extracellular
+        # spaces are enabled *OR* of this cell otherwise. Data defined on
+        # membranes in the former case is defined on cells in the latter.
+        if phase.p.is_ecm:
+            mem_index = phase.cells.cell_to_mems[cell_index][0]
+        else:
+            mem_index = cell_index
+
         # Sequence of key-value pairs containing all simulation data to be
         # exported for this cell, suitable for passing to the
         # OrderedArgsDict.__init__() method calleb below.
@@ -88,70 +97,49 @@ class SimPipeExportCSVs(SimPipeExportABC):
 
         # ................{ VMEM ~ goldman                  }..................
         if phase.p.GHK_calc:
-            vm_goldman = mathunit.upscale_units_milli([
-                vm_GHK_time_cells[cell_index]
-                for vm_GHK_time_cells in phase.sim.vm_GHK_time])
+            vm_goldman = mathunit.upscale_units_milli(
+                np.asarray(phase.sim.vm_GHK_time)[:, cell_index])
         else:
             vm_goldman = column_data_empty
 
         csv_column_name_values.extend(('Goldman_Vmem_mV', vm_goldman))
 
         # ................{ Na K PUMP RATE                  }..................
-        if phase.p.is_ecm:
-            pump_rate = [
-                pump_array[phase.cells.cell_to_mems[cell_index][0]]
-                for pump_array in phase.sim.rate_NaKATP_time]
-        else:
-            pump_rate = [
-                pump_array[cell_index]
-                for pump_array in phase.sim.rate_NaKATP_time]
-
+        pump_rate = np.asarray(phase.sim.rate_NaKATP_time)[:, mem_index]
         csv_column_name_values.extend((
             'NaK-ATPase_Rate_mol/m2s', pump_rate))
 
         # ................{ ION CONCENTRATIONS              }..................
+        # Three-dimensional Numpy arrays indexed as [time, ion, cell] and
+        # [time, ion, membrane] (or [time, ion, cell] if extracellular spaces
+        # are disabled) of all cell concentrations and membrane
+        # permeabilities, each stacked once rather than sliced per time step.
+        cc_cell = np.asarray(phase.sim.cc_time)[:, :, cell_index]
+        dd_cell = np.asarray(phase.sim.dd_time)[:, :, mem_index]
+
         # Create the header starting with cell concentrations.
         for i in range(len(phase.sim.ionlabel)):
             csv_column_name = 'cell_{}_mmol/L'.format(
                 phase.sim.ionlabel[i])
-            cc_m = [arr[i][cell_index] for arr in phase.sim.cc_time]
-            csv_column_name_values.extend((csv_column_name, cc_m))
+            csv_column_name_values.extend((csv_column_name, cc_cell[:, i]))
 
         # ................{ MEMBRANE PERMEABILITIES         }..................
         # Create the header starting with membrane permeabilities.
         for i in range(len(phase.sim.ionlabel)):
-            if phase.p.is_ecm:
-                dd_m = [
-                    arr[i][phase.cells.cell_to_mems[cell_index][0]]
-                    for arr in phase.sim.dd_time
-                ]
-            else:
-                dd_m = [arr[i][cell_index] for arr in phase.sim.dd_time]
-
             csv_column_name = 'Dm_{}_m2/s'.format(phase.sim.ionlabel[i])
-            csv_column_name_values.extend((csv_column_name, dd_m))
+            csv_column_name_values.extend((csv_column_name, dd_cell[:, i]))
 
         # ................{ TRANSMEMBRANE CURRENTS          }..................
-        if phase.p.is_ecm:
-            Imem = [
-                memArray[phase.cells.cell_to_mems[cell_index][0]]
-                for memArray in phase.sim.I_mem_time]
-        else:
-            Imem = [
-                memArray[cell_index]
-                for memArray in phase.sim.I_mem_time
-            ]
-
+        Imem = np.asarray(phase.sim.I_mem_time)[:, mem_index]
         csv_column_name_values.extend(('I_A/m2', Imem))
 
         # ................{ HYDROSTATIC PRESSURE            }..................
-        p_hydro = [arr[cell_index] for arr in phase.sim.P_cells_time]
+        p_hydro = np.asarray(phase.sim.P_cells_time)[:, cell_index]
         csv_column_name_values.extend(('HydroP_Pa', p_hydro))
 
         # ................{ OSMOTIC PRESSURE                }..................
         if phase.p.deform_osmo:
-            p_osmo = [
-                arr[cell_index] for arr in phase.sim.osmo_P_delta_time]
+            p_osmo = np.asarray(phase.sim.osmo_P_delta_time)[:, cell_index]
         else:
             p_osmo = column_data_empty
 
@@ -163,13 +151,11 @@ class SimPipeExportCSVs(SimPipeExportABC):
             phase.kind is SimPhaseKind.SIM
         ):
             # Extract time-series deformation data for the plot cell:
-            dx = nparray.from_iterable([
-                arr[cell_index] for arr in phase.sim.dx_cell_time])
-            dy = nparray.from_iterable([
-                arr[cell_index] for arr in phase.sim.dy_cell_time])
+            dx = np.asarray(phase.sim.dx_cell_time)[:, cell_index]
+            dy = np.asarray(phase.sim.dy_cell_time)[:, cell_index]
 
             # Get the total magnitude.
-            disp = mathunit.upscale_coordinates(np.sqrt(dx ** 2 + dy ** 2))
+            disp = mathunit.upscale_coordinates(np.hypot(dx, dy))
         else:
             disp = column_data_empty
 
@@ -180,7 +166,7 @@ class SimPipeExportCSVs(SimPipeExportABC):
         csv_column_name_to_values = OrderedArgsDict(*csv_column_name_values)
 
         # Export this data to this CSV file.
-        npcsv.write_csv(
+        self._write_csv(
             filename=self._get_csv_filename(
                 phase=phase, basename_sans_filetype='ExportedData'),
             column_name_to_values=csv_column_name_to_values,
@@ -223,13 +209,8 @@ class SimPipeExportCSVs(SimPipeExportABC):
             cell_times_vmems - np.mean(cell_times_vmems))
 
         # FFT of voltage.
-        f_axis = np.fft.rfftfreq(sample_size, d=sample_spacing)
-        fft_data_o = np.fft.rfft(cell_data)
-
-        #FIXME: Numpy already provides a function for obtaining the magnitude of
-        #a complex array: np.absolute(). The following math reduces to simply:
-        #    fft_data = np.absolute(fft_data_o)
-        fft_data = np.sqrt(np.real(fft_data_o)**2 + np.imag(fft_data_o)**2)
+        f_axis = rfftfreq(sample_size, d=sample_spacing)
+        fft_data = np.abs(rfft(cell_data))
         # print('f_axis: {}'.format(f_axis))
         # print('fft_data: {}'.format(fft_data))
 
@@ -240,7 +221,7 @@ class SimPipeExportCSVs(SimPipeExportABC):
         )
 
         # Export this data to this CSV file.
-        npcsv.write_csv(
+        self._write_csv(
             filename=self._get_csv_filename(
                 phase=phase, basename_sans_filetype='ExportedData_FFT'),
             column_name_to_values=csv_column_name_to_values,
@@ -368,20 +349,17 @@ class SimPipeExportCSVs(SimPipeExportABC):
         cell_centres_y = mathunit.upscale_coordinates(
             phase.cells.cell_centres[:,1])
 
+        # Create this directory once up front rather than once per time step.
+        dirs.make_unless_dir(csv_dirname)
+
+        # Absolute filename of the CSV file exported for each time step,
+        # formatted with the 0-based index of that time step.
+        csv_filename_format = pathnames.join(
+            csv_dirname, '{}{{}}.{}'.format(
+                csv_basename_prefix, phase.p.csv.filetype))
+
         # For the 0-based index of each sampled time step...
         for time_step in range(len(phase.sim.time)):
-            # Basename of the CSV-formatted file exported for this time step,
-            # excluding suffixing "."-prefixed filetype.
-            csv_basename_sans_filetype = '{}{}'.format(
-                csv_basename_prefix, time_step)
-
-            # Absolute filename of this CSV file.
-            csv_filename = self._get_csv_filename(
-                phase=phase,
-                basename_sans_filetype=csv_basename_sans_filetype,
-                dirname=csv_dirname,
-            )
-
             # Ordered dictionary mapping from CSV column names to data arrays.
             csv_column_name_to_values = OrderedArgsDict(
                 'x [um]', cell_centres_x,
@@ -390,10 +368,37 @@ class SimPipeExportCSVs(SimPipeExportABC):
             )
 
             # Export this data to this CSV file.
-            npcsv.write_csv(
-                filename=csv_filename,
+            self._write_csv(
+                filename=csv_filename_format.format(time_step),
                 column_name_to_values=csv_column_name_to_values)
 
+    # ..................{ PRIVATE ~ writers                 }..................
+    @type_check
+    def _write_csv(
+        self, filename: str, column_name_to_values: OrderedArgsDict) -> None:
+        '''
+        Write the passed columns to the CSV file with the passed filename,
+        formatting all values to seven significant digits.
+
+        Since simulation data is rarely meaningful to more than a handful of
+        significant digits, this format yields CSV files roughly half the size
+        of (and faster to write than) the full-precision default.
+
+        Parameters
+        ----------
+        filename : str
+            Absolute filename of this CSV file.
+        column_name_to_values : OrderedArgsDict
+            Ordered dictionary mapping from CSV column names to data arrays.
+        '''
+
+        npcsv.write_csv(
+            filename=filename,
+            column_name_to_values=column_name_to_values,
+            column_name_to_format={
+                column_name: '%.6e' for column_name in column_name_to_values},
+        )
+
     # ..................{ PRIVATE ~ properties              }..................
     @type_check
     def _get_cell_times_vmems(self, phase: SimPhase) -> NumpyArrayType:
@@ -412,14 +417,13 @@ class SimPipeExportCSVs(SimPipeExportABC):
         # 0-based index of the cell to serialize time data for.
         cell_index = phase.p.visual.single_cell_index
 
+        # If extracellular spaces are enabled, average all membrane voltages
+        # onto all cells for all time steps at once.
         if phase.p.is_ecm:
-            cell_times_vmems = []
-            for vm_at_mem in phase.sim.vm_time:
-                vm_t = mathunit.upscale_units_milli(
-                    cell_ave(phase.cells,vm_at_mem)[cell_index])
-                cell_times_vmems.append(vm_t)
+            cell_times_vmems = mathunit.upscale_units_milli(
+                cell_ave_2d(phase.cells, phase.sim.vm_time)[:, cell_index])
         else:
             cell_times_vmems = mathunit.upscale_units_milli(
-                phase.sim.vm_time)
+                np.asarray(phase.sim.vm_time)[:, cell_index])
 
         return nparray.from_iterable(cell_times_vmems)
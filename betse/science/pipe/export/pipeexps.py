@@ -119,54 +119,68 @@ class SimPipesExport(object):
         # SimPipeABC.iter_runners_enabled() generator.
         runners_enabled = []
 
-        # For each available export pipeline...
-        for pipe_export in self._PIPES_EXPORT:
-            # Initialize this pipeline for this phase.
-            pipe_export.init(phase)
-
-            # Append all pipeline runners enabled for this pipeline and phase.
-            runners_enabled.extend(pipe_export.iter_runners_enabled(phase))
-
-        # Notify the caller of the range of work performed by this subcommand.
-        # namely, notify the caller of the total number of times that this
-        # method calls the SimCallbacksBC.progressed() callback or a callback
-        # calling that callback (e.g., SimCallbacksBC.progressed_next()).
-        phase.callbacks.progress_ranged(progress_max=len(runners_enabled))
-
-        # For the method and configuration of each enabled pipeline runner...
-        for runner_method, runner_conf in runners_enabled:
-            # Metadata associated with this runner.
-            runner_metadata = runner_method.metadata
-
-            # Attempt to...
-            try:
-                # Run this runner with this phase and configuration.
-                runner_method(phase, runner_conf)
-
-                #FIXME: Refactor this low-level kludge from the BETSE codebase
-                #into a high-level implementation in the BETSEE codebase. See
-                #the prominent "FIXME" comment in the "pipeabc" submodule for
-                #preliminary work required to begin doing so. For now, this
-                #tragically suffices.
-
-                # Notify the caller of the successful completion of this
-                # runner. Since the prior call failed to raise an exception,
-                # this runner necessarily succeeded.
-                phase.callbacks.progressed_next(
-                    status='Exported {} "{}".'.format(
-                        runner_metadata.noun_singular_lowercase,
-                        runner_metadata.kind))
-            # If this runner's requirements are unsatisfied (e.g., due to the
-            # current simulation configuration disabling fluid flow), notify
-            # the caller of this non-fatal condition and continue.
-            except BetseSimPipeRunnerUnsatisfiedException as exception:
-                phase.callbacks.progressed_next(
-                    status='Excluding {} "{}", as {}.'.format(
-                        runner_metadata.noun_singular_lowercase,
-                        runner_metadata.kind,
-                        exception.reason))
-            # Else if this runner raises any other exception, permit this
-            # exception to propagate up the callstack without intervention.
+        # Attempt to...
+        try:
+            # For each available export pipeline...
+            for pipe_export in self._PIPES_EXPORT:
+                # Initialize this pipeline for this phase.
+                pipe_export.init(phase)
+
+                # Append all pipeline runners enabled for this pipeline and
+                # phase.
+                runners_enabled.extend(
+                    pipe_export.iter_runners_enabled(phase))
+
+            # Notify the caller of the range of work performed by this
+            # subcommand. namely, notify the caller of the total number of
+            # times that this method calls the SimCallbacksBC.progressed()
+            # callback or a callback calling that callback (e.g.,
+            # SimCallbacksBC.progressed_next()).
+            phase.callbacks.progress_ranged(progress_max=len(runners_enabled))
+
+            # For the method and configuration of each enabled runner...
+            for runner_method, runner_conf in runners_enabled:
+                # Metadata associated with this runner.
+                runner_metadata = runner_method.metadata
+
+                # Attempt to...
+                try:
+                    # Run this runner with this phase and configuration.
+                    runner_method(phase, runner_conf)
+
+                    #FIXME: Refactor this low-level kludge from the BETSE
+                    #codebase into a high-level implementation in the BETSEE
+                    #codebase. See the prominent "FIXME" comment in the
+                    #"pipeabc" submodule for preliminary work required to
+                    #begin doing so. For now, this tragically suffices.
+
+                    # Notify the caller of the successful completion of this
+                    # runner. Since the prior call failed to raise an
+                    # exception, this runner necessarily succeeded.
+                    phase.callbacks.progressed_next(
+                        status='Exported {} "{}".'.format(
+                            runner_metadata.noun_singular_lowercase,
+                            runner_metadata.kind))
+                # If this runner's requirements are unsatisfied (e.g., due to
+                # the current simulation configuration disabling fluid flow),
+                # notify the caller of this non-fatal condition and continue.
+                except BetseSimPipeRunnerUnsatisfiedException as exception:
+                    phase.callbacks.progressed_next(
+                        status='Excluding {} "{}", as {}.'.format(
+                            runner_metadata.noun_singular_lowercase,
+                            runner_metadata.kind,
+                            exception.reason))
+                # Else if this runner raises any other exception, permit
+                # this exception to propagate up the callstack without
+                # intervention.
+        # Regardless of whether the above pipelines or runners raised
+        # exceptions, deinitialize each pipeline for this phase (e.g., to close
+        # files). Since deinitializing a pipeline that was never initialized
+        # is safely a noop, this includes pipelines whose initialization was
+        # skipped due to an exception raised by a prior pipeline.
+        finally:
+            for pipe_export in self._PIPES_EXPORT:
+                pipe_export.deinit(phase)
 
         # Unconditionally close all currently open matplotlib figures
         # regardless of whether any of the above runners invoked matplotlib.
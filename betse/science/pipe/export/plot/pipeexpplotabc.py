@@ -75,6 +75,7 @@ from betse.util.io.log import logs
 from betse.util.path import dirs, pathnames
 from betse.util.type.types import type_check
 from matplotlib import pyplot
+from matplotlib.backends.backend_pdf import PdfPages
 
 # ....................{ SUBCLASSES                         }....................
 class SimPipeExportPlotABC(SimPipeExportABC):
@@ -83,9 +84,29 @@ class SimPipeExportPlotABC(SimPipeExportABC):
     objects iteratively displaying and/or saving all plots produced after
     initialization and simulation enabled by the current simulation
     configuration).
+
+    Attributes
+    ----------
+    _pdf_pages : PdfPages, optional
+        Multipage PDF file to which all plots exported by this pipeline are
+        saved as successive pages if the current simulation configuration
+        requests multipage plots *and* at least one such plot has been saved
+        *or* ``None`` otherwise (i.e., if either each plot is saved to a
+        distinct image file or no plot has been saved yet). To avoid leaving
+        empty PDF files on disk for pipelines exporting no plots, this file is
+        lazily opened on saving the first such plot. Defaults to ``None``.
     '''
 
     # ..................{ INITIALIZERS                      }..................
+    def __init__(self, *args, **kwargs) -> None:
+
+        # Initialize our superclass with all passed parameters.
+        super().__init__(*args, **kwargs)
+
+        # Nullify all instance variables for safety.
+        self._pdf_pages = None
+
+
     @type_check
     def init(self, phase: SimPhase) -> None:
 
@@ -97,11 +118,64 @@ class SimPipeExportPlotABC(SimPipeExportABC):
         if phase.p.plot.is_after_sim_save:
             dirs.make_unless_dir(phase.export_dirname)
 
+        # Nullify the multipage PDF file possibly opened by the _export()
+        # method for this phase. Since this pipeline could export no plots,
+        # this file is intentionally *NOT* opened here.
+        self._pdf_pages = None
+
+
+    @type_check
+    def deinit(self, phase: SimPhase) -> None:
+
+        # Deinitialize our superclass.
+        super().deinit(phase)
+
+        # If a multipage PDF file was opened by a prior _export() call, close
+        # this file, writing all pages appended to this file to disk.
+        if self._pdf_pages is not None:
+            self._pdf_pages.close()
+            self._pdf_pages = None
+
     # ..................{ SUPERCLASS                        }..................
     @type_check
     def _is_enabled(self, phase: SimPhase) -> bool:
         return phase.p.plot.is_after_sim
 
+    # ..................{ PRIVATE ~ openers                 }..................
+    @type_check
+    def _open_pdf_pages(self, phase: SimPhase) -> PdfPages:
+        '''
+        Open and return the multipage PDF file to which all plots exported by
+        this pipeline for the passed simulation phase are saved as successive
+        pages.
+
+        Parameters
+        ----------
+        phase : SimPhase
+            Current simulation phase.
+
+        Returns
+        ----------
+        PdfPages
+            Multipage PDF file opened for this pipeline.
+        '''
+
+        # Basename excluding filetype of this file, derived from the
+        # human-readable noun describing this pipeline's plots (e.g.,
+        # "single_cell_plots" from "single-cell plots").
+        basename = self._noun_plural_lowercase.replace(
+            ' ', '_').replace('-', '_')
+
+        # Absolute path of this file.
+        filename = pathnames.join(
+            phase.export_dirname, 'fig_{}.pdf'.format(basename))
+
+        # Log this opening attempt.
+        logs.log_debug('Opening multipage plot file: %s', filename)
+
+        # Open and return this file.
+        return PdfPages(filename)
+
     # ..................{ PRIVATE ~ preparers               }..................
     @type_check
     def _export_prep(self, phase: SimPhase) -> None:
@@ -174,8 +248,23 @@ class SimPipeExportPlotABC(SimPipeExportABC):
             # _export_prep() call.
             matplotlib.interactive(False)
 
-        # If saving this plot...
-        if phase.p.plot.is_after_sim_save:
+        # If saving this plot as the next page of a multipage PDF file...
+        if (phase.p.plot.is_after_sim_save and
+            phase.p.plot.is_image_multipage):
+            # If this is the first plot saved by this pipeline, open this file.
+            if self._pdf_pages is None:
+                self._pdf_pages = self._open_pdf_pages(phase)
+
+            # Log this saving attempt.
+            logs.log_debug('Saving plot page: %s', basename)
+
+            # Append this plot to this file as a new page.
+            self._pdf_pages.savefig(
+                dpi=phase.p.plot.image_dpi,
+                transparent=True,
+            )
+        # Else if saving this plot to a distinct image file...
+        elif phase.p.plot.is_after_sim_save:
             # Filetype and basename of the file to be saved.
             filetype = phase.p.plot.image_filetype
             basename = 'fig_{}.{}'.format(basename, filetype)
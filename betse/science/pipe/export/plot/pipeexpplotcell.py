@@ -21,6 +21,26 @@ from betse.science.visual.plot import plotutil
 from betse.util.type.descriptor.descs import classproperty_readonly
 from betse.util.type.types import type_check, SequenceTypes
 from matplotlib import pyplot
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+
+# ....................{ CONSTANTS                         }....................
+_ION_NAME_LABEL_COLORS = (
+    ('Ca', 'Ca2+', 'm'),
+    ('M',  'M-',   'r'),
+    ('K',  'K+',   'b'),
+    ('Na', 'Na+',  'g'),
+)
+'''
+Tuple of 3-tuples ``(ion_name, ion_label, ion_color)`` describing each
+principal ion plotted by the
+:meth:`SimPipeExportPlotCell.export_ion_concentrations` exporter, where:
+
+* ``ion_name`` is the key of this ion in the
+  :attr:`betse.science.parameters.Parameters.ions_dict` dictionary.
+* ``ion_label`` is the human-readable legend label of this ion.
+* ``ion_color`` is the matplotlib-specific line colour of this ion.
+'''
 
 # ....................{ SUBCLASSES                        }....................
 class SimPipeExportPlotCell(SimPipeExportPlotABC):
@@ -164,6 +184,72 @@ class SimPipeExportPlotCell(SimPipeExportPlotABC):
         self._export(phase=phase, basename='Displacement_time')
 
     # ..................{ EXPORTERS ~ cell : ion            }..................
+    @piperunner(
+        categories=('Ion Concentration', 'All',),
+        requirements=phasereqs.SOLVER_FULL,
+    )
+    def export_ion_concentrations(
+        self, phase: SimPhase, conf: SimConfExportPlotCell) -> None:
+        '''
+        Plot the concentrations of all enabled principal ions (i.e., Ca2+, M-,
+        K+, and Na+) for the single cell indexed by the current simulation
+        configuration over all sampled time steps on the same axes.
+
+        Unlike the ion-specific exporters below (each creating one figure
+        containing one line), this exporter creates one figure containing one
+        line collection of all such ions, amortizing the cost of figure, axes,
+        and artist creation across these ions.
+        '''
+
+        # Prepare to export the current plot.
+        self._export_prep(phase)
+
+        # 0-based index of the cell to plot.
+        cell_index = phase.p.visual.single_cell_index
+
+        # One-dimensional Numpy array of all sampled time steps.
+        times = np.asarray(phase.sim.time)
+
+        # Two-dimensional Numpy array of all ion concentrations for this cell,
+        # whose first dimension indexes sampled time steps and whose second
+        # dimension indexes ions.
+        times_cell_ions = np.asarray(phase.sim.cc_time)[:, :, cell_index]
+
+        # Sequences of the line segments, colours, and legend proxies of all
+        # enabled principal ions.
+        ion_segments = []
+        ion_colors = []
+        ion_legend_lines = []
+
+        # For the name, label, and colour of each principal ion...
+        for ion_name, ion_label, ion_color in _ION_NAME_LABEL_COLORS:
+            # If this ion is disabled by the ion profile, ignore this ion.
+            if phase.p.ions_dict[ion_name] != 1:
+                continue
+
+            # 0-based index of this ion in all ion concentration arrays.
+            ion_index = getattr(phase.sim, 'i' + ion_name)
+
+            ion_segments.append(np.column_stack(
+                (times, times_cell_ions[:, ion_index])))
+            ion_colors.append(ion_color)
+            ion_legend_lines.append(Line2D(
+                [], [], color=ion_color, label=ion_label))
+
+        pyplot.figure()
+        axConcs = pyplot.subplot(111)
+        axConcs.add_collection(LineCollection(ion_segments, colors=ion_colors))
+        axConcs.autoscale()
+        axConcs.legend(handles=ion_legend_lines)
+        axConcs.set_xlabel('Time [s]')
+        axConcs.set_ylabel('Concentration [mol/m3]')
+        axConcs.set_title(
+            'Ion concentrations in cell {}'.format(cell_index))
+
+        # Export this plot to disk and/or display.
+        self._export(phase=phase, basename='conc_time')
+
+
     @piperunner(
         categories=('Ion Concentration', 'M anion'),
         requirements=phasereqs.ION_M_ANION,
@@ -19,7 +19,6 @@ from betse.science.pipe.export.plot.pipeexpplotabc import SimPipeExportPlotABC
 from betse.science.pipe.piperun import piperunner
 from betse.science.visual.plot import plotutil
 from betse.util.io.log import logs
-from betse.util.type.iterable import iterget
 from betse.util.type.descriptor.descs import classproperty_readonly
 from betse.util.type.types import type_check, SequenceTypes
 from collections import OrderedDict
@@ -124,7 +123,6 @@ class SimPipeExportPlotCells(SimPipeExportPlotABC):
         cells = phase.cells
         colormap = phase.p.background_cm
 
-        col_dic = {}
         cb_ticks = []
         cb_tick_labels = []
 
@@ -192,58 +190,55 @@ class SimPipeExportPlotCells(SimPipeExportPlotABC):
                 profile_name_to_cells_index[cut_name] = (
                     cut_profile.picker.pick_cells(cells=cells, p=p))
 
-        # Minimum and maximum 0-based integers uniquely identifying the first
-        # and last tissue and cut profile (respoctively), localized for
-        # ordering purposes in the colorbar legend.
-        profile_zorder = 0
+        # Maximum 1-based integer uniquely identifying the last tissue and cut
+        # profile, localized for ordering purposes in the colorbar legend.
         profile_zorder_max = len(profile_name_to_cells_index)
 
+        # One-dimensional Numpy array mapping from the 0-based index of each
+        # cell to the 1-based integer identifying the last tissue or cut
+        # profile containing this cell *OR* 0 if no profile contains this cell.
+        # Since each profile overwrites all prior profiles containing the same
+        # cells, each cell is coloured by the last such profile -- exactly as
+        # if each profile were drawn above all prior profiles.
+        cells_zorder = np.zeros(len(cells.cell_i))
+
         # For the name and one-dimensional Numpy array of the 0-based indices
         # of all cells in each tissue and/or cut profile...
-        for profile_name, profile_cells_index in (
-            profile_name_to_cells_index.items()):
+        for profile_zorder, (profile_name, profile_cells_index) in enumerate(
+            profile_name_to_cells_index.items(), start=1):
             # logs.log_debug('Plotting tissue "%s"...', profile_name)
-            profile_zorder += 1
-
-            profile_points = mathunit.upscale_coordinates(
-                cells.cell_verts[profile_cells_index])
-
-            z = np.zeros(len(profile_points))
-            z[:] = profile_zorder
-
-            col_dic[profile_name] = PolyCollection(
-                profile_points, array=z, cmap=colormap, edgecolors='none')
-            col_dic[profile_name].set_clim(0, profile_zorder_max)
-
-            # col_dic[profile_name].set_alpha(0.8)
-            col_dic[profile_name].set_zorder(profile_zorder)
-            ax.add_collection(col_dic[profile_name])
+            cells_zorder[profile_cells_index] = profile_zorder
 
             # Add this profile name to the colour legend.
             cb_ticks.append(profile_zorder)
             cb_tick_labels.append(profile_name)
 
+        # One-dimensional Numpy array of the 0-based indices of all cells
+        # contained in one or more profiles.
+        profiles_cells_index = cells_zorder.nonzero()[0]
+
+        # Plot all cells of all profiles as a single collection rather than
+        # one collection per profile.
+        profiles_col = PolyCollection(
+            phase.cache.upscaled.cells_vertices_coords[profiles_cells_index],
+            array=cells_zorder[profiles_cells_index],
+            cmap=colormap,
+            edgecolors='none',
+        )
+        profiles_col.set_clim(0, profile_zorder_max)
+        ax.add_collection(profiles_col)
+
         # logs.log_debug('Plotting colorbar ticks: %r', cb_ticks)
         # logs.log_debug('Plotting colorbar tick labels: %r', cb_tick_labels)
 
         ax_cb = None
         if dyna.tissue_name_to_profile:
-            # Name of the first tissue profile.
-            tissue_first_name = iterget.get_item_first(
-                dyna.tissue_name_to_profile.keys())
-
-            # Color mappable associated with this tissue profile, guaranteed in
-            # this case to be a "PolyCollection" instance.
-            tissue_first_mappable = col_dic[tissue_first_name]
-
-            ax_cb = fig.colorbar(tissue_first_mappable, ax=ax, ticks=cb_ticks)
+            ax_cb = fig.colorbar(profiles_col, ax=ax, ticks=cb_ticks)
             ax_cb.ax.set_yticklabels(cb_tick_labels)
 
         if p.visual.is_show_cell_indices:
-            for i, cll in enumerate(cells.cell_centres):
-                ax.text(
-                    p.um*cll[0], p.um*cll[1], i,
-                    ha='center', va='center', zorder=20)
+            plotutil.plot_index_labels(
+                ax, cells.cell_centres, p, zorder=20, max_labels=None)
 
         ax.set_xlabel('Spatial Distance [um]')
         ax.set_ylabel('Spatial Distance [um]')
@@ -602,8 +597,7 @@ class SimPipeExportPlotCells(SimPipeExportPlotABC):
         ax_x = pyplot.subplot(111)
 
         if phase.p.showCells:
-            base_points = mathunit.upscale_coordinates(
-                phase.cells.cell_verts)
+            base_points = phase.cache.upscaled.cells_vertices_coords
             col_cells = PolyCollection(
                 base_points, facecolors='k', edgecolors='none')
             col_cells.set_alpha(0.3)
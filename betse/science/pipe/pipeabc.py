@@ -330,6 +330,26 @@ class SimPipeABC(object, metaclass=SimPipeABCMeta):
 
         pass
 
+
+    @type_check
+    def deinit(self, phase: SimPhase) -> None:
+        '''
+        Deinitialize this pipeline for the passed simulation phase.
+
+        Defaults to a noop. Pipeline subclasses may override this method to
+        release state acquired by the prior call to the :meth:`init` method
+        (e.g., to close external files written to by pipeline runners for this
+        phase). This method is guaranteed to be called after running all
+        pipeline runners, even if one of these runners raises an exception.
+
+        Parameters
+        ----------
+        phase : SimPhase
+            Current simulation phase.
+        '''
+
+        pass
+
     # ..................{ SUBCLASS ~ methods                 }..................
     # Subclasses are required to implement the following abstract methods.
 
@@ -315,15 +315,15 @@ def cell_ave(cells,vm_at_mem):
 
     """
 
-    v_cell = []
-
-    for i in cells.cell_i:
-        cellinds = (cells.mem_to_cells == i).nonzero()
-        v_cell_array = vm_at_mem[cellinds]
-        v_cell_ave = np.mean(v_cell_array)
-        v_cell.append(v_cell_ave)
-
-    v_cell = np.asarray(v_cell)
+    # Sum the values of all membranes of each cell and divide by the number
+    # of these membranes in two linear passes over the membrane-to-cell
+    # mapping, rather than scanning this mapping once per cell.
+    cells_num = len(cells.cell_i)
+    v_cell_sum = np.bincount(
+        cells.mem_to_cells, weights=vm_at_mem, minlength=cells_num)
+    mems_num = np.bincount(cells.mem_to_cells, minlength=cells_num)
+
+    v_cell = v_cell_sum/mems_num
 
     return v_cell
 
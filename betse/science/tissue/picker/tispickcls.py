@@ -291,8 +291,9 @@ class TissuePickerPercent(TissuePickerABC):
         # Total number of cells to randomly select from this cluster.
         data_fraction = int((self.cells_percent/100)*data_length)
 
-        cell_i_copy = cells.cell_i[:]
-        np.random.shuffle(cell_i_copy)
+        # Shuffle a copy of these indices rather than the cell cluster's own
+        # array, which slicing would merely view.
+        cell_i_copy = np.random.permutation(cells.cell_i)
 
         # For simplicity, non-randomly select the indices of the first
         # "data_fraction"-th cells in this cluster. While technically
@@ -55,6 +55,10 @@ class TissuePickerImageMask(object):
     clipping_function_fast : func
         Fast variant of :attr:`clipping_function`, but otherwise sharing the
         same API.
+    clipping_spline : RectBivariateSpline
+        Linear SciPy-based spline underlying :attr:`clipping_function`,
+        evaluating arbitrarily many scattered ``(x, y)`` points in a single
+        vectorized call when passed ``grid=False``.
     msize : int
         Size in pixels of each square dimension of this image, equivalent to
         both the width and height of this image.
@@ -157,6 +161,13 @@ class TissuePickerImageMask(object):
         self.clipping_function_fast = RectBivariateSpline(
             xpts, ypts, self.clipping_matrix)
 
+        # Linear spline interpolating the same values as the above
+        # "clipping_function" (whose transposition of the passed Z values this
+        # transposition mirrors), but additionally supporting pointwise
+        # evaluation of scattered points.
+        self.clipping_spline = RectBivariateSpline(
+            xpts, ypts, self.clipping_matrix.T, kx=1, ky=1)
+
         # Store some additional information relating to bounding polygon of the
         # clipping image.
         Xclip, Yclip = np.meshgrid(xpts, ypts)
@@ -206,22 +217,19 @@ class TissuePickerImageMask(object):
             One-dimensional Numpy array of the indices of all clipped points.
         '''
 
-        # List of the indices of all passed points clipped by this method.
-        clipped_points_index = []
-
-        # For the index and X and Y coordinate of each passed point...
-        for points_index, (x, y) in enumerate(zip(points_x, points_y)):
-            # If this point resides inside this image mask, clip this point.
-            if self.clipping_function(x,y) != 0.0:
-                clipped_points_index.append(points_index)
-
-        # Coerce this possibly empty list into a guaranteed integer Numpy array.
-        # Since Numpy has no means of deciding whether an empty list should be
-        # coerced into an integer or floating point Numpy array, Numpy sensibly
-        # defaults to the latter functionality. While that's typically what one
-        # wants, that is *NOT* what callers expect in this case. For caller
-        # sanity, Numpy *MUST* be instructed to produce an integer array.
-        return np.asarray(clipped_points_index, dtype=int)
+        # One-dimensional Numpy array of the interpolated mask value at each
+        # passed point, evaluated pointwise (rather than over the grid spanned
+        # by these coordinates) in a single vectorized call.
+        points_value = self.clipping_spline(
+            np.asarray(points_x, dtype=float),
+            np.asarray(points_y, dtype=float),
+            grid=False,
+        )
+
+        # Return the indices of all points residing inside this image mask.
+        # Note that np.flatnonzero() guarantees an integer Numpy array, even
+        # when no points are clipped.
+        return np.flatnonzero(points_value != 0.0)
 
 # ....................{ CLASSES ~ picker                   }....................
 class TissuePickerImage(TissuePickerABC):
@@ -1120,30 +1120,23 @@ class TissueHandler(object):
             sim.endo_retic.remove_ers(sim, target_inds_cell)
 
         #------------------------------ Fix-up cell world ---------------------
-        new_cell_centres = []
-        new_ecm_verts = []
-        removal_flags = np.zeros(len(cells.cell_i))
-        removal_flags[target_inds_cell] = 1
-
-        for i, flag in enumerate(removal_flags):
-            if flag == 0:
-                new_cell_centres.append(cells.cell_centres[i])
-                new_ecm_verts.append(cells.ecm_verts[i])
+        # Boolean mask of all cells surviving this cut, selecting their
+        # centres with a single fancy index.
+        cells_kept = np.ones(len(cells.cell_i), dtype=bool)
+        cells_kept[target_inds_cell] = False
+
+        new_ecm_verts = [
+            ecm_verts
+            for ecm_verts, is_kept in zip(cells.ecm_verts, cells_kept)
+            if is_kept
+        ]
 
-        cells.cell_centres = np.asarray(new_cell_centres)
+        cells.cell_centres = np.asarray(cells.cell_centres)[cells_kept]
         cells.ecm_verts = np.asarray(new_ecm_verts, dtype=object)
 
         # recalculate ecm_verts_unique:
-        ecm_verts_flat,_,_ = tb.flatten(cells.ecm_verts)
-        ecm_verts_set = set()
-
-        for vert in ecm_verts_flat:
-            ptx = vert[0]
-            pty = vert[1]
-            ecm_verts_set.add((ptx,pty))
-
-        cells.ecm_verts_unique = [list(verts) for verts in list(ecm_verts_set)]
-        cells.ecm_verts_unique = np.asarray(cells.ecm_verts_unique)  # convert to numpy array
+        ecm_verts_flat,_,_ = tb.flatten_nd(cells.ecm_verts)
+        cells.ecm_verts_unique = np.unique(ecm_verts_flat, axis=0)
 
         #-----------------------------------------------------------------
         logs.log_info('Recalculating cluster variables for new configuration...')
@@ -7,35 +7,28 @@ Layer subclasses printing text over the current cell cluster.
 '''
 
 # ....................{ IMPORTS                            }....................
-from betse.science.math import mathunit
 from betse.science.visual.layer.lyrabc import LayerCellsABC
+from betse.science.visual.plot import plotutil
 
 # ....................{ CLASSES                            }....................
 class LayerCellsIndex(LayerCellsABC):
     '''
     Layer printing the 0-based index of each cell in the cell cluster as a text
     label centered on that cell.
+
+    Unlike most plots, this layer labels *all* cells regardless of the size of
+    this cluster, as explicitly requested by enabling this layer.
     '''
 
     # ..................{ SUPERCLASS                         }..................
     def _layer_first(self) -> None:
 
-        # For the 0-based index and 2-tuple of X and Y coordinates of the center
-        # of each cell, display this index centered at these coordinates.
-        for cell_index, cell_center in enumerate(
-            self._phase.cells.cell_centres):
-            self._visual.axes.text(
-                # Text to be displayed.
-                s=cell_index,
-
-                # X and Y coordinates to display this text at.
-                x=mathunit.upscale_coordinates(cell_center[0]),
-                y=mathunit.upscale_coordinates(cell_center[1]),
-
-                # Alignment of this text at these coordinates.
-                horizontalalignment='center',
-                verticalalignment='center',
-
-                # Z-order of this text with respect to other artists.
-                zorder=self._zorder,
-            )
+        # Display the 0-based index of each cell centered at that cell,
+        # regardless of the number of cells.
+        plotutil.plot_index_labels(
+            ax=self._visual.axes,
+            points=self._phase.cells.cell_centres,
+            p=self._phase.p,
+            zorder=self._zorder,
+            max_labels=None,
+        )
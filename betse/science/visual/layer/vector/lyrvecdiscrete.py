@@ -9,11 +9,12 @@ discrete (i.e., individual, disseparate, discontiguous) surface.
 '''
 
 # ....................{ IMPORTS                            }....................
+import numpy as np
+from betse.lib.matplotlib import mplutil
 from betse.science.visual.layer.vector.lyrvecabc import (
     LayerCellsVectorColorfulABC)
 from betse.util.type.decorator.deccls import abstractproperty
 from betse.util.type.types import type_check, IterableTypes, SequenceOrNoneTypes
-from matplotlib.collections import TriMesh
 from numpy import ndarray
 
 # ....................{ SUPERCLASSES                       }....................
@@ -26,15 +27,20 @@ class LayerCellsVectorDiscreteMembranesABC(LayerCellsVectorColorfulABC):
 
     Such layers are somewhat more computationally expensive in both space and
     time than the average layer. Gouraud-shading the surface of each cell
-    requires a triangulation mesh for that cell, which this layer internally
-    computes via the Delaunay hull of that cell's non-triangular vertices.
+    requires a triangulation of that cell, which this layer internally
+    computes via the Delaunay hull of that cell's non-triangular vertices. The
+    triangulations of all cells are then merged into a single triangulation
+    mesh shaded as a single artist.
 
     Attributes
     ----------
-    _cell_tri_meshes : list
-        List of :class:`matplotlib.collections.TriMesh` instances, each
-        encapsulating the triangulation mesh for the cell in this cell cluster
-        whose 0-based index is the same structure as that of the
+    _cells_membranes_index : ndarray
+        One-dimensional Numpy array of the indices of the membranes situated
+        at each vertex of the :attr:`_cells_tri_mesh` mesh, suitable for
+        indexing membrane vertex data onto the vertices of this mesh.
+    _cells_tri_mesh : matplotlib.collections.TriMesh
+        Triangulation mesh of all cells in this cell cluster, concatenating
+        the triangulation of each cell in the same order as the
         :attr:`betse.science.cells.Cells.cell_verts` array.
     '''
 
@@ -45,7 +51,8 @@ class LayerCellsVectorDiscreteMembranesABC(LayerCellsVectorColorfulABC):
         super().__init__(*args, **kwargs)
 
         # Default all instance attributes.
-        self._cell_tri_meshes = None
+        self._cells_membranes_index = None
+        self._cells_tri_mesh = None
 
     # ..................{ SUBCLASS                           }..................
     @abstractproperty
@@ -76,54 +83,38 @@ class LayerCellsVectorDiscreteMembranesABC(LayerCellsVectorColorfulABC):
         membranes_vertex = self._vector.times_membranes_vertex[
             self._visual.time_step]
 
-        # List of triangulation meshes created by iteration below.
-        self._cell_tri_meshes = []
-
-        # For the index and two-dimensional array of upscaled vertex X and Y
-        # coordinates for each cell in this cluster...
-        for cell_index, cell_vertices_coords in enumerate(
-            self.cells_vertices_coords):
-            # X coordinates of all vertices defining this cell's polygon.
-            cell_vertices_x = cell_vertices_coords[:, 0]
-
-            # Y coordinates of all vertices defining this cell's polygon.
-            cell_vertices_y = cell_vertices_coords[:, 1]
-
-            # Indices of all membranes for this cell.
-            cell_membranes_index = self._phase.cells.cell_to_mems[cell_index]
-
-            # Color values of all vertices of this cell, referred to as "C" in
-            # both the documentation and implementation of the tripcolor()
-            # function. Why "C"? Because you will believe.
-            cell_membranes_vertex = membranes_vertex[cell_membranes_index]
-
-            # Gouraud-shaded triangulation mesh for this cell, computed from
-            # the Delaunay hull of the non-triangular vertices of this cell.
-            cell_tri_mesh = self._visual.axes.tripcolor(
-                # Positional arguments. Thanks to internal flaws in the
-                # matplotlib.tri.tripcolor() function parsing arguments passed
-                # to the matplotlib.axes.tripcolor() method called here, the
-                # first four arguments *MUST* be passed as positional arguments.
-                cell_vertices_x, cell_vertices_y, cell_membranes_vertex,
-
-                # Keyword arguments. All remaining arguments *MUST* be passed as
-                # keyword arguments.
-                shading='gouraud',
-                vmin=self._visual.color_min,
-                vmax=self._visual.color_max,
-
-                # Colormap converting input values into output color values.
-                cmap=self._visual.colormap,
-
-                # Z-order of this mesh with respect to other artists.
-                zorder=self._zorder,
-            )
-
-            # Add this triangulation mesh to the cached set of such meshes.
-            self._cell_tri_meshes.append(cell_tri_mesh)
-
-        # Map these triangulation meshes onto the figure colorbar.
-        return self._cell_tri_meshes
+        # If the indices of the membranes at the vertices of this mesh have
+        # yet to be concatenated, do so.
+        if self._cells_membranes_index is None:
+            self._cells_membranes_index = np.concatenate([
+                np.asarray(cell_membranes_index, dtype=int)
+                for cell_membranes_index in self._phase.cells.cell_to_mems])
+
+        # Gouraud-shaded triangulation mesh for all cells, computed from the
+        # Delaunay hull of the non-triangular vertices of each cell.
+        self._cells_tri_mesh = self._visual.axes.tripcolor(
+            # Triangulation of all cells and the color values of all vertices
+            # of this triangulation, referred to as "C" in both the
+            # documentation and implementation of the tripcolor() function.
+            # Why "C"? Because you will believe.
+            mplutil.triangulate_polygons(self.cells_vertices_coords),
+            membranes_vertex[self._cells_membranes_index],
+
+            # Keyword arguments. All remaining arguments *MUST* be passed as
+            # keyword arguments.
+            shading='gouraud',
+            vmin=self._visual.color_min,
+            vmax=self._visual.color_max,
+
+            # Colormap converting input values into output color values.
+            cmap=self._visual.colormap,
+
+            # Z-order of this mesh with respect to other artists.
+            zorder=self._zorder,
+        )
+
+        # Map this triangulation mesh onto the figure colorbar.
+        return (self._cells_tri_mesh,)
 
 # ....................{ SUBCLASSES                         }....................
 class LayerCellsVectorDiscreteMembranesFixed(
@@ -147,22 +138,18 @@ class LayerCellsVectorDiscreteMembranesFixed(
         return self._phase.cache.upscaled.cells_vertices_coords
 
 
-    # For efficiency, this method simply reshades the triangulated mesh for each
-    # cell previously computed by _layer_first_color_mappables().
+    # For efficiency, this method simply reshades the triangulated mesh for all
+    # cells previously computed by _layer_first_color_mappables().
     def _layer_next(self) -> None:
 
         # One-dimensional array of all membrane vertex data for this time step.
         membranes_vertex_data = self._vector.times_membranes_vertex[
             self._visual.time_step]
 
-        # For the index and triangulation mesh for each cell...
-        for cell_index, cell_tri_mesh in enumerate(self._cell_tri_meshes):
-            # Color values of all membrane vertices of this cell.
-            cell_membranes_vertex_data = membranes_vertex_data[
-                self._phase.cells.cell_to_mems[cell_index]]
-
-            # Gouraud-shade this triangulation mesh with these color values.
-            cell_tri_mesh.set_array(cell_membranes_vertex_data)
+        # Gouraud-shade this triangulation mesh with the color values of all
+        # membrane vertices of all cells.
+        self._cells_tri_mesh.set_array(
+            membranes_vertex_data[self._cells_membranes_index])
 
 
 class LayerCellsVectorDiscreteMembranesDeformed(
@@ -193,44 +180,11 @@ class LayerCellsVectorDiscreteMembranesDeformed(
     # _layer_next_color_mappables() rather than _layer_next() method is defined.
     def _layer_next_color_mappables(self) -> IterableTypes:
 
-        #FIXME: Submit a matplotlib issue concerning this, please.
-        # Manually remove all triangulation meshes plotted for the prior time
-        # step by iterating over all matplotlib collection objects and
-        # preserving all such objects that are *NOT* such meshes. Doing so also
-        # removes all triangulation meshes of other visuals already plotted for
-        # this time step and is hence non-ideal. But no alternatives exist.
-        #
-        # Actually, that's not quite accurate. The following alternative exists,
-        # but silently reduces to a noop for unknown reasons:
-        #     # For each triangulation mesh plotted for the prior time step...
-        #     for cell_tri_mesh in self._cell_tri_meshes:
-        #         # Remove this mesh from the current figure axes. Sadly, doing
-        #         # so via this method call appears to silently reduce to a noop
-        #         # rather than raising the expected "NotImplementedError"
-        #         # exception. Since there thus exists no means of discerning a
-        #         # successful from unsuccessful removal attempt, this call is
-        #         # currently assumed to always unsuccessfully reduce to a noop.
-        #         cell_tri_mesh.remove()
-        #FIXME: This previously working animation code no longer works and has
-        #thus been disabled. Instead, we adopt an ad-hoc workaround employed by
-        #betse.science.visual.layer.vectorfield.lyrvecfldstream._layer_next().
-        #Specifically, this approach now raises the unreadable exception:
-        #    AttributeError: can't set attribute
-        # self._visual.axes.collections = [
-        #     collection
-        #     for collection in self._visual.axes.collections
-        #     if not isinstance(collection, TriMesh)
-        # ]
-
-        # Rather than attempting to replace the entire axes collections, instead
-        # selectively search for and remove *ALL* trimesh-specific axes
-        # collections. Again, this is highly non-ideal. It is what it is.
-        #
-        # This workaround is strongly inspired by this StackOverflow answer:
-        #     https://stackoverflow.com/a/61932726/5049231
-        for artist in self._visual.axes.get_children():
-            if isinstance(artist, TriMesh):
-                artist.remove()
-
-        # Return new triangulation meshes for all cells for this time step.
+        # Remove the triangulation mesh plotted for the prior time step. Since
+        # this layer plots all cells as a single mesh, this mesh is removed
+        # directly rather than by searching this figure's axes for all meshes
+        # (including those plotted by other layers).
+        self._cells_tri_mesh.remove()
+
+        # Return a new triangulation mesh for all cells for this time step.
         return self._layer_first_color_mappables()
@@ -12,14 +12,65 @@ import matplotlib.cm as cm
 import matplotlib.pyplot as plt
 import numpy as np
 import numpy.ma as ma
-# from betse.util.io.log import logs
-from matplotlib.collections import LineCollection, PolyCollection
+from betse.lib.matplotlib import mplutil
+from betse.util.io.log import logs
+from matplotlib.collections import (
+    LineCollection, PathCollection, PolyCollection)
+from matplotlib.font_manager import FontProperties
+from matplotlib.lines import Line2D
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D, IdentityTransform
+from matplotlib.tri import Triangulation
+from functools import lru_cache
+from weakref import WeakKeyDictionary
 from scipy import interpolate
+from scipy.fft import rfft, rfftfreq
+from scipy.sparse import csr_matrix
+from scipy.spatial import cKDTree
+
+# ....................{ GLOBALS                            }....................
+_CELLS_DERIVED = WeakKeyDictionary()
+'''
+Dictionary weakly mapping from each cell cluster passed to the
+:func:`_get_upscaled` or :func:`_get_mask_inverted` getters to a dictionary
+mapping from the key of each array previously derived from an attribute of
+that cluster (e.g., ``mem_edges_flat``, ``~maskM``) to a 3-tuple ``(data,
+factor, data_derived)`` of the original array, the upscaling factor if any
+(or ``None`` otherwise), and the resulting derived array.
+
+Since cell cluster geometry is static across all plots of the same phase,
+deriving these arrays once rather than on each plot avoids repeated
+allocation and computation. Since this geometry is pickled with this
+cluster, these derived arrays are cached here rather than on the cluster.
+'''
+
+# ....................{ CONSTANTS                          }....................
+_INDEX_LABELS_MAX = 2000
+'''
+Default maximum number of index labels (e.g., of cells or membranes) printed
+by the :func:`plot_index_labels` function onto a single plot.
+
+Plots of larger cell clusters instead ignore these labels with a non-fatal
+warning, as such labels would unreadably overlap.
+'''
+
+
+_RASTERIZE_ITEMS_MIN = 5000
+'''
+Minimum number of items (e.g., cell polygons, membrane line segments) in a
+collection plotted by this submodule for that collection to be rasterized
+when saved to a vector image format (e.g., PDF, SVG), avoiding prohibitively
+large and slow vector output. Axes, labels, and other small artists remain
+vector graphics regardless.
+'''
 
 # ....................{ PLOTTERS                           }....................
 def plotSingleCellVData(sim,celli,p,fig=None,ax=None, lncolor='k'):
 
-    tvect_data=[x[celli]*1000 for x in sim.vm_time]
+    # Extract this cell's time series with a single fancy-index of the
+    # stacked two-dimensional array of all time steps and cells rather than
+    # iteratively indexing each time step in pure Python.
+    tvect_data = np.asarray(sim.vm_time)[:, celli]*1000
 
     if fig is None:
         fig = plt.figure()# define the figure and axes instances
@@ -29,7 +80,8 @@ def plotSingleCellVData(sim,celli,p,fig=None,ax=None, lncolor='k'):
     ax.plot(sim.time, tvect_data,lncolor,linewidth=2.0)
 
     if p.GHK_calc is True:
-        tvect_data_ghk = [x[p.visual.single_cell_index]*1000 for x in sim.vm_GHK_time]
+        tvect_data_ghk = (
+            np.asarray(sim.vm_GHK_time)[:, p.visual.single_cell_index]*1000)
         ax.plot(sim.time, tvect_data_ghk,'r',linewidth=2.0)
 
     ax.set_xlabel('Time [s]')
@@ -39,12 +91,7 @@ def plotSingleCellVData(sim,celli,p,fig=None,ax=None, lncolor='k'):
 
 def plotSingleCellCData(simdata_time,simtime,ioni,celli,fig=None,ax=None,lncolor='b',ionname='ion'):
 
-    # ccIon_cell = [arr[ioni][celli] for arr in simdata_time]
-    ccIon_cell = []
-
-    for carray in simdata_time:
-        conc = carray[ioni][celli]
-        ccIon_cell.append(conc)
+    ccIon_cell = np.asarray(simdata_time)[:, ioni, celli]
 
     if fig is None:
         fig = plt.figure()# define the figure and axes instances
@@ -62,18 +109,13 @@ def plotSingleCellCData(simdata_time,simtime,ioni,celli,fig=None,ax=None,lncolor
 
 def plotSingleCellData(simtime,simdata_time,celli,fig=None,ax=None,lncolor='b',lab='Data'):
 
-    data_cell = [arr[celli] for arr in simdata_time]
+    data_cell = np.asarray(simdata_time)[:, celli]
 
     if fig is None:
         fig = plt.figure()# define the figure and axes instances
     if ax is None:
         ax = plt.subplot(111)
 
-    xmin = simtime[0]
-    xmax = simtime[-1]
-    ymin = np.min(data_cell)
-    ymax = np.max(data_cell)
-
     ax.plot(simtime, data_cell,lncolor,label=lab)
     ax.set_xlabel('Time [s]')
     ax.set_ylabel(lab)
@@ -108,18 +150,22 @@ def plotFFT(simtime,simdata_time,celli,fig=None,ax=None,lncolor='b',lab='Data'):
     sample_size = len(simtime)
     sample_spacing = simtime[1] - simtime[0]
 
-    cell_data_o = [arr[celli] for arr in simdata_time]
+    cell_data_o = np.asarray(simdata_time)[:, celli]
     # membranes_midpoint_data = ((1/sample_size)*(cell_data_o/np.mean(cell_data_o)) )   # normalize the signal
-    cell_data = (1/sample_size)*(cell_data_o - np.mean(cell_data_o))
+    cell_data = cell_data_o - cell_data_o.mean()
+
+    f_axis = _get_rfftfreq(sample_size, sample_spacing)
 
-    f_axis = np.fft.rfftfreq(sample_size, d=sample_spacing)
-    fft_data_o = np.fft.rfft(cell_data)
-    fft_data = np.sqrt(np.real(fft_data_o)**2 + np.imag(fft_data_o)**2)
+    # Normalize this spectrum rather than this signal. Since the FFT is
+    # linear, this is equivalent but scales only the shorter frequency-domain
+    # array -- which the "forward" normalization mode scales within the FFT
+    # itself rather than in a separate pass. Since "cell_data" is a temporary
+    # array owned by this function, permit the FFT to reuse its memory.
+    fft_data = np.abs(rfft(cell_data, norm='forward', overwrite_x=True))
 
     xmin = f_axis[0]
     xmax = f_axis[-1]
-    ymin = np.min(fft_data)
-    ymax = np.max(fft_data)
+    ymin, ymax = _get_min_max(fft_data)
 
     ax.plot(f_axis,fft_data)
     ax.axis([xmin,xmax,ymin,ymax])
@@ -190,36 +236,43 @@ def plotHetMem(sim,cells, p, fig=None, ax=None, zdata=None,clrAutoscale = True,
         if zdata is None:
             zdata = np.ones((p.plot_grid_size,p.plot_grid_size))
 
+        # Halve the memory bandwidth of colour mapping this data.
+        zdata = _get_float32(zdata)
+
         ax.axis('equal')
 
-        xmin = cells.xmin*p.um
-        xmax = cells.xmax*p.um
-        ymin = cells.ymin*p.um
-        ymax = cells.ymax*p.um
+        xmin, xmax, ymin, ymax = _get_upscaled_extent(cells, p)
 
         ax.axis([xmin,xmax,ymin,ymax])
 
         if p.plotMask is True:
-            zdata = ma.masked_array(zdata, np.logical_not(cells.maskM))
+            zdata = ma.masked_array(
+                zdata, _get_mask_inverted(cells, 'maskM'), copy=False)
 
         meshplt = plt.imshow(zdata,origin='lower',extent=[xmin,xmax,ymin,ymax],cmap=clrmap)
 
         if pointOverlay is True:
+            mem_mids_flat = _get_upscaled(cells, p, 'mem_mids_flat')
             ax.scatter(
-                p.um*cells.mem_mids_flat[:,0],
-                p.um*cells.mem_mids_flat[:,1], c='k',)
+                mem_mids_flat[:,0], mem_mids_flat[:,1],
+                c='k', linewidths=0, edgecolors='none')
 
         if edgeOverlay is True:
             # cell_edges_flat, _ , _= tb.flatten(cells.mem_edges)
-            cell_edges_flat = p.um*cells.mem_edges_flat
-            coll = LineCollection(cell_edges_flat,colors='k')
+            cell_edges_flat = _get_upscaled(cells, p, 'mem_edges_flat')
+            coll = LineCollection(
+                cell_edges_flat,colors='k',
+                rasterized=len(cell_edges_flat) > _RASTERIZE_ITEMS_MIN)
             coll.set_alpha(0.5)
             ax.add_collection(coll)
 
         if zdata is not None:
             # Add a colorbar for the mesh plot:
-            maxval = round(np.max(1000*sim.vm_time[-1]),1)
-            minval = round(np.min(1000*sim.vm_time[-1]),1)
+            # Reduce the unscaled Vmems and scale only the two resulting
+            # scalars rather than scaling all Vmems twice.
+            minval, maxval = _get_min_max(sim.vm_time[-1])
+            maxval = round(1000*maxval,1)
+            minval = round(1000*minval,1)
             checkval = maxval - minval
 
             if checkval == 0:
@@ -240,13 +293,11 @@ def plotHetMem(sim,cells, p, fig=None, ax=None, zdata=None,clrAutoscale = True,
 
         if number_cells is True:
 
-            for i,cll in enumerate(cells.cell_centres):
-                ax.text(p.um*cll[0],p.um*cll[1],i,ha='center',va='center')
+            plot_index_labels(ax, cells.cell_centres, p)
 
         if number_mems is True:
 
-            for i,mem in enumerate(cells.mem_mids_flat):
-                ax.text(p.um*mem[0],p.um*mem[1],i,ha='center',va='center')
+            plot_index_labels(ax, cells.mem_mids_flat, p)
 
         if current_overlay is True:
 
@@ -356,8 +407,7 @@ def plotPolyData(
     # Add a colorbar for the PolyCollection
 
     if zdata is not None and clrAutoscale is True:
-        maxval = np.max(zdata,axis=0)
-        minval = np.min(zdata,axis=0)
+        minval, maxval = _get_min_max(zdata)
 
         coll.set_clim(minval,maxval)
         ax_cb = fig.colorbar(coll,ax=ax)
@@ -370,18 +420,12 @@ def plotPolyData(
         ax_cb = None
 
     if number_cells is True:
-        for i,cll in enumerate(cells.cell_centres):
-            ax.text(p.um*cll[0],p.um*cll[1],i,ha='center',va='center')
+        plot_index_labels(ax, cells.cell_centres, p)
 
     if current_overlay is True:
         streams, ax = I_overlay(sim,cells,p,ax,plotIecm)
 
-    xmin = cells.xmin*p.um
-    xmax = cells.xmax*p.um
-    ymin = cells.ymin*p.um
-    ymax = cells.ymax*p.um
-
-    ax.axis([xmin,xmax,ymin,ymax])
+    ax.axis(_get_upscaled_extent(cells, p))
 
     return fig,ax,ax_cb
 
@@ -437,8 +481,7 @@ def plotPrettyPolyData(data, sim, cells, p, fig=None, ax=None, clrAutoscale = Tr
         # define colorbar limits for the PolyCollection
 
         if clrAutoscale is True:
-            maxval = data_verts.max()
-            minval = data_verts.min()
+            minval, maxval = _get_min_max(data_verts)
             # maxval = data_verts.max()
             # minval = data_verts.min()
 
@@ -464,18 +507,12 @@ def plotPrettyPolyData(data, sim, cells, p, fig=None, ax=None, clrAutoscale = Tr
         ax.axis('equal')
 
         if number_cells is True:
-            for i,cll in enumerate(cells.cell_centres):
-                ax.text(p.um*cll[0],p.um*cll[1],i,ha='center',va='center')
+            plot_index_labels(ax, cells.cell_centres, p)
 
         if current_overlay is True:
             streams, ax = I_overlay(sim,cells,p,ax,plotIecm)
 
-        xmin = cells.xmin*p.um
-        xmax = cells.xmax*p.um
-        ymin = cells.ymin*p.um
-        ymax = cells.ymax*p.um
-
-        ax.axis([xmin,xmax,ymin,ymax])
+        ax.axis(_get_upscaled_extent(cells, p))
 
         return fig,ax,ax_cb
 
@@ -485,12 +522,16 @@ def plotVectField(Fx,Fy,cells,p,plot_ecm = False,title = 'Vector field',cb_title
     fig = plt.figure()
     ax = plt.subplot(111)
 
+    # Halve the memory bandwidth of colour mapping this field.
+    Fx = _get_float32(Fx)
+    Fy = _get_float32(Fy)
+
     if plot_ecm is True:
 
-        efield = np.sqrt(Fx**2 + Fy**2)
+        efield = np.hypot(Fx, Fy)
 
-        msh = ax.imshow(efield,origin='lower', extent = [cells.xmin*p.um, cells.xmax*p.um, cells.ymin*p.um,
-            cells.ymax*p.um],cmap=p.background_cm)
+        msh = ax.imshow(efield,origin='lower', extent=_get_upscaled_extent(cells, p),
+            cmap=p.background_cm)
 
         vplot, ax = env_quiver(Fx,Fy,ax,cells,p)
 
@@ -498,7 +539,7 @@ def plotVectField(Fx,Fy,cells,p,plot_ecm = False,title = 'Vector field',cb_title
 
     elif plot_ecm is False:
 
-        efield = np.sqrt(Fx**2 + Fy**2)
+        efield = np.hypot(Fx, Fy)
 
         msh, ax = cell_mesh(efield,ax,cells,p,p.background_cm)
 
@@ -508,12 +549,7 @@ def plotVectField(Fx,Fy,cells,p,plot_ecm = False,title = 'Vector field',cb_title
 
     ax.axis('equal')
 
-    xmin = cells.xmin*p.um
-    xmax = cells.xmax*p.um
-    ymin = cells.ymin*p.um
-    ymax = cells.ymax*p.um
-
-    ax.axis([xmin,xmax,ymin,ymax])
+    ax.axis(_get_upscaled_extent(cells, p))
 
     if colorAutoscale is False:
         msh.set_clim(minColor,maxColor)
@@ -545,8 +581,12 @@ def plotStreamField(
     fig = plt.figure()
     ax = plt.subplot(111)
 
+    # Halve the memory bandwidth of colour mapping this field.
+    Fx = _get_float32(Fx)
+    Fy = _get_float32(Fy)
+
     if plot_ecm:
-        efield = np.sqrt(Fx**2 + Fy**2)
+        efield = np.hypot(Fx, Fy)
         # msh = ax.imshow(
         #     efield,
         #     origin='lower',
@@ -556,7 +596,7 @@ def plotStreamField(
         splot, ax = env_stream(Fx, Fy, ax, cells, p, cmap=p.background_cm)
         tit_extra = 'Extracellular'
     else:
-        efield = np.sqrt(Fx**2 + Fy**2)
+        efield = np.hypot(Fx, Fy)
 
         # msh, ax = cell_mesh(efield,ax,cells,p,p.background_cm)
         splot, ax = cell_stream(
@@ -568,13 +608,7 @@ def plotStreamField(
         tit_extra = 'Intracellular'
 
     ax.axis('equal')
-
-    xmin = cells.xmin*p.um
-    xmax = cells.xmax*p.um
-    ymin = cells.ymin*p.um
-    ymax = cells.ymax*p.um
-
-    ax.axis([xmin, xmax, ymin, ymax])
+    ax.axis(_get_upscaled_extent(cells, p))
 
     if not colorAutoscale:
         splot.lines.set_clim(minColor, maxColor)
@@ -622,7 +656,7 @@ def plotMemData(cells, p, fig= None, ax = None, zdata=None,clrmap=None):
         if ax is None:
             ax = plt.subplot(111)
 
-        cell_edges_flat = p.um*cells.mem_edges_flat
+        cell_edges_flat = _get_upscaled(cells, p, 'mem_edges_flat')
 
         if zdata is None:
             z = np.ones(len(cell_edges_flat))
@@ -645,25 +679,20 @@ def plotMemData(cells, p, fig= None, ax = None, zdata=None,clrmap=None):
         if clrmap is None:
             clrmap = cm.rainbow
 
-        coll = LineCollection(cell_edges_flat, array=z, cmap=clrmap,linewidths=4.0)
+        coll = LineCollection(
+            cell_edges_flat, array=z, cmap=clrmap,linewidths=4.0,
+            rasterized=len(cell_edges_flat) > _RASTERIZE_ITEMS_MIN)
         ax.add_collection(coll)
 
         # coll.set_clim(0,3)
 
-        ax.axis('equal')
-
         # Add a colorbar for the Line Collection
         if zdata is not None:
             ax_cb = fig.colorbar(coll, ax=ax)
 
         ax.axis('equal')
 
-        xmin = cells.xmin*p.um
-        xmax = cells.xmax*p.um
-        ymin = cells.ymin*p.um
-        ymax = cells.ymax*p.um
-
-        ax.axis([xmin,xmax,ymin,ymax])
+        ax.axis(_get_upscaled_extent(cells, p))
 
         return fig, ax, ax_cb
 
@@ -723,11 +752,11 @@ def plotConnectionData(cells, p, fig = None, ax=None, zdata=None,clrmap=None,col
 
          # Make a line collection and add it to the plot.
 
-        con_segs = cells.cell_centres[cells.gap_jun_i]
+        connects = _get_gap_junction_segments(cells, p)
 
-        connects = p.um*np.asarray(con_segs)
-
-        coll = LineCollection(connects, array=z, cmap=clrmap, linewidths=4.0, zorder=0)
+        coll = LineCollection(
+            connects, array=z, cmap=clrmap, linewidths=4.0, zorder=0,
+            rasterized=len(connects) > _RASTERIZE_ITEMS_MIN)
         coll.set_clim(vmin=0.0,vmax=1.0)
         coll.set_picker(pickable)
         ax.add_collection(coll)
@@ -740,12 +769,7 @@ def plotConnectionData(cells, p, fig = None, ax=None, zdata=None,clrmap=None,col
         else:
             ax_cb = None
 
-        xmin = cells.xmin*p.um
-        xmax = cells.xmax*p.um
-        ymin = cells.ymin*p.um
-        ymax = cells.ymax*p.um
-
-        ax.axis([xmin,xmax,ymin,ymax])
+        ax.axis(_get_upscaled_extent(cells, p))
 
         return fig, ax, ax_cb
 
@@ -775,29 +799,35 @@ def plotBoundCells(points_flat,bflags,cells, p, fig=None, ax=None):
             ax = plt.subplot(111)
             #ax = plt.axes()
 
-        points_flat = np.asarray(points_flat)
+        # Upscale all points once and index the boundary points from these
+        # upscaled points rather than upscaling each coordinate separately.
+        points_scaled = p.um*np.asarray(points_flat)
         bflags = np.asarray(bflags)
 
-        bpoints = points_flat[bflags]
-
-        ax.plot(p.um*points_flat[:,0],p.um*points_flat[:,1],'k.')
-
-        ax.plot(p.um*bpoints[:,0],p.um*bpoints[:,1],'r.')
+        # Plot all points as a single marker collection without stroking the
+        # edges of each marker.
+        ax.scatter(
+            points_scaled[:,0], points_scaled[:,1],
+            c='k', s=4, marker='.', linewidths=0, edgecolors='none')
+
+        # If any points are tagged on the boundary, plot these points. Since
+        # these flags are either boolean masks *OR* arrays of indices, test
+        # the indexed points rather than these flags.
+        bpoints_scaled = points_scaled[bflags]
+        if len(bpoints_scaled):
+            ax.scatter(
+                bpoints_scaled[:,0], bpoints_scaled[:,1],
+                c='r', s=8, marker='.', linewidths=0, edgecolors='none')
 
         # cell_edges_flat, _ , _= tb.flatten(cells.mem_edges)
-        cell_edges_flat = p.um*cells.mem_edges_flat
+        cell_edges_flat = _get_upscaled(cells, p, 'mem_edges_flat')
         coll = LineCollection(cell_edges_flat,colors='k')
         coll.set_alpha(0.5)
         ax.add_collection(coll)
 
         ax.axis('equal')
 
-        xmin = cells.xmin*p.um
-        xmax = cells.xmax*p.um
-        ymin = cells.ymin*p.um
-        ymax = cells.ymax*p.um
-
-        ax.axis([xmin,xmax,ymin,ymax])
+        ax.axis(_get_upscaled_extent(cells, p))
 
         return fig, ax
 
@@ -820,28 +850,36 @@ def plotVects(cells, p, fig=None, ax=None):
             ax = plt.subplot(111)
             #ax = plt.axes()
 
-        s = p.um
+        # Plot both membrane tangents and normals as a single quiver artist by
+        # concatenating their origins and directions, distinguished only by
+        # colour, rather than as two separately transformed quiver artists.
+        mvf = _get_upscaled(cells, p, 'mem_vects_flat')
+        mem_num = len(mvf)
+        ax.quiver(
+            np.concatenate((mvf[:,0], mvf[:,0])),
+            np.concatenate((mvf[:,1], mvf[:,1])),
+            np.concatenate((mvf[:,4], mvf[:,2])),
+            np.concatenate((mvf[:,5], mvf[:,3])),
+            color=['b']*mem_num + ['g']*mem_num,
+        )
 
-        ax.quiver(s*cells.mem_vects_flat[:,0],s*cells.mem_vects_flat[:,1],s*cells.mem_vects_flat[:,4],
-                  s*cells.mem_vects_flat[:,5],color='b',label='mem tang')
-        ax.quiver(s*cells.mem_vects_flat[:,0],s*cells.mem_vects_flat[:,1],s*cells.mem_vects_flat[:,2],
-                  s*cells.mem_vects_flat[:,3],color='g',label ='mem norm')
+        # Since this artist has no single colour, label these vectors with
+        # proxy artists instead.
+        legend_proxies = [
+            Line2D([], [], color='b', label='mem tang'),
+            Line2D([], [], color='g', label='mem norm'),
+        ]
         # ax.quiver(s*cells.ecm_vects[:,0],s*cells.ecm_vects[:,1],s*cells.ecm_vects[:,2],s*cells.ecm_vects[:,3],color='r')
 
         # cell_edges_flat, _ , _= tb.flatten(cells.mem_edges)
-        cell_edges_flat = p.um*cells.mem_edges_flat
+        cell_edges_flat = _get_upscaled(cells, p, 'mem_edges_flat')
         coll = LineCollection(cell_edges_flat,colors='k')
         ax.add_collection(coll)
 
         ax.axis('equal')
 
-        xmin = cells.xmin*p.um
-        xmax = cells.xmax*p.um
-        ymin = cells.ymin*p.um
-        ymax = cells.ymax*p.um
-
-        ax.axis([xmin,xmax,ymin,ymax])
-        plt.legend()
+        ax.axis(_get_upscaled_extent(cells, p))
+        plt.legend(handles=legend_proxies)
 
         return fig, ax
 
@@ -858,6 +896,11 @@ def streamingCurrent(
     edgeOverlay=True,
     number_cells=False,
 ):
+    '''
+    Plot the final gap junction (or, if extracellular spaces are enabled,
+    total) current density as monochrome streamlines overlaying the magnitude
+    of this current density.
+    '''
 
     # Define the figure and axes instances if needed.
     if fig is None:
@@ -867,67 +910,58 @@ def streamingCurrent(
 
     ax.axis('equal')
 
-    xmin = cells.xmin*p.um
-    xmax = cells.xmax*p.um
-    ymin = cells.ymin*p.um
-    ymax = cells.ymax*p.um
+    xmin, xmax, ymin, ymax = _get_upscaled_extent(cells, p)
 
     ax.axis([xmin,xmax,ymin,ymax])
 
-    #FIXME: There's a fair amount of overlap between the following branches.
-    #Treetops swaying in the contumely breeze!
+    # X and Y components of the current density to be plotted and the title
+    # of this plot.
     if p.is_ecm is False or plot_Iecm is False:
-
-        # multiply by 100 to get units of uA/m2
-        Jmag_M = 100*np.sqrt(
-            sim.I_gj_x_time[-1]**2 + sim.I_gj_y_time[-1]**2) + 1e-30
-
-        J_x = sim.I_gj_x_time[-1]/Jmag_M
-        J_y = sim.I_gj_y_time[-1]/Jmag_M
-
-        meshplot = plt.imshow(
-            Jmag_M,
-            origin='lower',
-            extent=[xmin,xmax,ymin,ymax],
-            cmap=clrmap,
-        )
-
-        ax.streamplot(
-            cells.X*p.um, cells.Y*p.um, J_x, J_y,
-            density=p.stream_density,
-            linewidth=(3.0*Jmag_M/Jmag_M.max()) + 0.5,
-            color='k',
-            cmap=clrmap,
-            # arrowsize=5.0,
-        )
-
-        ax.set_title('Final gap junction current density')
-
+        I_x = sim.I_gj_x_time[-1]
+        I_y = sim.I_gj_y_time[-1]
+        title = 'Final gap junction current density'
     elif plot_Iecm is True:
-        # multiply by 100 to get units of uA/m2
-        Jmag_M = 100*np.sqrt(
-            sim.I_tot_x_time[-1]**2 + sim.I_tot_y_time[-1]**2) + 1e-30
-
-        J_x = sim.I_tot_x_time[-1]/Jmag_M
-        J_y = sim.I_tot_y_time[-1]/Jmag_M
-
-        meshplot = plt.imshow(
-            Jmag_M,
-            origin='lower',
-            extent=[xmin,xmax,ymin,ymax],
-            cmap=clrmap,
-        )
+        I_x = sim.I_tot_x_time[-1]
+        I_y = sim.I_tot_y_time[-1]
+        title = 'Final total currents'
+
+    # Halve the memory bandwidth of colour mapping and integrating streamlines
+    # through these components.
+    I_x = _get_float32(I_x)
+    I_y = _get_float32(I_y)
+
+    # multiply by 100 to get units of uA/m2
+    Jmag_M = np.hypot(I_x, I_y)
+    Jmag_M *= 100
+    Jmag_M += 1e-30
+
+    # Normalize by multiplying by the shared reciprocal of this magnitude
+    # rather than dividing twice.
+    Jmag_M_inv = np.reciprocal(Jmag_M)
+    J_x = I_x*Jmag_M_inv
+    J_y = I_y*Jmag_M_inv
+
+    meshplot = plt.imshow(
+        Jmag_M,
+        origin='lower',
+        extent=[xmin,xmax,ymin,ymax],
+        cmap=clrmap,
+    )
 
-        ax.streamplot(
-            cells.X*p.um, cells.Y*p.um, J_x, J_y,
-            density=p.stream_density,
-            linewidth=(3.0*Jmag_M/Jmag_M.max()) + 0.5,
-            color='k',
-            cmap=clrmap,
-            # arrowsize=5.0,
-        )
+    streams = ax.streamplot(
+        _get_upscaled(cells, p, 'X'), _get_upscaled(cells, p, 'Y'), J_x, J_y,
+        density=p.stream_density,
+        linewidth=_get_stream_linewidths(Jmag_M),
+        color='k',
+        cmap=clrmap,
+        # arrowsize=5.0,
+    )
 
-        ax.set_title('Final total currents')
+    # Rasterize these streamlines if sufficiently many.
+    streams.lines.set_rasterized(
+        len(streams.lines.get_segments()) > _RASTERIZE_ITEMS_MIN)
+
+    ax.set_title(title)
 
     if clrAutoscale is True:
         ax_cb = fig.colorbar(meshplot,ax=ax)
@@ -945,8 +979,7 @@ def streamingCurrent(
 
     if number_cells is True:
 
-        for i,cll in enumerate(cells.cell_centres):
-            ax.text(p.um*cll[0],p.um*cll[1],i,ha='center',va='center')
+        plot_index_labels(ax, cells.cell_centres, p)
 
     return fig,ax,ax_cb
 
@@ -1008,17 +1041,41 @@ def cell_ave(cells,vm_at_mem):
 
     """
 
-    v_cell = []
+    # Average the values of all membranes of each cell in a single sparse
+    # matrix-vector product, reusing the membrane counts of each cell cached
+    # with this matrix rather than recounting these membranes on each call.
+    v_cell = _get_mems_to_cells_mean(cells).dot(vm_at_mem)
 
-    for i in cells.cell_i:
-        cellinds = (cells.mem_to_cells == i).nonzero()
-        v_cell_array = vm_at_mem[cellinds]
-        v_cell_ave = np.mean(v_cell_array)
-        v_cell.append(v_cell_ave)
+    return v_cell
 
-    v_cell = np.asarray(v_cell)
 
-    return v_cell
+def cell_ave_2d(cells, vm_at_mem_time):
+
+    """
+    Averages Vmem over membrane domains to return a mean value for each cell
+    for each sampled time step, as a vectorized equivalent of calling
+    cell_ave() once per time step.
+
+    Parameters
+    ----------
+    cells               An instance of the Cells module cells object
+    vm_at_mem_time      Vmem at individual membrane domains for each time
+                        step, indexed as [time, membrane]
+
+
+    Returns
+    --------
+    v_cell_time         Cell Vm averaged over the whole cell for each time
+                        step, indexed as [time, cell]
+
+    """
+
+    # Right-multiply all time steps at once by the transpose of the sparse
+    # membrane-to-cell averaging matrix.
+    v_cell_time = _get_mems_to_cells_mean(cells).dot(
+        np.asarray(vm_at_mem_time).T).T
+
+    return v_cell_time
 
 
 def cell_quiver(datax, datay, ax, cells, p):
@@ -1039,21 +1096,22 @@ def cell_quiver(datax, datay, ax, cells, p):
     """
 
     if len(datax) == len(cells.mem_i):
-        Fx = np.dot(cells.M_sum_mems,datax)/cells.num_mems
-        Fy = np.dot(cells.M_sum_mems,datay)/cells.num_mems
+        # Average both components of membrane data onto cell centres with a
+        # single product of the cached sparse averaging matrix (whose weights
+        # already divide by the number of membranes of each cell) rather than
+        # two products of the dense "M_sum_mems" matrix.
+        Fx, Fy = _get_mems_to_cells_mean(cells).dot(
+            np.column_stack((datax, datay))).T
     else:
         Fx = datax
         Fy = datay
 
-    Fmag = np.sqrt(Fx**2 + Fy**2)
-
     # normalize the data:
-    Fmag[Fmag == 0.0] = 1.0
-    Fx = Fx/Fmag
-    Fy = Fy/Fmag
+    Fx, Fy, _ = _get_unit_vectors(Fx, Fy)
 
+    cell_centres = _get_upscaled(cells, p, 'cell_centres')
     vplot = ax.quiver(
-        p.um*cells.cell_centres[:,0],p.um*cells.cell_centres[:,1],Fx,Fy,
+        cell_centres[:,0],cell_centres[:,1],Fx,Fy,
         pivot='mid', color=p.vcolor, units='x',
         headwidth=5, headlength=7, zorder=10)
 
@@ -1088,7 +1146,8 @@ def env_quiver(datax,datay,ax,cells,p):
         Fx = datax/F_mag.mean()
         Fy = datay/F_mag.mean()
 
-    vplot = ax.quiver(p.um*cells.xypts[:,0], p.um*cells.xypts[:,1], Fx.ravel(),
+    xypts = _get_upscaled(cells, p, 'xypts')
+    vplot = ax.quiver(xypts[:,0], xypts[:,1], Fx.ravel(),
         Fy.ravel(), pivot='mid',color = p.vcolor, units='x',headwidth=5, headlength = 7,zorder=10)
 
     return vplot, ax
@@ -1113,26 +1172,34 @@ def cell_stream(
     '''
 
     if show_cells:
-        cell_edges_flat = p.um*cells.mem_edges_flat
+        cell_edges_flat = _get_upscaled(cells, p, 'mem_edges_flat')
         coll = LineCollection(cell_edges_flat,colors='k')
         coll.set_alpha(0.3)
         ax.add_collection(coll)
 
     if datax.shape != cells.X.shape: # if the data hasn't been interpolated yet...
-        Fx = interpolate.griddata(
-            (cells.cell_centres[:,0], cells.cell_centres[:,1]),
-            datax,
-            (cells.X, cells.Y),
-            fill_value=0,
-            method=p.interp_type,
-        )
-        Fy = interpolate.griddata(
-            (cells.cell_centres[:,0], cells.cell_centres[:,1]),
-            datay,
-            (cells.X, cells.Y),
-            fill_value=0,
-            method=p.interp_type,
-        )
+        # If interpolating by nearest neighbour, index this data by the cached
+        # cell nearest each grid point rather than rebuilding a k-d tree of
+        # all cell centres for each component on each call.
+        if p.interp_type == 'nearest':
+            grid_to_cells = _get_grid_to_cells_nearest(cells)
+            Fx = np.asarray(datax)[grid_to_cells]
+            Fy = np.asarray(datay)[grid_to_cells]
+        else:
+            Fx = interpolate.griddata(
+                (cells.cell_centres[:,0], cells.cell_centres[:,1]),
+                datax,
+                (cells.X, cells.Y),
+                fill_value=0,
+                method=p.interp_type,
+            )
+            Fy = interpolate.griddata(
+                (cells.cell_centres[:,0], cells.cell_centres[:,1]),
+                datay,
+                (cells.X, cells.Y),
+                fill_value=0,
+                method=p.interp_type,
+            )
 
         Fx = Fx*cells.maskECM
         Fy = Fy*cells.maskECM
@@ -1141,19 +1208,12 @@ def cell_stream(
         Fx = datax
         Fy = datay
 
-    # Magnitude of the passed vector field.
-    Fmag = np.sqrt(Fx**2 + Fy**2)
-
-    # Substitute all zero magnitudes by 1.0, enabling division by these
-    # magnitudes without concern for division-by-zero exceptions.
-    Fmag[Fmag == 0.0] = 1.0
-
-    # Normalize this vector field to a unit vector field.
-    Fx = Fx/Fmag
-    Fy = Fy/Fmag
+    # Normalize this vector field to a unit vector field, preserving the
+    # magnitude of this field.
+    Fx, Fy, Fmag = _get_unit_vectors(Fx, Fy)
 
     # Streamline width.
-    line_width = (3.0*Fmag/Fmag.max()) + 0.5
+    line_width = _get_stream_linewidths(Fmag)
 
     # Color(s) of each streamline, either as a scalar *OR* an array of the same
     # shape as the "Fx" and "Fy" arrays.
@@ -1163,8 +1223,8 @@ def cell_stream(
         stream_color = Fmag
 
     streams = ax.streamplot(
-        cells.X*p.um,
-        cells.Y*p.um,
+        _get_upscaled(cells, p, 'X'),
+        _get_upscaled(cells, p, 'Y'),
         Fx, Fy,
         density=p.stream_density,
         linewidth=line_width,
@@ -1196,11 +1256,13 @@ def mem_quiver(datax,datay,ax,cells,p, cmap=None):
     # scaleval = (p.um*cells.R.mean())*7.0
     scaleval = p.um*p.wsx*0.8
 
+    mem_centres, mem_radii = _get_mem_quiver_tails(cells, p)
+
     mvects = ax.quiver(
-        cells.cell_centres[:, 0][cells.mem_to_cells]*p.um,
-        cells.cell_centres[:, 1][cells.mem_to_cells]*p.um,
-        datax*cells.R[cells.mem_to_cells]*p.um,
-        datay*cells.R[cells.mem_to_cells]*p.um,
+        mem_centres[:, 0],
+        mem_centres[:, 1],
+        datax*mem_radii,
+        datay*mem_radii,
         scale=scaleval,
         color=p.vcolor,
         cmap = cmap
@@ -1231,23 +1293,21 @@ def env_stream(datax,datay,ax,cells,p, cmap=None):
 
     """
 
-    Fmag = np.sqrt(datax**2 + datay**2) + 1e-30
-
-    if Fmag.all() != 0.0:
-        Fx = datax/Fmag
-        Fy = datay/Fmag
+    Fx, Fy, Fmag = _get_unit_vectors(datax, datay)
 
     if Fmag.max() != 0.0:
 
-        lw = (3.0*Fmag/Fmag.max()) + 0.5
+        lw = _get_stream_linewidths(Fmag)
 
     else:
         lw = 3.0
 
     # if datax.shape == cells.X.shape:
 
-    streams = ax.streamplot(cells.X*p.um,cells.Y*p.um, Fx, Fy, density=p.stream_density,
-            linewidth=lw,color=Fmag, cmap=cmap)
+    streams = ax.streamplot(
+        _get_upscaled(cells, p, 'X'), _get_upscaled(cells, p, 'Y'),
+        Fx, Fy, density=p.stream_density,
+        linewidth=lw,color=Fmag, cmap=cmap)
 
     # elif datax.shape == cells.X.shape:
     #
@@ -1262,24 +1322,24 @@ def env_stream(datax,datay,ax,cells,p, cmap=None):
 
 def cell_mesh(data, ax, cells, p, clrmap):
 
-    # If the data is defined on membrane midpoints get membrane midpoint coordinates
+    # If the data is defined on membrane midpoints, triangulate membrane
+    # midpoint coordinates. Since these coordinates are static, reuse the
+    # cached Delaunay triangulation of these coordinates rather than
+    # retriangulating on each call.
     if len(data) == len(cells.mem_i):
         # data = np.dot(cells.M_sum_mems,data)/cells.num_mems
-        xi = p.um*cells.mem_mids_flat[:,0]
-        yi = p.um*cells.mem_mids_flat[:,1]
+        triangulation = _get_triangulation(cells, p, 'mem_mids_flat')
 
     elif len(data) == len(cells.cell_i): # otherwise
 
-        xi = p.um*cells.cell_centres[:,0]
-        yi = p.um*cells.cell_centres[:,1]
+        triangulation = _get_triangulation(cells, p, 'cell_centres')
 
 
     # data_grid = np.zeros(len(cells.voronoi_centres))
     # data_grid[cells.cell_to_grid] = data
 
     msh = ax.tripcolor(
-        xi,
-        yi,
+        triangulation,
         data,
         shading='gouraud',
         cmap=clrmap,
@@ -1299,8 +1359,8 @@ def pretty_patch_plot(
 ):
     """
     Maps data on mem midpoints to vertices, and
-    uses tripcolor on every cell patch to create a
-    lovely gradient. Slow but beautiful!
+    uses tripcolor on the triangulated patches of
+    all cells to create a lovely gradient.
 
     data:   mem midpoint data for plotting (e.g vm)
     ax:     plot axis
@@ -1316,8 +1376,7 @@ def pretty_patch_plot(
 
     # colormap clim
     if cmin is None:
-        amin = data_verts.min()
-        amax = data_verts.max()
+        amin, amax = _get_min_max(data_verts)
     else:
         amin = cmin
         amax = cmax
@@ -1325,32 +1384,18 @@ def pretty_patch_plot(
     # amin = amin + 0.1 * np.abs(amin)
     # amax = amax - 0.1 * np.abs(amax)
 
-    # collection of cell patchs at vertices:
-    if use_other_verts is None:
-        cell_faces = np.multiply(cells.cell_verts, p.um)
-    else:
-        cell_faces = np.multiply(use_other_verts, p.um)
-
-    # Cell membrane (Vmem) plotter (slow but beautiful!)
-    for i in range(len(cell_faces)):
-        x = cell_faces[i][:, 0]
-        y = cell_faces[i][:, 1]
+    # Triangulation of all cell patches and the indices of the membrane data
+    # at the vertices of this triangulation.
+    triangulation, triangulation_mems = _get_patch_triangulation(
+        cells, p, cells.cell_verts if use_other_verts is None else
+        use_other_verts)
 
-        # Average color value of each cell membrane, situated at the midpoint
-        # of that membrane. This parameter is referred to as "C" in both the
-        # documentation and implementation of the tripcolor() function.
-        dati = data_verts[cells.cell_to_mems[i]]
-
-        # "matplotlib.collections.TriMesh" instance providing the
-        # Gouraud-shaded triangulation mesh for the non-triangular vertices of
-        # this cell from the Delaunay hull of these vertices.
-        col_cell = ax.tripcolor(x, y, dati, shading='gouraud', cmap=clrmap)
-
-        #FIXME: No need to manually call set_clim() here. Instead, pass the
-        #"vmin=amin, vmax=amax" parameters to the above tripcolor() call.
-
-        # Autoscale this mesh's colours as desired.
-        col_cell.set_clim(amin, amax)
+    # Cell membrane (Vmem) plotter, Gouraud-shading the
+    # patches of all cells as a single "matplotlib.collections.TriMesh"
+    # instance rather than one such instance per cell.
+    col_cell = ax.tripcolor(
+        triangulation, data_verts[triangulation_mems],
+        shading='gouraud', cmap=clrmap, vmin=amin, vmax=amax)
 
     return col_cell, ax
 
@@ -1381,7 +1426,7 @@ def env_mesh(data, ax, cells, p, clrmap, ignore_showCells=False):
                 extent=[p.um*cells.xmin,p.um*cells.xmax,p.um*cells.ymin,p.um*cells.ymax],cmap=clrmap)
 
     if p.showCells is True and ignore_showCells is False:
-        cell_edges_flat = p.um*cells.mem_edges_flat
+        cell_edges_flat = _get_upscaled(cells, p, 'mem_edges_flat')
         coll = LineCollection(cell_edges_flat,colors='k')
         coll.set_alpha(0.5)
         ax.add_collection(coll)
@@ -1418,10 +1463,651 @@ def cell_mosaic(
     ax                  Modified axis
     """
 
-    # define a polygon collection based on individual cell polygons
-    points = np.multiply(cells.cell_verts, p.um)
-    collection =  PolyCollection(points, cmap=clrmap, edgecolors='none')
-    collection.set_array(data)
+    # Define a single polygon collection of all cell polygons, rasterized for
+    # large cell clusters to avoid emitting one vector path per cell when
+    # saving to vector formats (e.g., PDF, SVG).
+    points = _get_upscaled_cell_verts_padded(cells, p)
+    collection = PolyCollection(
+        points,
+        array=data,
+        cmap=clrmap,
+        edgecolors='none',
+        rasterized=len(points) > _RASTERIZE_ITEMS_MIN,
+    )
     ax.add_collection(collection)
 
     return collection, ax
+
+# ....................{ PLOTTERS ~ labels                  }....................
+def plot_index_labels(ax, points, p, zorder=3, max_labels=_INDEX_LABELS_MAX):
+    '''
+    Print the 0-based index of each of the passed points (e.g., cell centres,
+    membrane midpoints) as a text label centred on that point of the passed
+    axes.
+
+    All labels are drawn as a single collection of glyph paths rather than as
+    one text artist per point. Like text, these glyphs are sized in points and
+    hence remain the same size regardless of the zoom level of these axes.
+
+    If more than ``max_labels`` points are passed, this function reduces to a
+    noop after logging a non-fatal warning.
+
+    Parameters
+    -----------
+    ax : matplotlib.axes.Axes
+        Axes to print these labels onto.
+    points : ndarray
+        Two-dimensional array of the X and Y coordinates of these points in
+        meters, whose first dimension indexes these points.
+    p : Parameters
+        Current simulation configuration.
+    zorder : float
+        Z-order of these labels with respect to other artists. Defaults to the
+        default z-order of matplotlib text artists.
+    max_labels : optional[int]
+        Maximum number of points to be labelled. If ``None``, all points are
+        unconditionally labelled. Defaults to :data:`_INDEX_LABELS_MAX`.
+    '''
+
+    # If labelling these points would be unreadable, warn and return.
+    if max_labels is not None and len(points) > max_labels:
+        logs.log_warning(
+            'Ignoring index labels for %d points '
+            '(i.e., more than %d points).', len(points), max_labels)
+        return
+
+    # Default font size of text artists in points.
+    font_size = FontProperties().get_size_in_points()
+
+    # Single collection of all labels, offset to these points in data
+    # coordinates. As with scatter plots, a size of 1 scales these glyph paths
+    # from points to pixels at the current DPI when drawn.
+    labels = PathCollection(
+        [_get_index_label_path(index, font_size)
+         for index in range(len(points))],
+        sizes=(1,),
+        offsets=p.um*np.asarray(points),
+        offset_transform=ax.transData,
+        transform=IdentityTransform(),
+        facecolors=plt.rcParams['text.color'],
+        edgecolors='none',
+        zorder=zorder,
+    )
+    ax.add_collection(labels, autolim=False)
+
+# ....................{ PRIVATE ~ getters                  }....................
+def _get_float32(data):
+    '''
+    Contiguous single-precision copy of the passed array-like object if this
+    object is *not* already a contiguous single-precision array *or* this
+    array as is otherwise.
+
+    Since matplotlib ultimately renders colours at 8 bits per channel, double
+    precision is wasted on plotted data. Single precision halves the memory
+    bandwidth of colour mapping and rendering this data. Masked arrays retain
+    their masks.
+
+    Parameters
+    -----------
+    data : ArrayLike
+        Array-like object to be plotted.
+    '''
+
+    if ma.isMaskedArray(data):
+        return data.astype(np.float32, copy=False)
+    return np.ascontiguousarray(data, dtype=np.float32)
+
+
+def _get_gap_junction_segments(cells, p):
+    '''
+    Read-only three-dimensional array of the upscaled line segments connecting
+    the centres of each pair of cells coupled by a gap junction in the passed
+    cell cluster, whose dimensions index (in order) gap junctions, the two
+    endpoints of each segment, and the X and Y coordinates of each endpoint.
+
+    This array is cached until either the cell centres or gap junction
+    indices of this cluster are reassigned *or* this cluster is
+    garbage-collected.
+
+    Parameters
+    -----------
+    cells : Cells
+        Current cell cluster.
+    p : Parameters
+        Current simulation configuration.
+    '''
+
+    # Original arrays and dictionary of previously derived arrays.
+    cell_centres = cells.cell_centres
+    gap_jun_i = cells.gap_jun_i
+    cells_derived = _CELLS_DERIVED.setdefault(cells, {})
+
+    # If these segments were previously upscaled by the same factor from the
+    # same arrays, reuse these segments.
+    segs_cached = cells_derived.get('gap_jun_segs')
+    if (segs_cached is not None and
+        segs_cached[0][0] is cell_centres and
+        segs_cached[0][1] is gap_jun_i and
+        segs_cached[1] == p.um):
+        return segs_cached[2]
+
+    # Else, upscale only the centres of coupled cells with a single fancy
+    # index and cache the resulting segments.
+    segs = _get_upscaled(cells, p, 'cell_centres')[np.asarray(gap_jun_i)]
+    segs.setflags(write=False)
+    cells_derived['gap_jun_segs'] = ((cell_centres, gap_jun_i), p.um, segs)
+
+    # Return these segments.
+    return segs
+
+
+def _get_mask_inverted(cells, attr_name):
+    '''
+    Read-only logical inversion of the passed boolean mask attribute of the
+    passed cell cluster (e.g., ``maskM``), suitable for masking data outside
+    this mask with :func:`numpy.ma.masked_array`.
+
+    This array is cached until this attribute is reassigned (e.g., on
+    rebuilding this cluster) *or* this cluster is garbage-collected.
+
+    Parameters
+    -----------
+    cells : Cells
+        Current cell cluster.
+    attr_name : str
+        Name of the mask attribute of this cluster to be inverted.
+    '''
+
+    # Original mask and dictionary of previously derived arrays.
+    mask = getattr(cells, attr_name)
+    cells_derived = _CELLS_DERIVED.setdefault(cells, {})
+    mask_key = '~' + attr_name
+
+    # If this mask was previously inverted, reuse this inverted mask.
+    mask_cached = cells_derived.get(mask_key)
+    if mask_cached is not None and mask_cached[0] is mask:
+        return mask_cached[2]
+
+    # Else, invert and cache this mask.
+    mask_inverted = np.logical_not(mask)
+    mask_inverted.setflags(write=False)
+    cells_derived[mask_key] = (mask, None, mask_inverted)
+
+    # Return this mask.
+    return mask_inverted
+
+
+def _get_mem_quiver_tails(cells, p):
+    '''
+    2-tuple ``(mem_centres, mem_radii)`` of read-only arrays of the upscaled
+    centre and radius of the cell containing each membrane of the passed cell
+    cluster, suitable for anchoring membrane vectors at cell centres.
+
+    These arrays are cached until either the cell centres, cell radii, or
+    membrane-to-cell indices of this cluster are reassigned *or* this cluster
+    is garbage-collected.
+
+    Parameters
+    -----------
+    cells : Cells
+        Current cell cluster.
+    p : Parameters
+        Current simulation configuration.
+    '''
+
+    # Original arrays and dictionary of previously derived arrays.
+    cell_centres = cells.cell_centres
+    cell_radii = cells.R
+    mem_to_cells = cells.mem_to_cells
+    cells_derived = _CELLS_DERIVED.setdefault(cells, {})
+
+    # If these arrays were previously upscaled by the same factor from the
+    # same arrays, reuse these arrays.
+    tails_cached = cells_derived.get('mem_quiver_tails')
+    if (tails_cached is not None and
+        tails_cached[0][0] is cell_centres and
+        tails_cached[0][1] is cell_radii and
+        tails_cached[0][2] is mem_to_cells and
+        tails_cached[1] == p.um):
+        return tails_cached[2]
+
+    # Else, index the upscaled cell centres and radii onto membranes once and
+    # cache the resulting arrays.
+    mem_centres = _get_upscaled(cells, p, 'cell_centres')[mem_to_cells]
+    mem_radii = np.multiply(cell_radii[mem_to_cells], p.um)
+    mem_centres.setflags(write=False)
+    mem_radii.setflags(write=False)
+    tails = (mem_centres, mem_radii)
+    cells_derived['mem_quiver_tails'] = (
+        (cell_centres, cell_radii, mem_to_cells), p.um, tails)
+
+    # Return these arrays.
+    return tails
+
+
+def _get_patch_triangulation(cells, p, cell_verts):
+    '''
+    2-tuple ``(triangulation, triangulation_mems)`` describing the upscaled
+    Delaunay triangulations of the passed cell vertices of the passed cell
+    cluster, merged into a single triangulation, where:
+
+    * ``triangulation`` is a :class:`matplotlib.tri.Triangulation` instance
+      whose triangles are the union of the triangles of all cells. Since the
+      vertices of adjacent cells are *not* merged, data is *not* interpolated
+      across cell boundaries.
+    * ``triangulation_mems`` is a read-only array of the indices of the
+      membranes situated at each vertex of this triangulation, suitable for
+      indexing membrane data onto these vertices.
+
+    This tuple is cached until the passed vertices are replaced *or* this
+    cluster is garbage-collected.
+
+    Parameters
+    -----------
+    cells : Cells
+        Current cell cluster.
+    p : Parameters
+        Current simulation configuration.
+    cell_verts : SequenceTypes
+        Sequence of the vertices of each cell of this cluster (e.g.,
+        ``cells.cell_verts``).
+    '''
+
+    # Dictionary of previously derived arrays.
+    cells_derived = _CELLS_DERIVED.setdefault(cells, {})
+
+    # If these vertices were previously triangulated at the same scale, reuse
+    # this triangulation.
+    triangulation_cached = cells_derived.get('patch_triangulation')
+    if (triangulation_cached is not None and
+        triangulation_cached[0] is cell_verts and
+        triangulation_cached[1] == p.um):
+        return triangulation_cached[2]
+
+    # Else, triangulate the vertices of each cell in isolation (as the
+    # tripcolor() function does when passed only these vertices).
+    triangulation = mplutil.triangulate_polygons(
+        p.um*np.asarray(cell_verts_i) for cell_verts_i in cell_verts)
+    triangulation_mems = np.concatenate(
+        [np.asarray(mems_i, dtype=int) for mems_i in cells.cell_to_mems])
+    triangulation_mems.setflags(write=False)
+
+    # Cache and return this triangulation.
+    triangulation_info = (triangulation, triangulation_mems)
+    cells_derived['patch_triangulation'] = (
+        cell_verts, p.um, triangulation_info)
+    return triangulation_info
+
+
+def _get_grid_to_cells_nearest(cells):
+    '''
+    Read-only two-dimensional array of the 0-based index of the cell whose
+    centre is nearest each point of the environmental grid of the passed cell
+    cluster, with the same shape as the ``X`` and ``Y`` grids of this cluster.
+
+    Indexing cell data by this array is equivalent to (but considerably faster
+    than) nearest-neighbour interpolation of that data onto this grid with
+    :func:`scipy.interpolate.griddata`, which rebuilds a k-d tree of all cell
+    centres on each call.
+
+    This array is cached until the cell centres or environmental grid of this
+    cluster are reassigned *or* this cluster is garbage-collected.
+
+    Parameters
+    -----------
+    cells : Cells
+        Current cell cluster.
+    '''
+
+    # Original arrays and dictionary of previously derived arrays.
+    cell_centres = cells.cell_centres
+    grid_x = cells.X
+    grid_y = cells.Y
+    cells_derived = _CELLS_DERIVED.setdefault(cells, {})
+
+    # If these indices were previously derived from the same arrays, reuse
+    # these indices.
+    indices_cached = cells_derived.get('grid_to_cells_nearest')
+    if (indices_cached is not None and
+        indices_cached[0][0] is cell_centres and
+        indices_cached[0][1] is grid_x and
+        indices_cached[0][2] is grid_y):
+        return indices_cached[2]
+
+    # Else, query the nearest cell centre to each grid point and cache the
+    # resulting indices.
+    _, indices = cKDTree(cell_centres).query(
+        np.column_stack((np.ravel(grid_x), np.ravel(grid_y))))
+    indices = indices.reshape(np.shape(grid_x))
+    indices.setflags(write=False)
+    cells_derived['grid_to_cells_nearest'] = (
+        (cell_centres, grid_x, grid_y), None, indices)
+
+    # Return these indices.
+    return indices
+
+
+@lru_cache(maxsize=None)
+def _get_index_label_path(index, font_size):
+    '''
+    Glyph path of the passed 0-based index rendered in the default font at
+    the passed size in points, centred on the origin.
+
+    Since the same indices are labelled on most plots of a simulation phase,
+    these paths are cached rather than re-rendered on each plot. Since callers
+    may label arbitrarily many points in index order, this cache is unbounded;
+    a bounded least-recently-used cache smaller than the number of labelled
+    points would evict every path before reusing it.
+
+    Parameters
+    -----------
+    index : int
+        0-based index to be rendered.
+    font_size : float
+        Font size in points to render this index at.
+    '''
+
+    # Render this index and centre the bounding box of the result on the
+    # origin, as the "center" alignments of text artists do.
+    path = TextPath((0, 0), str(index), size=font_size)
+    extents = path.get_extents()
+    return path.transformed(Affine2D().translate(
+        -(extents.x0 + extents.x1)/2, -(extents.y0 + extents.y1)/2))
+
+
+def _get_mems_to_cells_mean(cells):
+    '''
+    Sparse matrix in compressed sparse row (CSR) format averaging data defined
+    on the membranes of the passed cell cluster onto the cells of this
+    cluster, whose rows index cells and whose columns index membranes.
+
+    Left-multiplying membrane data by this matrix is equivalent to (but
+    considerably faster than) calling :func:`cell_ave` on that data, and
+    remains so for two-dimensional data whose first dimension indexes
+    membranes.
+
+    This matrix is cached until the membrane-to-cell mapping of this cluster
+    is reassigned (e.g., on rebuilding this cluster) *or* this cluster is
+    garbage-collected.
+
+    Parameters
+    -----------
+    cells : Cells
+        Current cell cluster.
+    '''
+
+    # Original mapping and dictionary of previously derived arrays.
+    mem_to_cells = cells.mem_to_cells
+    cells_derived = _CELLS_DERIVED.setdefault(cells, {})
+
+    # If this matrix was previously built from the same mapping, reuse it.
+    matrix_cached = cells_derived.get('mems_to_cells_mean')
+    if matrix_cached is not None and matrix_cached[0] is mem_to_cells:
+        return matrix_cached[2]
+
+    # Else, weight each membrane by the reciprocal of the number of membranes
+    # of its cell and cache the resulting matrix.
+    mem_to_cells_arr = np.asarray(mem_to_cells)
+    cells_num = len(cells.cell_i)
+    mems_num = len(mem_to_cells_arr)
+    mems_per_cell = np.bincount(mem_to_cells_arr, minlength=cells_num)
+    matrix = csr_matrix(
+        (1/mems_per_cell[mem_to_cells_arr],
+         (mem_to_cells_arr, np.arange(mems_num))),
+        shape=(cells_num, mems_num))
+    cells_derived['mems_to_cells_mean'] = (mem_to_cells, None, matrix)
+
+    # Return this matrix.
+    return matrix
+
+
+def _get_min_max(data):
+    '''
+    2-tuple ``(data_min, data_max)`` of the minimum and maximum values of the
+    passed array-like object, typically used to autoscale colorbars.
+
+    Both reductions are performed over a single contiguous one-dimensional
+    view of this data, ensuring that each reduction streams over memory
+    without copying non-contiguous data more than once.
+
+    Parameters
+    -----------
+    data : ArrayLike
+        Array-like object to be reduced.
+    '''
+
+    data = np.ravel(data)
+    return data.min(), data.max()
+
+
+def _get_upscaled_cell_verts_padded(cells, p):
+    '''
+    Read-only three-dimensional array of the upscaled vertices of all cells
+    of the passed cell cluster, whose dimensions index (in order) cells, the
+    vertices of each cell, and the X and Y coordinates of each vertex.
+
+    Since cells may have differing numbers of vertices, the vertices of each
+    cell with fewer vertices than the cell with the most vertices are padded
+    by repeating the last vertex of that cell. These degenerate edges have no
+    visible effect on filled polygons but permit this array to be regular,
+    which :class:`matplotlib.collections.PolyCollection` converts into paths
+    considerably faster than a ragged sequence of arrays.
+
+    This array is cached until the cell vertices of this cluster are
+    reassigned *or* this cluster is garbage-collected.
+
+    Parameters
+    -----------
+    cells : Cells
+        Current cell cluster.
+    p : Parameters
+        Current simulation configuration.
+    '''
+
+    # Upscaled (and possibly ragged) cell vertices.
+    cell_verts = _get_upscaled(cells, p, 'cell_verts')
+
+    # If these vertices are already regular, reuse these vertices as is.
+    if cell_verts.ndim == 3:
+        return cell_verts
+
+    # Dictionary of previously derived arrays.
+    cells_derived = _CELLS_DERIVED.setdefault(cells, {})
+
+    # If these vertices were previously padded, reuse these padded vertices.
+    verts_cached = cells_derived.get('cell_verts_padded')
+    if verts_cached is not None and verts_cached[0] is cell_verts:
+        return verts_cached[2]
+
+    # Else, pad and cache these vertices.
+    verts_num_max = max(len(cell_verts_i) for cell_verts_i in cell_verts)
+    verts_padded = np.empty((len(cell_verts), verts_num_max, 2))
+    for cell_index, cell_verts_i in enumerate(cell_verts):
+        verts_num = len(cell_verts_i)
+        verts_padded[cell_index, :verts_num] = cell_verts_i
+        verts_padded[cell_index, verts_num:] = cell_verts_i[-1]
+    verts_padded.setflags(write=False)
+    cells_derived['cell_verts_padded'] = (cell_verts, None, verts_padded)
+
+    # Return these padded vertices.
+    return verts_padded
+
+
+def _get_upscaled_extent(cells, p):
+    '''
+    4-tuple ``(xmin, xmax, ymin, ymax)`` of the minimum and maximum X and Y
+    coordinates of the environmental grid of the passed cell cluster upscaled
+    from meters to micrometers, suitable for passing as the ``extent`` of
+    :mod:`matplotlib` images and axes.
+
+    Parameters
+    -----------
+    cells : Cells
+        Current cell cluster.
+    p : Parameters
+        Current simulation configuration.
+    '''
+
+    # Since these are merely four scalars, these coordinates are trivially
+    # recomputed rather than cached.
+    return (cells.xmin*p.um, cells.xmax*p.um, cells.ymin*p.um, cells.ymax*p.um)
+
+
+def _get_stream_linewidths(magnitudes):
+    '''
+    Array of the widths of all streamlines plotted for the vector field with
+    the passed magnitudes, linearly mapping these magnitudes onto the range
+    ``[0.5, 3.5]``.
+
+    Non-finite widths (e.g., due to non-finite magnitudes in corrupted time
+    steps) are replaced by the minimum width of 0.5. Non-finite widths are
+    *not* merely cosmetic; they force :func:`matplotlib.pyplot.streamplot`
+    collections onto a pathologically slow path.
+
+    Parameters
+    -----------
+    magnitudes : ndarray
+        Magnitudes of this vector field.
+
+    Returns
+    -----------
+    ndarray
+        Finite streamline widths of the same shape as these magnitudes.
+    '''
+
+    # Scale these magnitudes by a scalar factor into a single new array, then
+    # offset and sanitize that array in-place rather than allocating a new
+    # temporary array for each arithmetic operation.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        line_widths = np.multiply(magnitudes, 3.0/np.nanmax(magnitudes))
+        line_widths += 0.5
+    np.nan_to_num(line_widths, copy=False, nan=0.5, posinf=0.5, neginf=0.5)
+    return line_widths
+
+
+def _get_triangulation(cells, p, attr_name):
+    '''
+    Delaunay triangulation of the upscaled two-dimensional coordinates of the
+    passed cell cluster attribute (e.g., ``cell_centres``), suitable for
+    passing to :func:`matplotlib.pyplot.tripcolor` in place of these
+    coordinates.
+
+    This triangulation is cached until this attribute is reassigned (e.g., on
+    rebuilding this cluster) *or* this cluster is garbage-collected.
+
+    Parameters
+    -----------
+    cells : Cells
+        Current cell cluster.
+    p : Parameters
+        Current simulation configuration.
+    attr_name : str
+        Name of the coordinates array attribute of this cluster.
+    '''
+
+    # Upscaled coordinates and dictionary of previously derived arrays.
+    coords = _get_upscaled(cells, p, attr_name)
+    cells_derived = _CELLS_DERIVED.setdefault(cells, {})
+    triangulation_key = 'triangulation ' + attr_name
+
+    # If these coordinates were previously triangulated, reuse this
+    # triangulation.
+    triangulation_cached = cells_derived.get(triangulation_key)
+    if (triangulation_cached is not None and
+        triangulation_cached[0] is coords):
+        return triangulation_cached[2]
+
+    # Else, triangulate and cache these coordinates.
+    triangulation = Triangulation(coords[:, 0], coords[:, 1])
+    cells_derived[triangulation_key] = (coords, None, triangulation)
+
+    # Return this triangulation.
+    return triangulation
+
+
+def _get_unit_vectors(Fx, Fy):
+    '''
+    3-tuple ``(Ux, Uy, Fmag)`` of the X and Y components of the unit vector
+    field in the direction of the passed vector field and the magnitude of
+    the passed vector field.
+
+    Vectors of zero magnitude remain zero vectors rather than dividing by zero.
+
+    Parameters
+    -----------
+    Fx, Fy : ndarray
+        X and Y components of this vector field.
+    '''
+
+    # Magnitude of this field.
+    Fmag = np.hypot(Fx, Fy)
+
+    # Reciprocal of each non-zero magnitude *OR* 0 for each zero magnitude,
+    # computed in a single conditional pass over these magnitudes.
+    Fmag_inv = np.zeros_like(Fmag)
+    np.divide(1.0, Fmag, out=Fmag_inv, where=Fmag > 0.0)
+
+    # Return this unit vector field and magnitude.
+    return Fx*Fmag_inv, Fy*Fmag_inv, Fmag
+
+
+def _get_upscaled(cells, p, attr_name):
+    '''
+    Read-only array of the coordinates of the passed cell cluster attribute
+    (e.g., ``mem_edges_flat``) upscaled from meters to micrometers.
+
+    This array is cached until this attribute is reassigned (e.g., on
+    rebuilding this cluster) *or* this cluster is garbage-collected.
+
+    Parameters
+    -----------
+    cells : Cells
+        Current cell cluster.
+    p : Parameters
+        Current simulation configuration.
+    attr_name : str
+        Name of the array attribute of this cluster to be upscaled.
+
+    Returns
+    -----------
+    ndarray
+        Read-only upscaled copy of this array.
+    '''
+
+    # Original array and dictionary of previously derived arrays.
+    data = getattr(cells, attr_name)
+    cells_upscaled = _CELLS_DERIVED.setdefault(cells, {})
+
+    # If this array was previously upscaled by the same factor, reuse this
+    # upscaled array.
+    data_cached = cells_upscaled.get(attr_name)
+    if (data_cached is not None and
+        data_cached[0] is data and
+        data_cached[1] == p.um):
+        return data_cached[2]
+
+    # Else, upscale and cache this array.
+    data_upscaled = p.um*np.asarray(data)
+    data_upscaled.setflags(write=False)
+    cells_upscaled[attr_name] = (data, p.um, data_upscaled)
+
+    # Return this array.
+    return data_upscaled
+
+
+@lru_cache(maxsize=32)
+def _get_rfftfreq(sample_size, sample_spacing):
+    '''
+    Read-only array of the sample frequencies of the real FFT of a signal with
+    the passed number of samples and sample spacing, as returned by the
+    :func:`scipy.fft.rfftfreq` function.
+
+    Since these frequencies depend only on these parameters (which are
+    typically identical for all cells of the same simulation), this array is
+    memoized across calls. This array is read-only to prevent callers from
+    accidentally modifying this shared array.
+    '''
+
+    f_axis = rfftfreq(sample_size, d=sample_spacing)
+    f_axis.setflags(write=False)
+    return f_axis
@@ -9,6 +9,7 @@ dependencies synopsizing application requirements) functionality.
 '''
 
 # ....................{ IMPORTS                           }....................
+import sys
 # from betse.util.io.log import logs
 from betse.util.type.types import (
     type_check, MappingType, ModuleType, IterableTypes)
@@ -26,6 +27,23 @@ application dependency metadata module passed as input to the
 :func:`merge_module_metadeps` function via the ``modules_metadeps`` parameter.
 '''
 
+
+_MODULE_METADEPS_MERGED = {}
+'''
+Dictionary mapping from the 2-tuple ``(module_name, modules_metadeps)`` of the
+parameters previously passed to the :func:`merge_module_metadeps` function to
+a 2-tuple ``(module_metadeps, modules_dicts)`` of the application dependency
+metadata module returned by that call and a shallow copy of the list of lists
+of all global dictionaries defined by these input modules when merged, where
+``modules_metadeps`` is the tuple of all input modules merged by that call.
+
+Input modules are keyed by identity rather than by :func:`id`, as the latter
+could be reused by unrelated modules if these modules were ever
+garbage-collected. Since these modules are typically imported and hence
+retained by :data:`sys.modules` anyway, strongly referencing these modules
+here is assumed to be harmless.
+'''
+
 # ....................{ MAKERS                            }....................
 #FIXME: Improve documentation with respect to key collisions. Specifically,
 #provide concrete examples without code (which would probably be a bit too
@@ -74,6 +92,13 @@ def merge_module_metadeps(
 
     Caveats
     ----------
+    **This function is memoized.** If this function was previously passed the
+    same module name and input modules *and* the global dictionaries defined by
+    these modules are unchanged since that call *and* no other module of the
+    same name has since been registered with :data:`sys.modules`, this
+    function returns the module previously created by that call rather than
+    creating a new module (and hence raising no exception).
+
     **Order is insignificant.** If any of the requisite global dictionaries
     defined by any of the passed modules contain one or more key-value pairs
     contained in any other dictionary of the same name defined by any other
@@ -98,7 +123,9 @@ def merge_module_metadeps(
         these modules **item-collide** (i.e., if any key-value pair in any such
         dictionary is also a key-value pair in any other such dictionary).
     BetseModuleException
-        If a module with this target module name already exists.
+        If a module with this target module name already exists, excluding a
+        module previously created by a memoized call to this function (see
+        above).
     BetseTypeException
         If any of the requisite attributes defined by any of these modules are
         *not* dictionaries.
@@ -137,20 +164,45 @@ def merge_module_metadeps(
             obj=modules_metadeps[0], attr_name='RequirementCommand'),
     }
 
-    # For the name of each such global dictionary...
-    for module_dict_name in MERGE_MODULE_METADEPS_DICTS_NAME:
-        # Generator comprehension aggregating all of the global dictionaries
-        # defined by all of these input modules, raising exceptions if any such
-        # module fails to define such a dictionary.
-        src_modules_dict = (
+    # List of lists of all global dictionaries defined by each of these input
+    # modules, fetched in a single pass over these modules and raising
+    # exceptions if any such module fails to define such a dictionary.
+    src_modules_dicts = [
+        [
             objects.get_attr(
                 obj=modules_metadep,
                 attr_name=module_dict_name,
                 attr_type=MappingType,
             )
-            for modules_metadep in modules_metadeps
-        )
-
+            for module_dict_name in MERGE_MODULE_METADEPS_DICTS_NAME
+        ]
+        for modules_metadep in modules_metadeps
+    ]
+
+    # 2-tuple of the module previously merged from these modules under this
+    # name and the dictionaries merged into that module if any *OR* "None".
+    trg_module_metadeps_key = (module_name, tuple(modules_metadeps))
+    trg_module_metadeps_cached = _MODULE_METADEPS_MERGED.get(
+        trg_module_metadeps_key)
+
+    # If these modules were previously merged into a module of this name...
+    if trg_module_metadeps_cached is not None:
+        trg_module_metadeps, src_modules_dicts_cached = (
+            trg_module_metadeps_cached)
+
+        # If neither these dictionaries have since changed *NOR* has another
+        # module of this name since been registered, return that module as is.
+        if (src_modules_dicts == src_modules_dicts_cached and
+            sys.modules.get(module_name, trg_module_metadeps) is
+            trg_module_metadeps):
+            return trg_module_metadeps
+        # Else, that module is stale. Remerge these modules below.
+    # Else, these modules have yet to be merged into a module of this name.
+
+    # For the name of each such global dictionary and the tuple of all
+    # dictionaries of that name defined by all of these input modules...
+    for module_dict_name, src_modules_dict in zip(
+        MERGE_MODULE_METADEPS_DICTS_NAME, zip(*src_modules_dicts)):
         # Merge these dictionaries into the dictionary to be returned, raising
         # exceptions if any requirement defined by any such dictionary
         # item-collides (i.e., if any key-value pair in any such dictionary is
@@ -176,5 +228,15 @@ dependencies synopsizing application requirements), dynamically merged from the
 {} modules.'''.format(src_modules_metadeps_name),
     )
 
+    # Cache this module with shallow copies of these dictionaries, enabling
+    # subsequent calls to detect changes to these dictionaries.
+    _MODULE_METADEPS_MERGED[trg_module_metadeps_key] = (
+        trg_module_metadeps,
+        [
+            [dict(src_module_dict) for src_module_dict in src_module_dicts]
+            for src_module_dicts in src_modules_dicts
+        ],
+    )
+
     # Return this module.
     return trg_module_metadeps
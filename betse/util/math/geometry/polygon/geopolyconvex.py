@@ -21,6 +21,7 @@ boundary remain strictly inside the polygon) functionality.
 #possibly be our first avenue of inquiry.
 
 # ....................{ IMPORTS                           }....................
+import numpy as np
 from betse.util.io.log import logs
 from betse.util.math.geometry import geopoint
 from betse.util.math.geometry.polygon import geopoly
@@ -191,6 +192,11 @@ def clip_counterclockwise(
     # True only if the next subject vertex resides inside this clip polygon.
     is_subj_vert_next_inside = None
 
+    # List of Python booleans, each True only if the corresponding vertex of
+    # the previous version of the clipped subject polygon resides inside this
+    # clip polygon.
+    is_subj_verts_inside = None
+
     # For each next vertex of the clip polygon to clip against...
     for clip_vert_next in clip_polygon:
         # If the previous iteration of the inner loop clipped the last three
@@ -212,31 +218,38 @@ def clip_counterclockwise(
         # least one vertex along this edge to this sequence.
         subj_poly_curr = []
 
-        # Current vertex of the previous version of the clipped subject polygon
-        # to be clipped, initialized to the last vertex of this polygon.
-        subj_vert_curr = subj_poly_prev[-1]
-
-        # This vertex resides inside this clip polygon if and only if this
-        # vertex is spatially situated to the left of the vector signifying the
-        # current edge of this clip polygon oriented in the counter-clockwise
+        # Each vertex of the previous version of the clipped subject polygon
+        # resides inside this clip polygon if and only if this vertex is
+        # spatially situated to the left of the vector signifying the current
+        # edge of this clip polygon oriented in the counter-clockwise
         # orientation of this clip polygon, whose:
         #
         # * Head is the next vertex of this clip polygon.
         # * Tail is the current vertex of this clip polygon.
-        is_subj_vert_curr_inside = geopoint.is_left_of_vector(
-            subject_point=subj_vert_curr,
-            vector_head_point=clip_vert_next,
-            vector_tail_point=clip_vert_curr,)
+        #
+        # For efficiency, this test is vectorized over all such vertices at
+        # once rather than performed by the geopoint.is_left_of_vector()
+        # function for each vertex, whose derivation this test mirrors. The
+        # resulting array of booleans is then converted into a list of Python
+        # booleans, as iterating the latter in the inner loop below is cheaper
+        # than iterating Numpy boolean scalars.
+        subj_verts = np.asarray(subj_poly_prev, dtype=float)
+        is_subj_verts_inside = (
+            (clip_vert_next[0] - clip_vert_curr[0])*
+                (subj_verts[:, 1] - clip_vert_curr[1]) >
+            (clip_vert_next[1] - clip_vert_curr[1])*
+                (subj_verts[:, 0] - clip_vert_curr[0])
+        ).tolist()
+
+        # Current vertex of the previous version of the clipped subject polygon
+        # to be clipped, initialized to the last vertex of this polygon.
+        subj_vert_curr = subj_poly_prev[-1]
+        is_subj_vert_curr_inside = is_subj_verts_inside[-1]
 
         # For each next vertex of the previous version of the clipped subject
-        # polygon...
-        for subj_vert_next in subj_poly_prev:
-            # This vertex resides inside this clip polygon if and only if this
-            # vertex is spatially situated to the left of the same vector.
-            is_subj_vert_next_inside = geopoint.is_left_of_vector(
-                subject_point=subj_vert_next,
-                vector_head_point=clip_vert_next,
-                vector_tail_point=clip_vert_curr,)
+        # polygon and whether this vertex resides inside this clip polygon...
+        for subj_vert_next, is_subj_vert_next_inside in zip(
+            subj_poly_prev, is_subj_verts_inside):
 
             # If the current and next vertices of the previous version of the
             # clipped subject polygon reside on different sides of the current
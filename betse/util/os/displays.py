@@ -13,7 +13,6 @@ High-level operating system (OS)-specific display facilities.
 # ....................{ IMPORTS                           }....................
 from betse.util.io.log import logs
 from betse.util.type.decorator.decmemo import func_cached
-from betse.util.type.iterable.mapping.mapcls import OrderedArgsDict
 from betse.util.type.types import type_check
 
 # ....................{ GLOBALS                           }....................
@@ -29,6 +28,17 @@ Defaults to ``None``, in which case the :func:`is_headless` function performs
 such detection rather than returning the value of this boolean.
 '''
 
+
+_is_headless_detected = None
+'''
+``True`` or ``False`` only if the :func:`_is_headless` function has been called
+at least once, in which case this boolean caches the costly detection performed
+by the first call to that function.
+
+Defaults to ``None``, in which case that function has yet to perform that
+detection.
+'''
+
 # ....................{ TESTERS                           }....................
 @func_cached
 def is_dpi_scaling() -> bool:
@@ -106,13 +116,41 @@ def is_headless() -> bool:
     return _is_headless()
 
 
-@func_cached
 def _is_headless() -> bool:
     '''
     ``True`` only if the active Python interpreter is running **headless**
     (i.e., with *no* access to a GUI display, often due to running remotely
     over an SSH-encrypted connection supporting only CLI input and output).
 
+    This function internally caches the costly detection performed by the
+    :func:`_detect_headless` function on the first call to this function into
+    the private :data:`_is_headless_detected` global. Since this tester is
+    called on every call to the public :func:`is_headless` tester, this global
+    is preferred to the more general-purpose :func:`func_cached` decorator.
+
+    See Also
+    ----------
+    :func:`_detect_headless`
+        Further details.
+    '''
+
+    # Enable this global to be locally set.
+    global _is_headless_detected
+
+    # If this detection has yet to be performed, do so and cache the result.
+    if _is_headless_detected is None:
+        _is_headless_detected = _detect_headless()
+
+    # Return this cached boolean.
+    return _is_headless_detected
+
+
+def _detect_headless() -> bool:
+    '''
+    ``True`` only if the active Python interpreter is running **headless**
+    (i.e., with *no* access to a GUI display, often due to running remotely
+    over an SSH-encrypted connection supporting only CLI input and output).
+
     Specifically, this function returns:
 
     * If the :func:`set_headless` function has been called at least once, the
@@ -144,43 +182,50 @@ def _is_headless() -> bool:
             environment.
     '''
 
+    # Avoid circular import dependencies. To avoid importing modules specific
+    # to platforms other than the current platform, each such module is
+    # imported only after detecting all prior platforms to be irrelevant.
+    from betse.util.os.brand import windows
+
+    # If this is Windows, this interpreter is usually headfull. While certain
+    # server-specific variants of Windows can and often are run headless
+    # (e.g., Windows Nano Server), there appears to be no known means of
+    # reliably distinguishing a headless from headfull Windows environment in
+    # pure Python. For safety, assume the latter.
+    if windows.is_windows():
+        return False
+    # Else, this is a POSIX-compatible platform.
+
     # Avoid circular import dependencies.
-    from betse.util.os.brand import linux, macos, posix, windows
-
-    # The active Python interpreter is headfull if and only if either...
-    is_os_headfull = (
-        # This is Windows, in which case this interpreter is usually headfull.
-        # While certain server-specific variants of Windows can and often are
-        # run headless (e.g., Windows Nano Server), there appears to be no
-        # known means of reliably distinguishing a headless from headfull
-        # Windows environment in pure Python. For safety, assume the latter.
-        windows.is_windows() or
-
-        # Else, this is a POSIX-compatible platform.
-        #
-        # Since all POSIX-compatible platforms of interest support the popular
-        # X11 display server, detect this server first.
-        posix.is_x11() or
-
-        # Else, all possible alternative display servers specific to the
-        # current platform *MUST* be iteratively tested for.
-        #
-        # If Linux, the only remaining display servers are Mir and Wayland.
-        (linux.is_linux() and (linux.is_wayland() or linux.is_mir())) or
-
-        # If macOS, the only remaining display server is Aqua.
-        (macos.is_macos() and macos.is_aqua())
-
-        # Else, this platform is unrecognized. For safety, this platform is
-        # assumed to be headless.
-    )
+    from betse.util.os.brand import posix
 
-    # Return true only if this interpreter is *NOT* headfull.
+    # Since all POSIX-compatible platforms of interest support the popular X11
+    # display server, detect this server first.
+    if posix.is_x11():
+        return False
+    # Else, all possible alternative display servers specific to the current
+    # platform *MUST* be iteratively tested for.
+
+    # Avoid circular import dependencies.
+    from betse.util.os.brand import linux
+
+    # If Linux, the only remaining display servers are Mir and Wayland.
+    if linux.is_linux():
+        return not (linux.is_wayland() or linux.is_mir())
+
+    # Avoid circular import dependencies.
+    from betse.util.os.brand import macos
+
+    # If macOS, the only remaining display server is Aqua.
+    if macos.is_macos():
+        return not macos.is_aqua()
+
+    # Else, this platform is unrecognized. For safety, this platform is assumed
+    # to be headless.
     #
-    # Note that the "is_os_headfull" boolean intentionally contains the core
-    # detection logic, as detecting headfull environments is fundamentally
-    # more intuitive than detecting the converse.
-    return not is_os_headfull
+    # Note that the above logic intentionally detects headfull environments,
+    # as doing so is fundamentally more intuitive than detecting the converse.
+    return True
 
 # ....................{ SETTERS                           }....................
 @type_check
@@ -224,20 +269,20 @@ def set_headless(is_headless: bool) -> None:
     _is_headless_forced = is_headless
 
 # ....................{ GETTERS ~ metadata                }....................
-def get_metadata() -> OrderedArgsDict:
+def get_metadata() -> dict:
     '''
-    Ordered dictionary synopsizing the current display.
+    Dictionary synopsizing the current display.
     '''
 
     # Avoid circular import dependencies.
     from betse.util.os.brand import linux, macos, posix
 
     # Return this dictionary.
-    return OrderedArgsDict(
-        'headless',    is_headless(),
-        'dpi scaling', is_dpi_scaling(),
-        'aqua',        macos.is_aqua(),
-        'mir',         linux.is_mir(),
-        'wayland',     linux.is_wayland(),
-        'x11',         posix.is_x11(),
-    )
+    return {
+        'headless':    is_headless(),
+        'dpi scaling': is_dpi_scaling(),
+        'aqua':        macos.is_aqua(),
+        'mir':         linux.is_mir(),
+        'wayland':     linux.is_wayland(),
+        'x11':         posix.is_x11(),
+    }
@@ -19,12 +19,7 @@ from betse.util.type.types import (
     SequenceTypes,
     SequenceOrNoneTypes,
 )
-from cProfile import Profile
 from enum import Enum
-from functools import partial
-from io import StringIO
-from pstats import Stats
-from timeit import Timer
 
 # ....................{ ENUMS                             }....................
 ProfileType = Enum('ProfileType', ('NONE', 'CALL', 'SIZE',))
@@ -110,27 +105,21 @@ def time_callable(
         Stackoverflow answer strongly inspiring this implementation.
     '''
 
-    # Partial function binding this callable to these arguments. Avoid
-    # defaulting unpassed positional and keyword arguments to empty data
-    # structures, as doing so appears to substantially skew timings and hence
-    # should be avoided if feasible.
-    callable_bound = None
-
-    # If both positional and keyword arguments were passed, bind this callable
-    # to both.
-    if args and kwargs:
-        callable_bound = partial(call, *args, **kwargs)
-    # Else if only positional arguments were passed, bind this callable to only
-    # positional arguments.
-    elif args:
-        callable_bound = partial(call, *args)
-    # Else if only keyword arguments were passed, bind this callable to only
-    # keyword arguments.
-    elif kwargs:
-        callable_bound = partial(call, **kwargs)
-    # Else, call this callable as is.
-    else:
-        callable_bound = call
+    # Defer heavyweight imports.
+    from functools import partial
+    from timeit import Timer
+
+    # If either positional or keyword arguments were passed, partial function
+    # binding this callable to these arguments; else, this callable as is.
+    # Avoid binding this callable when no arguments were passed, as the
+    # partial function wrapping this callable appears to substantially skew
+    # timings and hence should be avoided if feasible. (Passing empty data
+    # structures to partial() is otherwise equivalent to omitting them.)
+    callable_bound = (
+        partial(call, *(args or ()), **(kwargs or {}))
+        if args or kwargs else
+        call
+    )
 
     # Return the minimum timing of this callable repeated this number of times.
     return min(Timer(callable_bound).repeat(repetitions, iterations))
@@ -182,8 +171,16 @@ def profile_callable(
         Value returned by this call.
     '''
 
+    # If profiling is disabled (i.e., the common case), call this callable
+    # directly. Doing so avoids both the profiler lookup and the keyword
+    # arguments passed to that profiler below.
+    if profile_type is ProfileType.NONE:
+        return call(*(args or ()), **(kwargs or {}))
+    # Else, profiling is enabled.
+
     # Private module function performing this type of profiling. Due to type
-    # checking, this type is guaranteed to be a valid key of this dictionary.
+    # checking *AND* the above test, this type is guaranteed to be a valid key
+    # of this dictionary.
     profiler = _PROFILE_TYPE_TO_PROFILER[profile_type]
 
     # Default unpassed positional and keyword arguments.
@@ -200,21 +197,6 @@ def profile_callable(
         profile_filename=profile_filename,
     )
 
-# ....................{ PROFILERS ~ none                  }....................
-def _profile_callable_none(
-    call, args, kwargs, is_profile_logged, profile_filename) -> object:
-    '''
-    Call the passed callable with the passed positional and keyword arguments
-    *without* profiling this call, returning the value returned by this call.
-
-    See Also
-    ----------
-    :func:`profile_callable`
-        Further details on function signature.
-    '''
-
-    return call(*args, **kwargs)
-
 # ....................{ PROFILERS ~ call                  }....................
 def _profile_callable_call(
     call, args, kwargs, is_profile_logged, profile_filename) -> object:
@@ -230,6 +212,11 @@ def _profile_callable_call(
         Further details on function signature.
     '''
 
+    # Defer heavyweight imports.
+    from cProfile import Profile
+    from io import StringIO
+    from pstats import Stats
+
     # Log this fact.
     logs.log_debug('Call-granularity profiling enabled.')
 
@@ -422,12 +409,12 @@ def _profile_callable_size(
 _PROFILE_TYPE_TO_PROFILER = {
     ProfileType.CALL: _profile_callable_call,
     # ProfileType.LINE: _profile_callable_line,
-    ProfileType.NONE: _profile_callable_none,
     ProfileType.SIZE: _profile_callable_size,
 }
 '''
-Dictionary mapping from each supported type of profiling to the module function
-performing this type of profiling.
+Dictionary mapping from each supported type of profiling other than
+:attr:`ProfileType.NONE` (which the :func:`profile_callable` function handles
+directly) to the module function performing this type of profiling.
 
 This private global is intended for use _only_ by the public
 :func:`profile_callable` function.
@@ -141,7 +141,8 @@ def die_if_maps_collide(*mappings: MappingType) -> None:
             # If this pair of dictionaries collides...
             if is_maps_collide(*mappings_pair):
                 # Set of all key-value pairs unique to a single mapping.
-                items_unique = mappings[0].items() ^ mappings[1].items()
+                items_unique = (
+                    mappings_pair[0].items() ^ mappings_pair[1].items())
 
                 # Set of all keys visited while iterating this set.
                 keys_visited = set()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright 2014-2025 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.lib.numpy.npcsv` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+import pytest
+
+# ....................{ TESTS                              }....................
+# Row counts exercising no rows, a partial first chunk, exactly one full chunk,
+# one full chunk followed by a partial chunk, and several full chunks followed
+# by a partial chunk of the rows formatted and written at a time.
+@pytest.mark.parametrize('rows_len', (0, 1, 1024, 1025, 2055))
+@pytest.mark.parametrize('is_formatted', (False, True))
+def test_write_csv(
+    betse_temp_dir: 'py._path.local.LocalPath',
+    rows_len: int,
+    is_formatted: bool,
+) -> None:
+    '''
+    Test that the :func:`betse.lib.numpy.npcsv.write_csv` function writes
+    files byte-for-byte identical to those written by the
+    :func:`numpy.savetxt` function that function previously wrapped.
+
+    Parameters
+    ----------
+    betse_temp_dir : py._path.local.LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    rows_len : int
+        Number of rows to be written.
+    is_formatted : bool
+        ``True`` only if passing explicit format strings for all columns.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.lib.numpy import npcsv
+
+    # Dictionary of all columns to be written, including column names
+    # containing both non-ASCII characters *AND* commas requiring quoting.
+    rng = np.random.RandomState(seed=0xBE75E)
+    column_name_to_values = {
+        'time [s]': np.linspace(0, 1, rows_len),
+        'Vmem [µV]': rng.standard_normal(rows_len)*1e3,
+        'Ca2+, cytosolic': list(rng.random_sample(rows_len)),
+    }
+
+    # Dictionary of all format strings formatting these columns if any.
+    column_name_to_format = {
+        'time [s]': '%.6e',
+        'Vmem [µV]': '%.6e',
+        'Ca2+, cytosolic': '%d',
+    } if is_formatted else None
+
+    # Absolute filenames of the files to be written and compared.
+    csv_filename = str(betse_temp_dir.join('write_csv.csv'))
+    txt_filename = str(betse_temp_dir.join('savetxt.csv'))
+
+    # Write these columns with this function.
+    npcsv.write_csv(
+        filename=csv_filename,
+        column_name_to_values=column_name_to_values,
+        column_name_to_format=column_name_to_format,
+    )
+
+    # Write these columns as this function previously did.
+    np.savetxt(
+        fname=txt_filename,
+        X=np.column_stack(tuple(column_name_to_values.values())),
+        fmt=(
+            tuple(column_name_to_format.values())
+            if is_formatted else '%.18e'),
+        header='time [s],Vmem [µV],"Ca2+, cytosolic"',
+        delimiter=',',
+        comments='',
+    )
+
+    # Assert these files to be byte-for-byte identical.
+    with open(csv_filename, 'rb') as csv_file, (
+         open(txt_filename, 'rb')) as txt_file:
+        assert csv_file.read() == txt_file.read()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright 2014-2025 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.visual.plot.plotutil` submodule.
+'''
+
+# ....................{ CLASSES                            }....................
+class CellsMock(object):
+    '''
+    Minimal cell cluster defining only the attributes required to average
+    membrane data onto cells.
+
+    Attributes
+    ----------
+    cell_i : ndarray
+        One-dimensional Numpy array of the indices of all cells.
+    mem_to_cells : ndarray
+        One-dimensional Numpy array mapping from the index of each membrane to
+        the index of the cell containing that membrane, in arbitrary order.
+    '''
+
+    def __init__(self) -> None:
+
+        # Defer heavyweight imports.
+        import numpy as np
+
+        # Map each of several cells to an arbitrary number of membranes,
+        # shuffling these membranes to avoid assuming membranes are sorted.
+        rng = np.random.RandomState(seed=0xCE115)
+        mems_per_cell = rng.randint(low=3, high=9, size=17)
+        self.cell_i = np.arange(len(mems_per_cell))
+        self.mem_to_cells = rng.permutation(
+            np.repeat(self.cell_i, mems_per_cell))
+
+# ....................{ PRIVATE ~ getters                  }....................
+def _cell_ave_loop(cells: CellsMock, vm_at_mem: 'ndarray') -> 'ndarray':
+    '''
+    Membrane data averaged onto cells by the per-cell loop formerly
+    implementing the :func:`betse.science.visual.plot.plotutil.cell_ave`
+    function, against which the current implementation is tested.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+
+    # Return these averages.
+    return np.array([
+        np.mean(vm_at_mem[cells.mem_to_cells == cell_index])
+        for cell_index in cells.cell_i
+    ])
+
+# ....................{ TESTS                              }....................
+def test_cell_ave_2d() -> None:
+    '''
+    Test that the :func:`betse.science.visual.plot.plotutil.cell_ave_2d`
+    function averages membrane data onto cells for all time steps identically
+    to averaging each time step with the per-cell loop that function replaced.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.visual.plot import plotutil
+
+    # Cell cluster and membrane data for each of several time steps.
+    cells = CellsMock()
+    rng = np.random.RandomState(seed=0xA7E)
+    vm_at_mem_time = [
+        rng.standard_normal(len(cells.mem_to_cells)) for _ in range(5)]
+
+    # Assert this function to average this data identically to the former
+    # loop, both initially *AND* after reassigning the membrane-to-cell mapping
+    # of this cluster (e.g., on rebuilding this cluster), invalidating the
+    # previously cached averaging matrix.
+    for _ in range(2):
+        assert np.allclose(
+            plotutil.cell_ave_2d(cells, vm_at_mem_time),
+            [_cell_ave_loop(cells, vm_at_mem) for vm_at_mem in vm_at_mem_time])
+        cells.mem_to_cells = cells.mem_to_cells[::-1].copy()
+
+
+def test_cell_ave() -> None:
+    '''
+    Test that both the :func:`betse.science.visual.plot.plotutil.cell_ave`
+    and :func:`betse.science.sim_toolbox.cell_ave` functions average membrane
+    data onto cells identically to the per-cell loop these functions replaced.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science import sim_toolbox
+    from betse.science.visual.plot import plotutil
+
+    # Cell cluster and membrane data for a single time step.
+    cells = CellsMock()
+    vm_at_mem = np.random.RandomState(seed=0xA7E).standard_normal(
+        len(cells.mem_to_cells))
+
+    # Membrane data averaged onto cells by the former loop.
+    v_cell_expected = _cell_ave_loop(cells, vm_at_mem)
+
+    # Assert these functions to average this data identically, including on
+    # repeated calls reusing the cached averaging matrix.
+    assert np.allclose(plotutil.cell_ave(cells, vm_at_mem), v_cell_expected)
+    assert np.allclose(plotutil.cell_ave(cells, vm_at_mem), v_cell_expected)
+    assert np.allclose(sim_toolbox.cell_ave(cells, vm_at_mem), v_cell_expected)
+
+
+def test_plot_index_labels() -> None:
+    '''
+    Test that the :func:`betse.science.visual.plot.plotutil.plot_index_labels`
+    function ignores the labels of more than the default maximum number of
+    points *unless* this maximum is explicitly disabled.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.visual.plot import plotutil
+    from matplotlib.figure import Figure
+
+    # Simulation configuration defining only the spatial upscaling factor.
+    class ParametersMock(object):
+        um = 1e6
+
+    # Points exceeding the default maximum number of labelled points.
+    points = np.random.RandomState(seed=0x1ABE1).random_sample(
+        (plotutil._INDEX_LABELS_MAX + 1, 2))*1e-4
+
+    # Assert these points to be labelled only when disabling this maximum.
+    ax = Figure().add_subplot()
+    plotutil.plot_index_labels(ax, points, ParametersMock())
+    assert not ax.collections
+    plotutil.plot_index_labels(ax, points, ParametersMock(), max_labels=None)
+    assert len(ax.collections) == 1
+    assert len(ax.collections[0].get_paths()) == len(points)
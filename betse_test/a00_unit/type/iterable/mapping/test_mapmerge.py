@@ -121,3 +121,57 @@ def test_merge_maps() -> None:
         'cunning':   'or drug that the cunning of man devises,',
         'sleep':     'can keep me from the chasm of sleep.',
     }
+
+
+def test_merge_maps_collision() -> None:
+    '''
+    Unit test the :func:`betse.util.type.iterable.mapping.mapmerge.merge_maps`
+    function under the ``RAISE_EXCEPTION`` merge policy when passed three or
+    more dictionaries sharing one or more keys.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.exceptions import BetseMappingException
+    from betse.util.type.iterable.mapping import mapmerge
+    from betse.util.type.iterable.mapping.mapmerge import MergeCollisionPolicy
+
+    # Input dictionaries to be merged, such that:
+    #
+    # * The first and second share the key "fungi" with the same value.
+    # * The second and third share the key "yuggoth" with differing values.
+    fungi_from_yuggoth = {
+        'fungi':   'The place was dark and dusty and half-lost',
+        'tangles': 'in tangles of old alleys near the quays,',
+    }
+    the_book = {
+        'fungi':   'The place was dark and dusty and half-lost',
+        'reeking': 'reeking of strange things brought in from the seas,',
+        'yuggoth': 'and with a queer curl of fog that west winds tossed.',
+    }
+    pursuit = {
+        'yuggoth': 'I held the book beneath my coat, at pains',
+        'hide':    'to hide the thing from sight in such a place.',
+    }
+
+    # Test that merging dictionaries sharing only keys with the same values
+    # merges as expected, despite this merger discarding key-value pairs.
+    assert mapmerge.merge_maps(
+        mappings=(fungi_from_yuggoth, the_book),
+        collision_policy=MergeCollisionPolicy.RAISE_EXCEPTION,
+    ) == {
+        'fungi':   'The place was dark and dusty and half-lost',
+        'tangles': 'in tangles of old alleys near the quays,',
+        'reeking': 'reeking of strange things brought in from the seas,',
+        'yuggoth': 'and with a queer curl of fog that west winds tossed.',
+    }
+
+    # Test that merging dictionaries in which only a pair of dictionaries
+    # other than the first pair key-collides raises the expected exception
+    # reporting the colliding key.
+    with pytest.raises(BetseMappingException) as exception_info:
+        mapmerge.merge_maps(
+            mappings=(fungi_from_yuggoth, the_book, pursuit),
+            collision_policy=MergeCollisionPolicy.RAISE_EXCEPTION,
+        )
+    assert '"yuggoth"' in str(exception_info.value)
+    assert '"fungi"' not in str(exception_info.value)
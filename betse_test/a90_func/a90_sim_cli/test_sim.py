@@ -99,6 +99,59 @@ def test_cli_sim_default(betse_cli_sim_default: 'CLISimTester') -> None:
     betse_cli_sim_default.run_subcommands_sim()
 
 
+def test_cli_sim_plot_multipage(betse_cli_sim: 'CLISimTester') -> None:
+    '''
+    Functional test saving all post-initialization plots exported by each plot
+    pipeline as the pages of a single multipage PDF file rather than as one
+    image file per plot.
+
+    Parameters
+    ----------
+    betse_cli_sim : CLISimTester
+        Object running BETSE CLI simulation subcommands.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.util.path import dirs, files, pathnames
+
+    # Simulation configuration specific to this test.
+    p = betse_cli_sim.sim_state.p
+
+    # Enable the saving of visuals as multipage PDF files.
+    betse_cli_sim.sim_state.config.enable_visuals_save()
+    p.plot.is_image_multipage = True
+
+    # Disable all single-cell plots, preventing the corresponding pipeline
+    # from exporting any plots and hence from creating an empty PDF file.
+    for plot_cell_conf in p.plot.plots_cell_after_sim:
+        plot_cell_conf.is_enabled = False
+
+    # Test the minimum number of subcommands exporting post-initialization
+    # plots with this configuration.
+    betse_cli_sim.run_subcommands(('seed',), ('init',), ('plot', 'init'),)
+
+    # Absolute dirname of the directory containing these plots, relative to
+    # the directory containing the test-specific configuration file.
+    export_dirname = pathnames.join(
+        betse_cli_sim.sim_state.conf_dirname, p.init_export_dirname_relative)
+
+    # Basenames of all plot files exported by these subcommands.
+    plot_basenames = [
+        plot_basename
+        for plot_basename in dirs.iter_basenames(export_dirname)
+        if plot_basename.startswith('fig_')
+    ]
+
+    # Assert these plots to have been saved only as non-empty PDF files *AND*
+    # the pipeline exporting no plots to have saved no such file.
+    assert plot_basenames
+    assert 'fig_single_cell_plots.pdf' not in plot_basenames
+    for plot_basename in plot_basenames:
+        assert pathnames.get_filetype_undotted_or_none(plot_basename) == 'pdf'
+        assert files.get_size(pathnames.join(
+            export_dirname, plot_basename)) > 0
+
+
 # Sadly, all existing higher-level parametrization decorators defined by the
 # "betse.util.test.pytest.mark.params" submodule fail to support embedded py.test
 # "skipif" and "xfail" markers. Consequently, we leverage the lower-level